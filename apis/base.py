@@ -1,10 +1,89 @@
 """Clase base abstracta para proveedores de API."""
 
+import time
 from abc import ABC, abstractmethod
 
 import requests
 
-from config import REQUEST_TIMEOUT, USER_AGENT
+from config import USER_AGENT, AIMD_SLOW_FACTOR, PROVIDER_BUDGETS
+from engine.concurrency import CONCURRENCY, CONGESTED, NEUTRAL, OK
+from engine.deadline import current_deadline
+from storage.ratelimit import get_limiter
+from .latency import LATENCY, timed_call
+from .retry import RETRY, classify
+from .transport import TRANSPORT
+
+
+def _outcome(key: str, resp: requests.Response, elapsed: float) -> str:
+    """Resultado de una respuesta para el control de concurrencia."""
+    if classify(response=resp) is not None:
+        return CONGESTED
+    typical = LATENCY.percentile(key, 50)
+    if resp.status_code >= 400 or (typical is not None and elapsed > typical * AIMD_SLOW_FACTOR):
+        return NEUTRAL
+    return OK
+
+
+def _limited(key: str, request) -> requests.Response:
+    """Ejecuta request() dentro del limite de concurrencia adaptativo de key."""
+    with CONCURRENCY.slot(key) as slot:
+        start = time.monotonic()
+        try:
+            resp = request()
+        except requests.exceptions.RequestException as e:
+            if classify(error=e) is not None:
+                slot.outcome = CONGESTED
+            raise
+        slot.outcome = _outcome(key, resp, time.monotonic() - start)
+        return resp
+
+
+def http_get(
+    key: str,
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+    default_timeout: tuple[float, float] | None = None,
+    **kwargs,
+) -> requests.Response:
+    """GET con timeouts (connect, read) por clave, reintentos y hedging opcional.
+
+    Args:
+        key: Proveedor o plataforma; determina timeouts y estadisticas.
+        default_timeout: (connect, read) si la clave no esta en PROVIDER_TIMEOUTS.
+
+    Si hay un deadline activo, el timeout se recorta al tiempo restante y se
+    lanza DeadlineExceeded cuando ya se agoto. Las claves con limite en
+    PROVIDER_RATE_LIMITS esperan turno en el limitador compartido. Los fallos
+    transitorios se reintentan segun RETRY (ver apis.retry) y las peticiones
+    en vuelo por clave se limitan con CONCURRENCY (AIMD). Todas las
+    peticiones comparten TRANSPORT (conexiones abiertas, sin cookies; HTTP/2
+    si httpx esta instalado, ver apis.transport).
+
+    Las claves con cuota (PROVIDER_BUDGETS) reservan una sola llamada por
+    consulta, asi que no usan hedging y solo reintentan cuando la peticion
+    no llego al proveedor (ver RetryPolicy.call). Por eso, si se lanza
+    DeadlineExceeded, la peticion no se envio y la llamada puede devolverse.
+    """
+    metered = key in PROVIDER_BUDGETS
+    limiter = get_limiter()
+    acquire = (lambda: limiter.acquire(key)) if key in limiter.limits else None
+
+    def send() -> requests.Response:
+        # El timeout se recalcula en cada intento: el deadline sigue corriendo
+        timeout = LATENCY.timeout_for(key, default_timeout)
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = deadline.cap(timeout)
+        return timed_call(key, lambda: TRANSPORT.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            **kwargs,
+        ), acquire, lambda call: _limited(key, call), hedge=not metered)
+
+    return RETRY.call(key, send, metered=metered)
 
 
 class BaseAPI(ABC):
@@ -12,17 +91,22 @@ class BaseAPI(ABC):
 
     name: str = "BaseAPI"
 
-    def _get(self, url: str, params: dict | None = None, headers: dict | None = None) -> requests.Response:
-        """Realiza una peticion GET con configuracion comun."""
+    def _get(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Realiza una peticion GET con configuracion comun.
+
+        kwargs se pasan al transporte (p. ej. stream=True para decodificar
+        la respuesta de forma incremental con apis.decoding.json_items).
+        """
         default_headers = {"User-Agent": USER_AGENT}
         if headers:
             default_headers.update(headers)
-        return requests.get(
-            url,
-            params=params,
-            headers=default_headers,
-            timeout=REQUEST_TIMEOUT,
-        )
+        return http_get(self.name, url, params=params, headers=default_headers, **kwargs)
 
     @abstractmethod
     def check(self, query: str) -> dict:
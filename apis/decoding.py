@@ -0,0 +1,208 @@
+"""Decodificacion JSON de respuestas de proveedores.
+
+loads() usa orjson si esta instalado y json de la libreria estandar si no.
+json_items() extrae el array de resultados de una respuesta: las respuestas
+pequenas se decodifican de una vez; las que superan JSON_STREAM_THRESHOLD se
+recorren de forma incremental, produciendo cada elemento del array en cuanto
+llega sin construir antes el documento completo.
+"""
+
+import codecs
+import json
+
+from config import JSON_STREAM_THRESHOLD
+
+try:
+    import orjson
+except ImportError:  # dependencia opcional
+    orjson = None
+
+_CHUNK = 64 * 1024
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+_NUMBER_END = ",}]" + _WHITESPACE
+_decoder = json.JSONDecoder()
+
+
+def loads(data: bytes | str):
+    """json.loads con el backend mas rapido disponible."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(resp):
+    """Equivalente a resp.json() con el backend rapido."""
+    return loads(resp.content)
+
+
+def _select(data, paths: tuple[tuple[str, ...], ...]) -> list:
+    """Primer array encontrado siguiendo paths ("()" = documento raiz)."""
+    for path in paths:
+        node = data
+        for key in path:
+            node = node.get(key) if isinstance(node, dict) else None
+        if isinstance(node, list):
+            return node
+    return []
+
+
+def json_items(resp, paths: tuple[tuple[str, ...], ...]):
+    """Itera los elementos del array de resultados de resp.
+
+    Args:
+        resp: Respuesta de requests (idealmente pedida con stream=True).
+        paths: Rutas de claves candidatas hasta el array, en orden de
+            preferencia; () indica que el documento es el propio array.
+    """
+    chunks = resp.iter_content(_CHUNK)
+    head, size = [], 0
+    for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size > JSON_STREAM_THRESHOLD:
+            break
+    else:
+        yield from _select(loads(b"".join(head)), paths)
+        return
+    yield from _StreamScanner(_chain(head, chunks), paths).items()
+
+
+def _chain(head: list[bytes], rest):
+    yield from head
+    yield from rest
+
+
+class _StreamScanner:
+    """Recorre un documento JSON por trozos hasta el array buscado.
+
+    Solo se decodifican por completo los elementos del array objetivo
+    (con json.JSONDecoder.raw_decode); el resto del documento se salta
+    contando llaves y corchetes.
+    """
+
+    def __init__(self, chunks, paths: tuple[tuple[str, ...], ...]):
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self.paths = paths
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.found = False  # se detiene en el primer array objetivo
+
+    def _fill(self) -> bool:
+        """Lee otro trozo; False si ya no quedan datos."""
+        if self.eof:
+            return False
+        self.buf = self.buf[self.pos:]
+        self.pos = 0
+        try:
+            self.buf += self._text.decode(next(self._chunks))
+        except StopIteration:
+            self.buf += self._text.decode(b"", final=True)
+            self.eof = True
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("JSON incompleto")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"JSON invalido: se esperaba {char!r} en la posicion {self.pos}")
+        self.pos += 1
+
+    def _decode(self):
+        """Decodifica el valor completo que empieza en la posicion actual."""
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            if not self.eof and self.buf[self.pos] in _NUMBER_START and (
+                end == len(self.buf) or self.buf[end] not in _NUMBER_END
+            ):
+                # Un numero solo esta completo si le sigue un delimitador
+                # (o el fin del documento): "12" puede ser "12345.678"
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+    def _skip(self) -> None:
+        """Salta el valor actual sin construirlo."""
+        if self._peek() not in "{[":
+            self._decode()
+            return
+        depth, in_string, escaped = 0, False, False
+        while True:
+            if self.pos >= len(self.buf) and not self._fill():
+                raise ValueError("JSON incompleto")
+            char = self.buf[self.pos]
+            self.pos += 1
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "{[":
+                depth += 1
+            elif char in "}]":
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def items(self):
+        yield from self._value(())
+
+    def _value(self, path: tuple[str, ...]):
+        char = self._peek()
+        if char == "[" and path in self.paths:
+            yield from self._array()
+        elif char == "{" and any(p[:len(path)] == path and len(p) > len(path) for p in self.paths):
+            yield from self._object(path)
+        else:
+            self._skip()
+
+    def _object(self, path: tuple[str, ...]):
+        self._expect("{")
+        if self._peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self._decode()
+            self._expect(":")
+            yield from self._value(path + (key,))
+            if self.found:
+                return
+            if self._peek() == ",":
+                self.pos += 1
+                continue
+            self._expect("}")
+            return
+
+    def _array(self):
+        self.found = True
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self._decode()
+            if self._peek() == ",":
+                self.pos += 1
+                continue
+            self._expect("]")
+            return
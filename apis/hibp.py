@@ -5,6 +5,7 @@ import hashlib
 from models import PasswordResult
 from config import HIBP_PASSWORD_URL
 from .base import BaseAPI
+from .retry import track_attempts
 
 
 class HIBPPasswordsAPI(BaseAPI):
@@ -16,6 +17,7 @@ class HIBPPasswordsAPI(BaseAPI):
         """No aplica para email/username. Usar check_password."""
         return {"error": "HIBP Pwned Passwords solo soporta verificacion de passwords"}
 
+    @track_attempts
     def check_password(self, password: str) -> PasswordResult:
         """Verifica password usando k-anonymity con SHA-1.
 
@@ -30,15 +32,19 @@ class HIBPPasswordsAPI(BaseAPI):
 
             resp = self._get(f"{HIBP_PASSWORD_URL}/{prefix}")
 
-            if resp.status_code == 200:
-                for line in resp.text.splitlines():
-                    parts = line.split(":")
-                    if len(parts) == 2 and parts[0].strip() == suffix:
-                        result.hibp_count = int(parts[1].strip())
-                        result.is_compromised = True
-                        break
+            if resp.status_code != 200:
+                result.mark_missing([self.name])
+                return result
+
+            for line in resp.text.splitlines():
+                parts = line.split(":")
+                if len(parts) == 2 and parts[0].strip() == suffix:
+                    result.hibp_count = int(parts[1].strip())
+                    result.is_compromised = True
+                    break
 
         except Exception:
-            pass  # Password check es best-effort
+            # Sin respuesta valida no se puede afirmar que el password este limpio
+            result.mark_missing([self.name])
 
         return result
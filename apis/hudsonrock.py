@@ -2,7 +2,14 @@
 
 from models import BreachDetail, InfostealerDetail
 from config import HUDSONROCK_EMAIL_URL, HUDSONROCK_USERNAME_URL
+from engine.deadline import DeadlineExceeded
+from engine.singleflight import coalesced
 from .base import BaseAPI
+from .decoding import json_items
+from .retry import track_attempts
+
+
+_STEALER_PATHS = (("stealers",), ())
 
 
 class HudsonRockAPI(BaseAPI):
@@ -10,6 +17,8 @@ class HudsonRockAPI(BaseAPI):
 
     name = "Hudson Rock"
 
+    @coalesced
+    @track_attempts
     def check(self, query: str, query_type: str = "email") -> dict:
         """Verifica email o username en Hudson Rock OSINT.
 
@@ -26,33 +35,33 @@ class HudsonRockAPI(BaseAPI):
                 url = HUDSONROCK_USERNAME_URL
                 params = {"username": query}
 
-            resp = self._get(url, params=params)
-
-            if resp.status_code == 404:
-                return result
-
-            if resp.status_code == 200:
-                data = resp.json()
-
-                # Hudson Rock retorna stealers en diferentes campos
-                stealers = data.get("stealers", [])
-                if not stealers and isinstance(data, list):
-                    stealers = data
-
-                for s in stealers:
-                    detail = InfostealerDetail(
-                        computer_name=s.get("computer_name", ""),
-                        operating_system=s.get("operating_system", ""),
-                        malware_path=s.get("malware_path", ""),
-                        date_compromised=s.get("date_compromised", "Desconocida"),
-                        antiviruses=s.get("antiviruses", ""),
-                    )
-                    result["infostealers"].append(detail)
-            elif resp.status_code == 429:
-                result["error"] = "Hudson Rock: Limite de consultas alcanzado"
-            else:
-                result["error"] = f"Hudson Rock: HTTP {resp.status_code}"
+            resp = self._get(url, params=params, stream=True)
+            with resp:
+                if resp.status_code == 404:
+                    return result
+
+                if resp.status_code == 200:
+                    # Hudson Rock retorna stealers en diferentes campos; los
+                    # arrays largos se recorren sin decodificar todo el documento
+                    for s in json_items(resp, _STEALER_PATHS):
+                        if not isinstance(s, dict):
+                            continue
+                        detail = InfostealerDetail(
+                            computer_name=s.get("computer_name", ""),
+                            operating_system=s.get("operating_system", ""),
+                            malware_path=s.get("malware_path", ""),
+                            date_compromised=s.get("date_compromised", "Desconocida"),
+                            antiviruses=s.get("antiviruses", ""),
+                        )
+                        result["infostealers"].append(detail)
+                elif resp.status_code == 429:
+                    # Limite de velocidad (ya reintentado si habia Retry-After corto)
+                    result["error"] = "Hudson Rock: Limite de consultas alcanzado (intentar mas tarde)"
+                else:
+                    result["error"] = f"Hudson Rock: HTTP {resp.status_code}"
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             result["error"] = f"Hudson Rock: {e}"
 
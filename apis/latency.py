@@ -0,0 +1,168 @@
+"""Timeouts por proveedor, timeouts adaptativos y peticiones hedged."""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import requests
+
+import config
+from config import (
+    CONNECT_TIMEOUT, READ_TIMEOUT, PROVIDER_TIMEOUTS,
+    ADAPTIVE_PERCENTILE, ADAPTIVE_MULTIPLIER, ADAPTIVE_MIN_TIMEOUT,
+    LATENCY_MIN_SAMPLES, LATENCY_WINDOW, HEDGE_PERCENTILE, HEDGE_POOL_SIZE,
+)
+
+# Pool compartido por los dos intentos de las peticiones hedged
+_HEDGE_POOL = ThreadPoolExecutor(max_workers=HEDGE_POOL_SIZE, thread_name_prefix="hedge")
+
+
+class LatencyTracker:
+    """Guarda latencias recientes por clave (proveedor o plataforma)."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self.adaptive = config.ADAPTIVE_TIMEOUTS
+        self.hedge = config.HEDGE_REQUESTS
+        self._samples: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, adaptive: bool | None = None, hedge: bool | None = None) -> None:
+        """Activa o desactiva el modo adaptativo y los hedged requests."""
+        if adaptive is not None:
+            self.adaptive = adaptive
+        if hedge is not None:
+            self.hedge = hedge
+
+    def record(self, key: str, seconds: float) -> None:
+        """Registra la latencia de una peticion."""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, key: str, pct: float) -> float | None:
+        """Percentil de latencia observado, o None si hay pocas muestras."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < LATENCY_MIN_SAMPLES:
+            return None
+        idx = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[idx]
+
+    def timeout_for(self, key: str, default: tuple[float, float] | None = None) -> tuple[float, float]:
+        """Retorna (connect, read) para la clave.
+
+        En modo adaptativo el read timeout se calcula a partir del percentil
+        observado, sin superar nunca el timeout configurado.
+        """
+        connect, read = PROVIDER_TIMEOUTS.get(key, default or (CONNECT_TIMEOUT, READ_TIMEOUT))
+        if self.adaptive:
+            observed = self.percentile(key, ADAPTIVE_PERCENTILE)
+            if observed is not None:
+                read = min(read, max(ADAPTIVE_MIN_TIMEOUT, observed * ADAPTIVE_MULTIPLIER))
+        return connect, read
+
+    def hedge_delay(self, key: str) -> float | None:
+        """Tiempo tras el cual lanzar un segundo intento, o None si no aplica."""
+        if not self.hedge:
+            return None
+        return self.percentile(key, HEDGE_PERCENTILE)
+
+    def stats(self) -> dict[str, dict]:
+        """Resumen de latencias por clave (p50/p95/p99)."""
+        with self._lock:
+            keys = list(self._samples)
+        return {
+            key: {
+                "samples": len(self._samples[key]),
+                "p50": self.percentile(key, 50),
+                "p95": self.percentile(key, 95),
+                "p99": self.percentile(key, 99),
+            }
+            for key in keys
+        }
+
+
+LATENCY = LatencyTracker()
+
+
+def timed_call(key: str, fn, acquire=None, gate=None, hedge: bool = True):
+    """Ejecuta fn() registrando su latencia, y con hedging si esta activo.
+
+    Con hedging, el primer intento corre en _HEDGE_POOL; si no termina antes
+    del p95 observado se lanza un segundo intento identico y gana la primera
+    respuesta correcta de las dos. Ambos intentos llevan el contexto del
+    llamador (deadline incluido) y la respuesta que pierde se cierra para
+    devolver su conexion al pool. Solo debe usarse con peticiones
+    idempotentes (GET).
+
+    acquire(), si se indica, se llama antes de cada intento (tambien el
+    hedged) y su espera no cuenta como latencia. gate(call), si se indica,
+    envuelve cada intento (p. ej. para limitar la concurrencia); tampoco
+    cuenta lo que espere antes de ejecutar call(). Con hedge=False nunca se
+    lanza un segundo intento (p. ej. proveedores con cuota por llamada).
+    """
+    delay = LATENCY.hedge_delay(key) if hedge else None
+    if delay is None:
+        return _attempt(key, fn, acquire, gate)
+
+    primary = _submit(key, fn, acquire, gate)
+    futures = [primary]
+    try:
+        done, _ = wait(futures, timeout=delay)
+        if not done:
+            futures.append(_submit(key, fn, acquire, gate))
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    _discard(f for f in futures if f is not future)
+                    return future.result()
+    except BaseException:
+        _discard(futures)
+        raise
+    # Fallaron los dos: se propaga el error del primer intento
+    return primary.result()
+
+
+def _submit(key: str, fn, acquire, gate) -> Future:
+    """Lanza un intento en _HEDGE_POOL con una copia del contexto actual."""
+    context = contextvars.copy_context()
+    return _HEDGE_POOL.submit(context.run, _attempt, key, fn, acquire, gate)
+
+
+def _discard(futures) -> None:
+    """Cancela o cierra los intentos cuya respuesta no se va a usar."""
+    for future in futures:
+        future.cancel()
+        future.add_done_callback(_close_response)
+
+
+def _close_response(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _attempt(key: str, fn, acquire=None, gate=None):
+    if acquire is not None:
+        acquire()
+    if gate is not None:
+        return gate(lambda: _measured(key, fn))
+    return _measured(key, fn)
+
+
+def _measured(key: str, fn):
+    """Ejecuta fn() y registra su latencia (exitos y timeouts)."""
+    start = time.monotonic()
+    try:
+        result = fn()
+    except requests.exceptions.Timeout:
+        LATENCY.record(key, time.monotonic() - start)
+        raise
+    LATENCY.record(key, time.monotonic() - start)
+    return result
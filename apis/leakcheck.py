@@ -1,8 +1,12 @@
 """LeakCheck Public API - Verificacion de email y username."""
 
-from models import BreachDetail
+from models import BreachDetail, intern_breach
 from config import LEAKCHECK_PUBLIC_URL
+from engine.deadline import DeadlineExceeded
+from engine.singleflight import coalesced
 from .base import BaseAPI
+from .decoding import response_json
+from .retry import track_attempts
 
 
 class LeakCheckAPI(BaseAPI):
@@ -10,6 +14,8 @@ class LeakCheckAPI(BaseAPI):
 
     name = "LeakCheck"
 
+    @coalesced
+    @track_attempts
     def check(self, query: str, query_type: str = "email") -> dict:
         """Verifica email o username en LeakCheck.
 
@@ -29,7 +35,7 @@ class LeakCheckAPI(BaseAPI):
                 return result
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = response_json(resp)
 
                 if not data.get("success", False):
                     # Puede ser rate limit o sin resultados
@@ -49,12 +55,15 @@ class LeakCheckAPI(BaseAPI):
                         exposed_data=src.get("fields", []),
                         risk_level="medio",
                     )
-                    result["breaches"].append(breach)
+                    result["breaches"].append(intern_breach(breach))
             elif resp.status_code == 429:
+                # Limite de velocidad (ya reintentado si habia Retry-After corto)
                 result["error"] = "LeakCheck: Limite de consultas alcanzado (intentar mas tarde)"
             else:
                 result["error"] = f"LeakCheck: HTTP {resp.status_code}"
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             result["error"] = f"LeakCheck: {e}"
 
@@ -0,0 +1,211 @@
+"""Reintentos con backoff exponencial para fallos transitorios de los proveedores.
+
+Solo se reintentan peticiones idempotentes (GET) y solo ante fallos que
+suelen ser pasajeros: error de conexion, timeout de lectura, 5xx y 429 con
+Retry-After corto. Un presupuesto global limita los reintentos a una
+fraccion de las peticiones, para no multiplicar la carga cuando un
+proveedor esta caido de verdad.
+"""
+
+import contextvars
+import functools
+import random
+import threading
+import time
+from collections import Counter
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from config import (
+    RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY,
+    RETRY_BUDGET_RATIO, RETRY_BUDGET_BURST,
+)
+from engine.deadline import current_deadline
+from .transport import httpx
+
+# Tipos de fallo reintentables
+CONNECT = "connect"
+TIMEOUT = "timeout"
+SERVER = "5xx"
+THROTTLED = "429"
+
+# Intentos HTTP de la llamada de proveedor en curso (ver track_attempts)
+_attempts: contextvars.ContextVar[list | None] = contextvars.ContextVar("attempts", default=None)
+
+
+class RetryBudget:
+    """Reintentos disponibles: cada peticion aporta ratio, hasta un maximo de burst."""
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, burst: int = RETRY_BUDGET_BURST):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = float(burst)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def classify(response: requests.Response | None = None, error: Exception | None = None) -> str | None:
+    """Tipo de fallo transitorio, o None si no debe reintentarse."""
+    if error is not None:
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return CONNECT
+        if isinstance(error, requests.exceptions.Timeout):
+            return TIMEOUT
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError)):
+            return CONNECT
+        return None
+    if response.status_code == 429:
+        return THROTTLED
+    if response.status_code >= 500 and response.status_code != 501:
+        return SERVER
+    return None
+
+
+def unsent(error: Exception) -> bool:
+    """True si la peticion fallo antes de enviarse (no llego al proveedor).
+
+    Cubre el timeout de conexion y los fallos al abrir la conexion (DNS,
+    conexion rechazada o inalcanzable), tanto con requests como con httpx.
+    Un corte una vez enviada la peticion no cuenta: pudo procesarse.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    if httpx is not None and isinstance(error.__cause__, httpx.ConnectError):
+        return True
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)  # MaxRetryError de urllib3
+    return isinstance(reason, NewConnectionError)
+
+
+def _retry_after(response: requests.Response) -> float | None:
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+class RetryPolicy:
+    """Backoff exponencial con jitter completo dentro de un presupuesto."""
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        budget: RetryBudget | None = None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+        self.retries: Counter = Counter()  # (clave, tipo) -> reintentos
+        self._lock = threading.Lock()
+
+    def delay(self, attempt: int, kind: str, response: requests.Response | None = None) -> float | None:
+        """Espera antes del siguiente intento, o None si no conviene reintentar.
+
+        Un 429 solo se reintenta si el proveedor indica un Retry-After corto;
+        sin el suele significar cuota agotada.
+        """
+        if kind == THROTTLED:
+            after = _retry_after(response)
+            return after if after is not None and after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def call(self, key: str, send, metered: bool = False) -> requests.Response:
+        """Ejecuta send() reintentando los fallos transitorios.
+
+        Si se agotan los intentos se retorna la ultima respuesta (el
+        proveedor la trata como error HTTP) o se relanza la ultima excepcion.
+        Con metered (proveedor con cuota por llamada) solo se reintentan los
+        fallos previos al envio (ver unsent): la peticion no llego al
+        proveedor y no gasto cuota. Un 5xx, un 429, un timeout de lectura o
+        una conexion cortada tras enviar pueden haberla gastado.
+        """
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            counter = _attempts.get()
+            if counter is not None:
+                counter[0] += 1
+
+            response = error = None
+            try:
+                response = send()
+                kind = classify(response=response)
+            except requests.exceptions.RequestException as e:
+                error = e
+                kind = classify(error=e)
+            if metered and not (error is not None and unsent(error)):
+                kind = None
+            if kind is None:
+                if error is not None:
+                    raise error
+                return response
+
+            wait = self.delay(attempt, kind, response) if attempt < self.max_attempts else None
+            deadline = current_deadline()
+            if (
+                wait is None
+                or (deadline is not None and wait >= deadline.remaining())
+                or not self.budget.withdraw()
+            ):
+                if error is not None:
+                    raise error
+                return response
+            with self._lock:
+                self.retries[(key, kind)] += 1
+            if response is not None:
+                # Con stream=True la conexion no vuelve al pool hasta cerrar la respuesta
+                response.close()
+            time.sleep(wait)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Reintentos por clave y tipo de fallo."""
+        out: dict[str, dict[str, int]] = {}
+        with self._lock:
+            for (key, kind), count in self.retries.items():
+                out.setdefault(key, {})[kind] = count
+        return out
+
+
+RETRY = RetryPolicy()
+
+
+def track_attempts(method):
+    """Anade al resultado cuantos intentos HTTP hizo la consulta.
+
+    En un dict se guardan en "attempts" y, si la consulta termino en error
+    tras reintentar, el mensaje lo indica. Los resultados con atributo
+    attempts (PasswordResult) lo reciben ahi.
+    """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        counter = [0]
+        token = _attempts.set(counter)
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            _attempts.reset(token)
+        if isinstance(result, dict):
+            result["attempts"] = counter[0]
+            if result.get("error") and counter[0] > 1:
+                result["error"] = f"{result['error']} ({counter[0]} intentos)"
+        elif hasattr(result, "attempts"):
+            result.attempts = counter[0]
+        return result
+    return wrapper
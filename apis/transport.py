@@ -0,0 +1,163 @@
+"""Transporte HTTP compartido por proveedores y plataformas.
+
+Por defecto todo va por una requests.Session (HTTP/1.1, una peticion por
+conexion a la vez). Si httpx con soporte HTTP/2 esta instalado
+(pip install "httpx[http2]"), las peticiones concurrentes al mismo host se
+multiplexan sobre una sola conexion: menos sockets y handshakes con lotes
+grandes contra un mismo proveedor. HTTP_TRANSPORT elige el transporte:
+"auto" (HTTP/2 si esta disponible), "http2" o "requests".
+
+Ambos transportes devuelven respuestas con la interfaz de requests que usa
+el proyecto (status_code, headers, content, text, url, is_redirect,
+iter_content) y lanzan las excepciones de requests, asi que reintentos,
+timeouts y proveedores no cambian.
+"""
+
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import HTTP_TRANSPORT
+from .decoding import loads
+
+try:
+    import h2  # noqa: F401  (httpx solo negocia HTTP/2 si h2 esta instalado)
+    import httpx
+except ImportError:  # dependencia opcional
+    httpx = None
+
+Timeout = float | tuple[float, float] | None
+
+
+class RequestsTransport:
+    """Sesion de requests sin cookies, con pool de conexiones por host."""
+
+    name = "requests"
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        for prefix in ("https://", "http://"):
+            self.session.mount(prefix, HTTPAdapter(pool_connections=64, pool_maxsize=32))
+
+    def get(self, url: str, params=None, headers=None, timeout: Timeout = None, **kwargs) -> requests.Response:
+        return self.session.get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+
+    def head(self, url: str, headers=None, timeout: Timeout = None, allow_redirects: bool = False):
+        return self.session.head(url, headers=headers, timeout=timeout, allow_redirects=allow_redirects)
+
+
+class HTTP2Response:
+    """Respuesta de httpx con la interfaz de requests.Response usada aqui."""
+
+    def __init__(self, resp: "httpx.Response", streamed: bool):
+        self._resp = resp
+        self._streamed = streamed
+        self.status_code = resp.status_code
+        self.headers = resp.headers
+        self.url = str(resp.url)
+        self.is_redirect = resp.is_redirect
+
+    @property
+    def content(self) -> bytes:
+        with _translated():
+            return self._resp.read()
+
+    @property
+    def text(self) -> str:
+        with _translated():
+            self._resp.read()
+        return self._resp.text
+
+    def json(self):
+        return loads(self.content)
+
+    def iter_content(self, chunk_size: int = 1):
+        with _translated():
+            if self._streamed and not self._resp.is_stream_consumed:
+                yield from self._resp.iter_bytes(chunk_size)
+            else:
+                content = self._resp.content
+                for i in range(0, len(content), chunk_size):
+                    yield content[i:i + chunk_size]
+
+    def close(self) -> None:
+        self._resp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _translated:
+    """Convierte las excepciones de httpx en sus equivalentes de requests."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is None or not isinstance(exc, httpx.HTTPError):
+            return False
+        if isinstance(exc, httpx.ConnectTimeout):
+            raise requests.exceptions.ConnectTimeout(str(exc)) from exc
+        if isinstance(exc, httpx.TimeoutException):
+            raise requests.exceptions.ReadTimeout(str(exc)) from exc
+        if isinstance(exc, (httpx.RemoteProtocolError, httpx.ReadError)):
+            raise requests.exceptions.ChunkedEncodingError(str(exc)) from exc
+        if isinstance(exc, httpx.TransportError):
+            raise requests.exceptions.ConnectionError(str(exc)) from exc
+        raise requests.exceptions.RequestException(str(exc)) from exc
+
+
+def _timeout(timeout: Timeout) -> "httpx.Timeout":
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect, pool=connect)
+    return httpx.Timeout(timeout)
+
+
+class HTTP2Transport:
+    """Cliente httpx con HTTP/2: una conexion multiplexada por host."""
+
+    name = "http2"
+
+    def __init__(self):
+        self.client = httpx.Client(
+            http2=True,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+        )
+
+    def get(self, url: str, params=None, headers=None, timeout: Timeout = None, **kwargs) -> HTTP2Response:
+        stream = kwargs.pop("stream", False)
+        follow = kwargs.pop("allow_redirects", True)
+        request = self.client.build_request(
+            "GET", url, params=params, headers=headers, timeout=_timeout(timeout), **kwargs
+        )
+        with _translated():
+            resp = self.client.send(request, stream=stream, follow_redirects=follow)
+        return HTTP2Response(resp, streamed=stream)
+
+    def head(self, url: str, headers=None, timeout: Timeout = None, allow_redirects: bool = False):
+        with _translated():
+            resp = self.client.head(
+                url, headers=headers, timeout=_timeout(timeout), follow_redirects=allow_redirects
+            )
+        return HTTP2Response(resp, streamed=False)
+
+
+def make_transport(name: str = HTTP_TRANSPORT):
+    """Transporte segun HTTP_TRANSPORT ("auto", "http2" o "requests")."""
+    if name not in ("auto", "http2", "requests"):
+        raise ValueError(f"HTTP_TRANSPORT desconocido: {name!r}")
+    if name == "http2" and httpx is None:
+        raise ImportError('HTTP_TRANSPORT=http2 requiere: pip install "httpx[http2]"')
+    if name != "requests" and httpx is not None:
+        return HTTP2Transport()
+    return RequestsTransport()
+
+
+TRANSPORT = make_transport()
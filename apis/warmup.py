@@ -0,0 +1,115 @@
+"""Precalentamiento de DNS y conexiones hacia proveedores y plataformas.
+
+La primera peticion a cada host paga la resolucion DNS y el handshake
+TCP/TLS. warm_up() resuelve todos los hosts en paralelo (las respuestas
+quedan en un cache DNS del proceso con TTL) y, opcionalmente, abre una
+conexion por host que queda aparcada en el pool del transporte compartido,
+de modo que las primeras consultas reales arrancan en caliente.
+"""
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+
+import config
+from config import DNS_CACHE_TTL, USER_AGENT, WARMUP_CONNECTIONS, WARMUP_TIMEOUT
+from .transport import TRANSPORT
+
+_getaddrinfo = socket.getaddrinfo
+
+
+class DNSCache:
+    """Cache de socket.getaddrinfo con caducidad; los fallos no se guardan."""
+
+    def __init__(self, ttl: float = DNS_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: dict[tuple, tuple[float, list]] = {}
+        self._lock = threading.Lock()
+        self.installed = False
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        result = _getaddrinfo(host, port, family, type, proto, flags)
+        with self._lock:
+            self._entries[key] = (now + self.ttl, result)
+        return result
+
+    def install(self) -> None:
+        """Hace que todas las conexiones del proceso usen el cache."""
+        if self.ttl > 0 and not self.installed:
+            socket.getaddrinfo = self.getaddrinfo
+            self.installed = True
+
+
+DNS_CACHE = DNSCache()
+
+
+def provider_urls() -> list[str]:
+    """URLs de los proveedores definidas en config (*_URL)."""
+    return [
+        value for name, value in vars(config).items()
+        if name.endswith("_URL") and isinstance(value, str) and value.startswith("https://")
+    ]
+
+
+def _origins(urls: list[str]) -> dict[str, str]:
+    """host -> origen (esquema://host) sin repetir hosts."""
+    origins = {}
+    for url in urls:
+        parts = urlsplit(url)
+        if parts.hostname and "{" not in parts.netloc:
+            origins.setdefault(parts.hostname, f"{parts.scheme}://{parts.netloc}/")
+    return origins
+
+
+def _warm_host(host: str, origin: str, connect: bool) -> str | None:
+    """Resuelve host y, si connect, aparca una conexion; retorna el error o None."""
+    port = 443 if origin.startswith("https") else 80
+    try:
+        DNS_CACHE.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    except OSError as e:
+        return f"DNS: {e}"
+    if not connect:
+        return None
+    try:
+        # La respuesta no importa: solo se busca dejar la conexion en el pool
+        TRANSPORT.head(
+            origin, headers={"User-Agent": USER_AGENT}, timeout=WARMUP_TIMEOUT, allow_redirects=False
+        ).close()
+    except requests.exceptions.RequestException as e:
+        return f"conexion: {type(e).__name__}"
+    return None
+
+
+def warm_up(urls: list[str], connect: bool = WARMUP_CONNECTIONS, max_workers: int = 32) -> dict[str, str | None]:
+    """Precalienta los hosts de urls en paralelo.
+
+    Las URLs con el host parametrizado (p. ej. "https://{}.tumblr.com") se
+    omiten. Instala el cache DNS si no lo estaba.
+
+    Returns:
+        host -> error, o None si quedo caliente.
+    """
+    DNS_CACHE.install()
+    origins = _origins(urls)
+    if not origins:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(origins)), thread_name_prefix="warmup") as pool:
+        futures = {host: pool.submit(_warm_host, host, origin, connect) for host, origin in origins.items()}
+    return {host: future.result() for host, future in futures.items()}
+
+
+def warm_up_background(urls: list[str], connect: bool = WARMUP_CONNECTIONS) -> threading.Thread:
+    """warm_up() en un hilo daemon, para solaparlo con otra espera."""
+    thread = threading.Thread(target=warm_up, args=(urls, connect), name="warmup", daemon=True)
+    thread.start()
+    return thread
@@ -2,9 +2,17 @@
 
 import hashlib
 
-from models import BreachDetail, PasswordResult
+from models import BreachDetail, intern_breach, PasswordResult
 from config import XPOSEDORNOT_BREACH_URL, XPOSEDORNOT_PASSWORD_URL
+from engine.deadline import DeadlineExceeded
+from engine.singleflight import coalesced
 from .base import BaseAPI
+from .decoding import json_items, response_json
+from .retry import track_attempts
+
+
+# La respuesta de breach-analytics puede tener diferentes estructuras
+_BREACH_PATHS = (("ExposedBreaches", "breaches_details"), ("breaches_details",))
 
 
 class XposedOrNotAPI(BaseAPI):
@@ -12,56 +20,56 @@ class XposedOrNotAPI(BaseAPI):
 
     name = "XposedOrNot"
 
+    @coalesced
+    @track_attempts
     def check(self, email: str) -> dict:
         """Verifica un email en XposedOrNot breach-analytics."""
         result = {"breaches": [], "error": None}
         try:
-            resp = self._get(f"{XPOSEDORNOT_BREACH_URL}", params={"email": email})
+            resp = self._get(f"{XPOSEDORNOT_BREACH_URL}", params={"email": email}, stream=True)
+            with resp:
+                if resp.status_code == 404:
+                    return result  # No hay brechas
 
-            if resp.status_code == 404:
-                return result  # No hay brechas
+                if resp.status_code != 200:
+                    result["error"] = f"XposedOrNot: HTTP {resp.status_code}"
+                    return result
 
-            if resp.status_code != 200:
-                result["error"] = f"XposedOrNot: HTTP {resp.status_code}"
-                return result
-
-            data = resp.json()
-
-            # La respuesta puede tener diferentes estructuras
-            breaches_data = []
-            if "ExposedBreaches" in data:
-                exposed = data["ExposedBreaches"]
-                if "breaches_details" in exposed:
-                    breaches_data = exposed["breaches_details"]
-            elif "breaches_details" in data:
-                breaches_data = data["breaches_details"]
-
-            for b in breaches_data:
-                exposed_data = []
-                if "xposed_data" in b:
-                    exposed_data = [d.strip() for d in b["xposed_data"].split(",") if d.strip()]
-                elif "data" in b:
-                    exposed_data = [d.strip() for d in b["data"].split(",") if d.strip()]
-
-                risk = self._map_risk(b.get("xposed_records", 0))
-
-                breach = BreachDetail(
-                    source_api=self.name,
-                    breach_name=b.get("breach", b.get("domain", "Desconocida")),
-                    date=b.get("xposed_date", b.get("date", "Desconocida")),
-                    exposed_data=exposed_data,
-                    risk_level=risk,
-                    description=b.get("details", b.get("description", "")),
-                    industry=b.get("industry", ""),
-                    logo_url=b.get("logo", ""),
-                )
-                result["breaches"].append(breach)
+                self._parse_breaches(resp, result)
 
+        except DeadlineExceeded:
+            raise  # sin tiempo: se reporta como proveedor pendiente, no como error
         except Exception as e:
             result["error"] = f"XposedOrNot: {e}"
 
         return result
 
+    def _parse_breaches(self, resp, result: dict) -> None:
+        """Construye cada BreachDetail a medida que se decodifica la respuesta."""
+        for b in json_items(resp, _BREACH_PATHS):
+            if not isinstance(b, dict):
+                continue
+            exposed_data = []
+            if "xposed_data" in b:
+                exposed_data = [d.strip() for d in b["xposed_data"].split(",") if d.strip()]
+            elif "data" in b:
+                exposed_data = [d.strip() for d in b["data"].split(",") if d.strip()]
+
+            risk = self._map_risk(b.get("xposed_records", 0))
+
+            breach = BreachDetail(
+                source_api=self.name,
+                breach_name=b.get("breach", b.get("domain", "Desconocida")),
+                date=b.get("xposed_date", b.get("date", "Desconocida")),
+                exposed_data=exposed_data,
+                risk_level=risk,
+                description=b.get("details", b.get("description", "")),
+                industry=b.get("industry", ""),
+                logo_url=b.get("logo", ""),
+            )
+            result["breaches"].append(intern_breach(breach))
+
+    @track_attempts
     def check_password(self, password: str) -> PasswordResult:
         """Verifica password usando k-anonymity con SHA3-Keccak-512."""
         result = PasswordResult()
@@ -74,22 +82,26 @@ class XposedOrNotAPI(BaseAPI):
             if resp.status_code == 404:
                 return result
 
-            if resp.status_code == 200:
-                data = resp.json()
-                # Buscar el hash completo en la respuesta
-                hashes = data if isinstance(data, list) else data.get("SearchPassAnon", [])
-                for h in hashes:
-                    if isinstance(h, str) and sha3_hash.upper() in h.upper():
-                        result.xon_count = 1
-                        result.is_compromised = True
-                        break
-                    elif isinstance(h, dict) and h.get("anon", "").upper() == sha3_hash.upper():
-                        result.xon_count = 1
-                        result.is_compromised = True
-                        break
+            if resp.status_code != 200:
+                result.mark_missing([self.name])
+                return result
+
+            data = response_json(resp)
+            # Buscar el hash completo en la respuesta
+            hashes = data if isinstance(data, list) else data.get("SearchPassAnon", [])
+            for h in hashes:
+                if isinstance(h, str) and sha3_hash.upper() in h.upper():
+                    result.xon_count = 1
+                    result.is_compromised = True
+                    break
+                elif isinstance(h, dict) and h.get("anon", "").upper() == sha3_hash.upper():
+                    result.xon_count = 1
+                    result.is_compromised = True
+                    break
 
         except Exception:
-            pass  # Password check es best-effort
+            # Sin respuesta valida no se puede afirmar que el password este limpio
+            result.mark_missing([self.name])
 
         return result
 
@@ -0,0 +1,112 @@
+"""Catalogo canonico de brechas con indice de alias entre proveedores.
+
+Cada proveedor nombra las brechas a su manera ("Adobe", "adobe.com",
+"Collection #1", "Collection1"...). El catalogo resuelve cualquier nombre a
+un ID canonico mediante un indice precalculado, de modo que deduplicar y
+combinar reportes es una busqueda en un dict en lugar de comparar nombres
+por pares.
+"""
+
+import json
+import re
+import sys
+import threading
+from collections import OrderedDict
+
+from config import BREACH_CATALOG_FILE, CATALOG_CACHE_SIZE
+
+# ID canonico -> alias usados por los proveedores (nombres y dominios).
+# Los nombres que solo difieren en mayusculas, "www." o el TLD ya se unifican
+# al normalizar; aqui van las equivalencias que la normalizacion no cubre.
+KNOWN_BREACHES = {
+    "adobe": ["Adobe", "adobe.com", "Adobe Systems"],
+    "linkedin": ["LinkedIn", "linkedin.com"],
+    "dropbox": ["Dropbox", "dropbox.com"],
+    "myspace": ["MySpace", "myspace.com"],
+    "canva": ["Canva", "canva.com"],
+    "tumblr": ["Tumblr", "tumblr.com"],
+    "zynga": ["Zynga", "zynga.com", "Words With Friends"],
+    "twitter": ["Twitter", "twitter.com", "x.com"],
+    "nazapi": ["Naz.API", "NazAPI", "Naz API"],
+    "collection1": ["Collection #1", "Collection1", "Collection 1"],
+    "000webhost": ["000webhost", "000webhost.com"],
+}
+
+# Nombres que no identifican una brecha concreta: nunca se deduplican
+UNKNOWN_NAMES = {"", "desconocida", "unknown", "n/a"}
+
+_TLD_RE = re.compile(r"\.(com|net|org|io|co|me|tv|fm|info|biz|us|uk|de|ru|fr|es|mx|br|it|pl|cn|jp)(\.[a-z]{2})?$")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+
+def normalize_name(name: str) -> str:
+    """Clave de indice: minusculas, sin www./TLD ni signos."""
+    key = str(name).strip().lower()
+    if key.startswith("www."):
+        key = key[4:]
+    key = _TLD_RE.sub("", key)
+    return _NON_ALNUM_RE.sub("", key)
+
+
+class BreachCatalog:
+    """Resuelve nombres de brecha de cualquier proveedor a un ID canonico.
+
+    Los nombres ya resueltos se guardan en un LRU de cache_size entradas: los
+    proveedores devuelven nombres libres, asi que el conjunto no esta acotado.
+    """
+
+    def __init__(self, entries: dict[str, list[str]] | None = None, cache_size: int = CATALOG_CACHE_SIZE):
+        self._index: dict[str, str] = {}
+        self._resolved: OrderedDict[str, str] = OrderedDict()
+        self._resolved_lock = threading.Lock()
+        self.cache_size = cache_size
+        for canonical_id, aliases in (entries or {}).items():
+            self.add_aliases(canonical_id, aliases)
+
+    def add_aliases(self, canonical_id: str, aliases: list[str]) -> None:
+        """Registra alias para un ID canonico."""
+        canonical_id = sys.intern(canonical_id)
+        for alias in [canonical_id, *aliases]:
+            key = normalize_name(alias)
+            if key:
+                self._index[key] = canonical_id
+        with self._resolved_lock:
+            self._resolved.clear()
+
+    def resolve(self, name: str) -> str:
+        """ID canonico de una brecha, o "" si el nombre es desconocido.
+
+        Los nombres que no estan en el catalogo usan su forma normalizada
+        como ID, asi "Foo" y "foo.com" siguen coincidiendo.
+        """
+        with self._resolved_lock:
+            cached = self._resolved.get(name)
+            if cached is not None:
+                self._resolved.move_to_end(name)
+                return cached
+        if str(name).strip().lower() in UNKNOWN_NAMES:
+            canonical_id = ""
+        else:
+            key = normalize_name(name)
+            canonical_id = sys.intern(self._index.get(key, key))
+        with self._resolved_lock:
+            self._resolved[name] = canonical_id
+            if len(self._resolved) > self.cache_size:
+                self._resolved.popitem(last=False)
+        return canonical_id
+
+    def __len__(self) -> int:
+        return len(set(self._index.values()))
+
+
+def load_catalog(path: str = BREACH_CATALOG_FILE) -> BreachCatalog:
+    """Catalogo integrado mas, opcionalmente, un JSON {id: [alias, ...]}."""
+    catalog = BreachCatalog(KNOWN_BREACHES)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for canonical_id, aliases in json.load(f).items():
+                catalog.add_aliases(canonical_id, aliases)
+    return catalog
+
+
+CATALOG = load_catalog()
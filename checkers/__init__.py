@@ -6,8 +6,13 @@ from .phone_checker import PhoneChecker
 from .password_checker import PasswordChecker
 from .image_checker import ImageChecker
 from .profile_checker import ProfileChecker
+from .batch_checker import BatchChecker
+from .monitor import WatchlistMonitor
+from .queue_worker import QueueWorker
+from .screening import ScreeningChecker
 
 __all__ = [
     "EmailChecker", "UsernameChecker", "PhoneChecker",
-    "PasswordChecker", "ImageChecker", "ProfileChecker",
+    "PasswordChecker", "ImageChecker", "ProfileChecker", "BatchChecker",
+    "WatchlistMonitor", "QueueWorker", "ScreeningChecker",
 ]
@@ -1,9 +1,16 @@
 """BreachDirectory API (RapidAPI) - Verificacion de telefono (opcional)."""
 
-import requests
+from models import BreachDetail, intern_breach
+from config import BREACHDIRECTORY_API_KEY, BREACHDIRECTORY_URL
+from apis.base import http_get
+from apis.decoding import response_json
+from apis.retry import track_attempts, unsent
+from engine.deadline import DeadlineExceeded
+from engine.singleflight import coalesced
+from storage.quota import get_ledger, quota_error
 
-from models import BreachDetail
-from config import BREACHDIRECTORY_API_KEY, REQUEST_TIMEOUT
+# Llamadas del plan que quedan segun RapidAPI; un 429 sin cuota lo trae a 0
+_QUOTA_REMAINING_HEADER = "X-RateLimit-Requests-Remaining"
 
 
 class BreachDirectoryAPI:
@@ -11,22 +18,29 @@ class BreachDirectoryAPI:
 
     name = "BreachDirectory"
 
+    @coalesced
+    @track_attempts
     def check(self, phone: str) -> dict:
         """Verifica un telefono en BreachDirectory."""
         result = {"breaches": [], "error": None}
+        quota_err = quota_error(self.name, phone)
+        if quota_err:
+            result["error"] = quota_err
+            return result
+
         try:
-            resp = requests.get(
-                "https://breachdirectory.p.rapidapi.com/",
+            resp = http_get(
+                self.name,
+                BREACHDIRECTORY_URL,
                 params={"func": "auto", "term": phone},
                 headers={
                     "X-RapidAPI-Key": BREACHDIRECTORY_API_KEY,
                     "X-RapidAPI-Host": "breachdirectory.p.rapidapi.com",
                 },
-                timeout=REQUEST_TIMEOUT,
             )
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = response_json(resp)
                 if data.get("success") and data.get("result"):
                     for entry in data["result"]:
                         sources = entry.get("sources", [])
@@ -38,13 +52,24 @@ class BreachDirectoryAPI:
                                 exposed_data=["telefono"],
                                 risk_level="alto",
                             )
-                            result["breaches"].append(breach)
-            elif resp.status_code == 429:
+                            result["breaches"].append(intern_breach(breach))
+            elif resp.status_code == 429 and resp.headers.get(_QUOTA_REMAINING_HEADER) == "0":
+                # RapidAPI indica que no queda cuota del plan
+                get_ledger().exhaust(self.name)
                 result["error"] = "BreachDirectory: Limite mensual alcanzado (10/mes en plan gratuito)"
+            elif resp.status_code == 429:
+                result["error"] = "BreachDirectory: Limite de velocidad alcanzado (intentar mas tarde)"
             else:
                 result["error"] = f"BreachDirectory: HTTP {resp.status_code}"
 
+        except DeadlineExceeded:
+            # Solo se lanza antes de enviar (esperando turno o al recortar el
+            # timeout): la llamada reservada no llego a gastarse
+            get_ledger().refund(self.name)
+            raise  # el reporte lo marca como pendiente (parcial)
         except Exception as e:
+            if unsent(e):
+                get_ledger().refund(self.name)
             result["error"] = f"BreachDirectory: {e}"
 
         return result
@@ -0,0 +1,309 @@
+"""Orquestador de verificacion por lotes (archivo de identidades)."""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Callable, NamedTuple
+
+from apis.latency import LATENCY
+from models import CheckReport, intern_breach
+from engine import Deadline, ProviderBudget
+from engine.scheduler import submit_background
+from storage.incremental import PROVIDERS_BY_TYPE
+from storage.journal import CheckpointJournal
+from .email_checker import EmailChecker
+from .username_checker import UsernameChecker
+from .phone_checker import PhoneChecker
+from .normalize import lookup_value, normalize_identity
+from .screening import ScreeningChecker
+
+QUERY_TYPES = ("email", "username", "phone")
+
+_PHONE_RE = re.compile(r"^\+?[\d\s().-]{7,}$")
+
+
+class Identity(NamedTuple):
+    """Identidad a verificar en modo lote."""
+    query_type: str
+    value: str
+    priority: int = 0
+
+
+def detect_type(identity: str) -> str:
+    """Deduce si una identidad es email, telefono o username."""
+    if "@" in identity:
+        return "email"
+    if _PHONE_RE.match(identity) and sum(c.isdigit() for c in identity) >= 7:
+        return "phone"
+    return "username"
+
+
+def read_identities(path: str) -> list[Identity]:
+    """Lee un archivo con una identidad por linea.
+
+    Las lineas vacias y las que empiezan por # se ignoran. El tipo se deduce
+    automaticamente o se indica con un prefijo: email:, username: o phone:.
+    Una prioridad opcional va al final tras una barra: "+34612345678 | 5".
+
+    Returns:
+        Lista de identidades en el orden del archivo.
+    """
+    items = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            priority = 0
+            value, sep, prio = line.rpartition("|")
+            if sep and prio.strip().lstrip("-").isdigit():
+                line, priority = value.strip(), int(prio)
+            prefix, sep, rest = line.partition(":")
+            if sep and prefix.lower() in QUERY_TYPES:
+                items.append(Identity(prefix.lower(), rest.strip(), priority))
+            else:
+                items.append(Identity(detect_type(line), line, priority))
+    return items
+
+
+def _dedupe_key(item: Identity) -> tuple[str, str]:
+    return item.query_type, normalize_identity(item.query_type, item.value)
+
+
+class BatchChecker:
+    """Verifica muchas identidades en paralelo reutilizando los proveedores."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        deadline_seconds: float = 0,
+        budget: ProviderBudget | None = None,
+        processes: int = 1,
+        journal: CheckpointJournal | None = None,
+        fast: bool = False,
+    ):
+        self.workers = workers
+        self.deadline_seconds = deadline_seconds
+        self.budget = budget
+        self.processes = max(1, processes)
+        self.journal = journal
+        self.fast = fast
+        self.screening = ScreeningChecker() if fast else None
+        self.collapsed = 0  # filas resueltas con la consulta de una variante equivalente
+        self.checkers = {
+            "email": EmailChecker(),
+            "username": UsernameChecker(),
+            "phone": PhoneChecker(),
+        }
+
+    def check_one(self, query_type: str, identity: str) -> CheckReport:
+        """Verifica una identidad con su propio deadline.
+
+        Con journal, los proveedores ya registrados para la identidad no se
+        consultan y cada resultado nuevo sin error se anade al journal. En
+        modo rapido se usa ScreeningChecker (corte temprano).
+        """
+        deadline = Deadline(self.deadline_seconds) if self.deadline_seconds > 0 else None
+        kwargs = {}
+        if self.journal is not None:
+            journal = self.journal
+            kwargs["replay"] = journal.completed(query_type, identity)
+            kwargs["on_result"] = lambda provider, result: journal.record(query_type, identity, provider, result)
+        if self.screening is not None:
+            return self.screening.check(query_type, identity, deadline=deadline, **kwargs)
+        return self.checkers[query_type].check(identity, deadline=deadline, **kwargs)
+
+    def _pending_providers(self, item: Identity) -> list[str]:
+        """Proveedores de la identidad que aun no estan en el journal."""
+        providers = PROVIDERS_BY_TYPE.get(item.query_type, ())
+        if self.journal is None:
+            return list(providers)
+        done = self.journal.completed(item.query_type, item.value)
+        return [p for p in providers if p not in done]
+
+    def plan(self, items: list[Identity]) -> tuple[list[int], dict[int, int], dict[int, list[str]]]:
+        """Reparte la cuota restante de los proveedores con limite.
+
+        Las identidades se ordenan por prioridad y, a igual prioridad, por la
+        consultada hace mas tiempo. Una identidad se pospone solo si todos sus
+        proveedores pendientes tienen limite y estan agotados; los duplicados
+        y las unidades ya registradas en el journal no gastan cuota.
+
+        Returns:
+            (indices a consultar en orden, {duplicado: indice original},
+             {pospuesto: proveedores agotados})
+        """
+        budget = self.budget or ProviderBudget()
+        remaining = budget.snapshot()
+
+        def sort_key(idx: int):
+            item = items[idx]
+            last = budget.last_checked(PROVIDERS_BY_TYPE.get(item.query_type, ()), item.value)
+            return (-item.priority, last or 0.0, idx)
+
+        run, duplicates, deferred = [], {}, {}
+        leaders: dict[tuple[str, str], int] = {}
+        for idx in sorted(range(len(items)), key=sort_key):
+            item = items[idx]
+            key = _dedupe_key(item)
+            if key in leaders:
+                duplicates[idx] = leaders[key]
+                continue
+            providers = self._pending_providers(item)
+            exhausted = budget.blocked(providers, remaining)
+            if exhausted:
+                deferred[idx] = exhausted
+                continue
+            for p in providers:
+                if p in remaining:
+                    remaining[p] -= 1
+            leaders[key] = idx
+            run.append(idx)
+        return run, duplicates, deferred
+
+    def check(
+        self,
+        items: list[Identity],
+        on_report: Callable[[CheckReport], None] | None = None,
+    ) -> list[CheckReport]:
+        """Verifica todas las identidades.
+
+        Las variantes equivalentes (mayusculas, +tags, puntos de Gmail,
+        telefonos con o sin prefijo; ver checkers.normalize) se consultan una
+        sola vez. La forma canonica solo agrupa: se consulta el valor
+        original de la fila que va primero en el plan (recortado y en
+        minusculas) y
+        el reporte se reparte entre todas sus filas.
+
+        Args:
+            items: Identidades a verificar.
+            on_report: Se invoca con cada reporte en cuanto esta listo.
+
+        Returns:
+            Reportes en el mismo orden que items.
+        """
+        # Cada fila recibe el reporte con su valor original
+        lookups = [item._replace(value=lookup_value(item.query_type, item.value)) for item in items]
+        run, duplicates, deferred = self.plan(lookups)
+        self.collapsed += len(duplicates)
+        reports: list[CheckReport | None] = [None] * len(items)
+
+        def emit(idx: int, report: CheckReport) -> None:
+            reports[idx] = report
+            if on_report:
+                on_report(report)
+
+        for idx, providers in deferred.items():
+            item = items[idx]
+            report = CheckReport(query=item.value, query_type=item.query_type)
+            report.errors.append(f"{', '.join(providers)}: Cuota agotada, consulta pospuesta al siguiente periodo")
+            report.mark_missing(providers)
+            emit(idx, report)
+
+        followers: dict[int, list[int]] = {}
+        for dup, leader in duplicates.items():
+            followers.setdefault(leader, []).append(dup)
+
+        for idx, report in self._run(lookups, run):
+            emit(idx, report if report.query == items[idx].value else _fan_out(report, items[idx].value))
+            for dup in followers.get(idx, ()):
+                emit(dup, _fan_out(report, items[dup].value))
+        return reports
+
+    def _run(self, items: list[Identity], run: list[int]):
+        """Ejecuta las identidades planificadas y produce (indice, reporte)."""
+        if self.processes > 1 and len(run) > self.workers:
+            yield from self._run_sharded(items, run)
+            return
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch") as executor:
+            futures = {
+                submit_background(executor, self.check_one, items[idx].query_type, items[idx].value): idx
+                for idx in run
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _run_sharded(self, items: list[Identity], run: list[int]):
+        """Reparte las identidades entre procesos; este proceso solo fusiona.
+
+        Cada proceso tiene su propia sesion HTTP y su propio pool de hilos
+        (workers por proceso). Los trozos son pequenos para que los reportes
+        lleguen de forma continua y el escritor (on_report) no espere a un
+        shard completo. La cuota se comparte a traves del registro SQLite.
+        """
+        size = max(1, self.workers * 2)
+        chunks = [
+            [(idx, items[idx].query_type, items[idx].value) for idx in run[i:i + size]]
+            for i in range(0, len(run), size)
+        ]
+        journal = self.journal
+        if journal is not None:
+            journal.sync()
+        with ProcessPoolExecutor(
+            max_workers=min(self.processes, len(chunks)),
+            initializer=_init_worker,
+            initargs=(
+                self.workers, self.deadline_seconds, LATENCY.adaptive, LATENCY.hedge,
+                (journal.job_id, os.path.dirname(journal.path)) if journal else None,
+                self.fast,
+            ),
+        ) as executor:
+            futures = [executor.submit(_check_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for idx, report in future.result():
+                    report.breaches = [intern_breach(b) for b in report.breaches]
+                    yield idx, report
+
+
+# Verificador propio de cada proceso del pool (ver BatchChecker._run_sharded)
+_WORKER: BatchChecker | None = None
+
+
+def _init_worker(
+    workers: int,
+    deadline_seconds: float,
+    adaptive: bool,
+    hedge: bool,
+    job: tuple[str, str] | None,
+    fast: bool,
+) -> None:
+    global _WORKER
+    LATENCY.configure(adaptive=adaptive, hedge=hedge)
+    # Cada proceso abre su propio journal (journal-<pid>.jsonl) del mismo trabajo
+    journal = CheckpointJournal(*job) if job else None
+    _WORKER = BatchChecker(workers=workers, deadline_seconds=deadline_seconds, journal=journal, fast=fast)
+
+
+def _check_chunk(chunk: list[tuple[int, str, str]]) -> list[tuple[int, CheckReport]]:
+    """Verifica un trozo de identidades dentro de un proceso del pool."""
+    with ThreadPoolExecutor(max_workers=_WORKER.workers, thread_name_prefix="batch") as executor:
+        futures = {
+            submit_background(executor, _WORKER.check_one, query_type, value): idx
+            for idx, query_type, value in chunk
+        }
+        results = [(futures[f], f.result()) for f in as_completed(futures)]
+    if _WORKER.journal is not None:
+        _WORKER.journal.sync()
+    return results
+
+
+def default_processes() -> int:
+    """Numero de procesos por defecto: un proceso por nucleo disponible."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _fan_out(report: CheckReport, identity: str) -> CheckReport:
+    """Copia de un reporte para otra fila de entrada con la misma identidad."""
+    return replace(
+        report,
+        query=identity,
+        breaches=list(report.breaches),
+        infostealers=list(report.infostealers),
+        errors=list(report.errors),
+        missing_providers=list(report.missing_providers),
+        skipped_providers=list(report.skipped_providers),
+    )
@@ -1,9 +1,12 @@
 """Orquestador de verificacion de email."""
 
+from typing import Callable
+
 from rich.console import Console
 
 from models import CheckReport
 from apis import XposedOrNotAPI, LeakCheckAPI, HudsonRockAPI
+from engine import Deadline, run_providers, status
 
 console = Console()
 
@@ -16,34 +19,48 @@ class EmailChecker:
         self.leakcheck = LeakCheckAPI()
         self.hudson = HudsonRockAPI()
 
-    def check(self, email: str) -> CheckReport:
-        """Ejecuta verificacion completa de email."""
+    def check(
+        self,
+        email: str,
+        deadline: Deadline | None = None,
+        replay: dict[str, dict] | None = None,
+        on_result: Callable[[str, dict], None] | None = None,
+    ) -> CheckReport:
+        """Ejecuta verificacion completa de email.
+
+        Args:
+            email: Email a verificar.
+            deadline: Presupuesto de tiempo; las fuentes que no respondan a
+                tiempo se listan en report.missing_providers.
+            replay: Resultados ya conocidos por proveedor (no se consultan).
+            on_result: Se invoca con (proveedor, resultado) de cada consulta nueva sin error.
+        """
         report = CheckReport(query=email, query_type="email")
 
+        with status(console, "[bold blue]Consultando XposedOrNot, LeakCheck y Hudson Rock..."):
+            results, missing = run_providers({
+                self.xon.name: lambda: self.xon.check(email),
+                self.leakcheck.name: lambda: self.leakcheck.check(email, query_type="email"),
+                self.hudson.name: lambda: self.hudson.check(email, query_type="email"),
+            }, deadline, replay, on_result)
+        report.mark_missing(missing)
+
         # 1. XposedOrNot (primario)
-        with console.status("[bold blue]Consultando XposedOrNot..."):
-            xon_result = self.xon.check(email)
-            if xon_result.get("error"):
-                report.errors.append(xon_result["error"])
-            report.breaches.extend(xon_result.get("breaches", []))
-
-        # 2. LeakCheck
-        with console.status("[bold blue]Consultando LeakCheck..."):
-            lc_result = self.leakcheck.check(email, query_type="email")
-            if lc_result.get("error"):
-                report.errors.append(lc_result["error"])
-            # Evitar duplicados por nombre de brecha
-            existing_names = {b.breach_name.lower() for b in report.breaches}
-            for breach in lc_result.get("breaches", []):
-                if breach.breach_name.lower() not in existing_names:
-                    report.breaches.append(breach)
-                    existing_names.add(breach.breach_name.lower())
+        xon_result = results.get(self.xon.name, {})
+        if xon_result.get("error"):
+            report.errors.append(xon_result["error"])
+        report.add_breaches(xon_result.get("breaches", []))
+
+        # 2. LeakCheck (duplicados resueltos por ID canonico del catalogo)
+        lc_result = results.get(self.leakcheck.name, {})
+        if lc_result.get("error"):
+            report.errors.append(lc_result["error"])
+        report.add_breaches(lc_result.get("breaches", []))
 
         # 3. Hudson Rock (infostealers)
-        with console.status("[bold blue]Consultando Hudson Rock..."):
-            hr_result = self.hudson.check(email, query_type="email")
-            if hr_result.get("error"):
-                report.errors.append(hr_result["error"])
-            report.infostealers.extend(hr_result.get("infostealers", []))
+        hr_result = results.get(self.hudson.name, {})
+        if hr_result.get("error"):
+            report.errors.append(hr_result["error"])
+        report.add_infostealers(hr_result.get("infostealers", []))
 
         return report
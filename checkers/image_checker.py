@@ -12,6 +12,7 @@ from rich.table import Table
 from rich import box
 
 from config import REQUEST_TIMEOUT
+from engine import status
 
 console = Console()
 
@@ -127,7 +128,7 @@ class ImageChecker:
             "opened": False,
         }
 
-        with console.status(f"[bold blue]Subiendo {filename} (temporal, expira en 1h)..."):
+        with status(console, f"[bold blue]Subiendo {filename} (temporal, expira en 1h)..."):
             temp_url = _upload_temp(file_path)
 
         if not temp_url:
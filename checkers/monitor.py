@@ -0,0 +1,98 @@
+"""Monitoreo continuo de una lista de identidades (watchlist)."""
+
+import heapq
+import random
+import threading
+import time
+from typing import Callable
+
+from config import MONITOR_INTERVAL_HOURS, MONITOR_JITTER
+from engine import ProviderBudget
+from storage import IncrementalTracker, ReportDelta, ResultStore
+from storage.incremental import PROVIDERS_BY_TYPE
+from .batch_checker import BatchChecker, Identity
+
+
+class WatchlistMonitor:
+    """Re-verifica periodicamente una watchlist y avisa solo ante cambios.
+
+    Cada identidad tiene su proxima fecha de revision (intervalo con jitter).
+    Si todos sus proveedores tienen limite y la cuota del periodo agotada
+    (ver ProviderBudget) se pospone al siguiente periodo; lo mismo si el
+    lote la pospone por no caber en la cuota restante. Las
+    conexiones HTTP, la cache y las huellas se mantienen entre ciclos.
+    """
+
+    def __init__(
+        self,
+        items: list[Identity],
+        store: ResultStore,
+        interval_hours: float = MONITOR_INTERVAL_HOURS,
+        jitter: float = MONITOR_JITTER,
+        budget: ProviderBudget | None = None,
+        workers: int = 4,
+        deadline_seconds: float = 0,
+        on_alert: Callable[[ReportDelta], None] | None = None,
+    ):
+        self.items = items
+        self.store = store
+        self.interval = interval_hours * 3600
+        self.jitter = jitter
+        self.budget = budget or ProviderBudget()
+        self.checker = BatchChecker(workers=workers, deadline_seconds=deadline_seconds, budget=self.budget)
+        self.tracker = IncrementalTracker(store)
+        self.on_alert = on_alert
+        self.checks = 0
+        self.deferred = 0
+        # (proxima revision, indice en items)
+        self._queue = [(time.time(), idx) for idx in range(len(items))]
+        heapq.heapify(self._queue)
+
+    def _next_due(self) -> float:
+        spread = self.interval * self.jitter
+        return time.time() + self.interval + random.uniform(-spread, spread)
+
+    def run_cycle(self) -> float:
+        """Verifica las identidades vencidas con presupuesto disponible.
+
+        Returns:
+            Segundos hasta la proxima revision pendiente.
+        """
+        now = time.time()
+        due = []
+        while self._queue and self._queue[0][0] <= now:
+            _, idx = heapq.heappop(self._queue)
+            exhausted = self.budget.blocked(PROVIDERS_BY_TYPE.get(self.items[idx].query_type, ()))
+            if exhausted:
+                self.deferred += 1
+                heapq.heappush(self._queue, (self.budget.next_available(exhausted), idx))
+            else:
+                due.append(idx)
+
+        if due:
+            reports = self.checker.check([self.items[idx] for idx in due])
+            scan_id = self.store.start_scan("monitor")
+            for idx, report in zip(due, reports):
+                self.store.save_report(scan_id, report)
+                delta = self.tracker.compare(report)
+                if delta.changed and not delta.first_scan and self.on_alert:
+                    self.on_alert(delta)
+                # El lote pospone lo que no cabe en la cuota: no se revisa
+                # antes de que vuelva a haberla
+                ready = self.budget.next_available(report.missing_providers)
+                if ready > time.time():
+                    self.deferred += 1
+                heapq.heappush(self._queue, (max(ready, self._next_due()), idx))
+            self.store.finish_scan(scan_id)
+            self.checks += len(due)
+
+        if not self._queue:
+            return self.interval
+        return max(0.0, self._queue[0][0] - time.time())
+
+    def run(self, stop: threading.Event | None = None, max_sleep: float = 60.0) -> None:
+        """Bucle principal hasta que se active stop (o Ctrl+C)."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            wait = self.run_cycle()
+            stop.wait(min(wait, max_sleep))
@@ -0,0 +1,83 @@
+"""Normalizacion de identidades para agrupar variantes equivalentes.
+
+Las variantes de una misma identidad (mayusculas de un email, espacios,
+puntos y +tags de Gmail, telefonos con o sin prefijo) se reducen a una forma canonica que
+sirve de clave de agrupacion: se consulta una sola vez y el resultado se
+reparte entre todas las filas. La forma canonica no se envia a los
+proveedores; las bases de brechas indexan direcciones literales, asi que se
+consulta un valor original del grupo (ver lookup_value).
+"""
+
+import re
+
+from config import DEFAULT_COUNTRY_CODE
+
+# Dominios donde "usuario+etiqueta@" llega al mismo buzon que "usuario@"
+PLUS_ADDRESSING_DOMAINS = {
+    "gmail.com", "outlook.com", "hotmail.com", "live.com", "icloud.com",
+    "me.com", "protonmail.com", "proton.me", "fastmail.com",
+}
+# Dominios que ignoran los puntos en la parte local
+DOTLESS_DOMAINS = {"gmail.com"}
+DOMAIN_ALIASES = {"googlemail.com": "gmail.com"}
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_email(email: str) -> str:
+    """Forma canonica de un email: minusculas, sin +tag ni puntos de Gmail."""
+    email = email.strip().lower()
+    local, sep, domain = email.rpartition("@")
+    if not sep or not local:
+        return email
+    domain = DOMAIN_ALIASES.get(domain, domain)
+    if domain in PLUS_ADDRESSING_DOMAINS:
+        local = local.split("+", 1)[0] or local
+    if domain in DOTLESS_DOMAINS:
+        local = local.replace(".", "")
+    return f"{local}@{domain}"
+
+
+def normalize_phone(phone: str, country_code: str = DEFAULT_COUNTRY_CODE) -> str:
+    """Telefono en formato E.164 (+<codigo de pais><numero>).
+
+    Los numeros sin prefijo internacional ("+" o "00") reciben country_code
+    si esta configurado (quitando el 0 troncal); si no, se dejan solo con
+    sus digitos porque no se puede deducir el pais.
+    """
+    phone = phone.strip()
+    digits = _NON_DIGITS.sub("", phone)
+    if phone.startswith("+"):
+        return f"+{digits}"
+    if digits.startswith("00"):
+        return f"+{digits[2:]}"
+    if country_code:
+        return f"+{country_code}{digits.lstrip('0')}"
+    return digits
+
+
+def normalize_username(username: str) -> str:
+    """Username sin espacios alrededor; conserva mayusculas (pueden distinguir cuentas)."""
+    return username.strip()
+
+
+_NORMALIZERS = {
+    "email": normalize_email,
+    "phone": normalize_phone,
+    "username": normalize_username,
+}
+
+
+def normalize_identity(query_type: str, value: str) -> str:
+    """Forma canonica de value segun su tipo (email, phone o username)."""
+    normalizer = _NORMALIZERS.get(query_type)
+    return normalizer(value) if normalizer else value.strip()
+
+
+def lookup_value(query_type: str, value: str) -> str:
+    """Valor que se envia a los proveedores: el original recortado.
+
+    Solo los emails se pasan a minusculas; un username puede distinguirlas.
+    """
+    value = value.strip()
+    return value.lower() if query_type == "email" else value
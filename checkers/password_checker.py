@@ -4,6 +4,7 @@ from rich.console import Console
 
 from models import PasswordResult
 from apis import HIBPPasswordsAPI, XposedOrNotAPI
+from engine import Deadline, run_with_deadline, status
 
 console = Console()
 
@@ -15,19 +16,28 @@ class PasswordChecker:
         self.hibp = HIBPPasswordsAPI()
         self.xon = XposedOrNotAPI()
 
-    def check(self, password: str) -> PasswordResult:
+    def check(self, password: str, deadline: Deadline | None = None) -> PasswordResult:
         """Verifica password en ambas fuentes. Nunca muestra el password."""
         combined = PasswordResult()
 
+        with status(console, "[bold blue]Verificando password en HIBP y XposedOrNot..."):
+            results, missing = run_with_deadline({
+                self.hibp.name: lambda: self.hibp.check_password(password),
+                self.xon.name: lambda: self.xon.check_password(password),
+            }, deadline)
+
+        combined.mark_missing(missing)
+        combined.attempts = sum(result.attempts for result in results.values())
+
         # 1. HIBP Pwned Passwords
-        with console.status("[bold blue]Verificando password en HIBP..."):
-            hibp_result = self.hibp.check_password(password)
-            combined.hibp_count = hibp_result.hibp_count
+        if self.hibp.name in results:
+            combined.hibp_count = results[self.hibp.name].hibp_count
+            combined.mark_missing(results[self.hibp.name].missing_providers)
 
         # 2. XposedOrNot Passwords
-        with console.status("[bold blue]Verificando password en XposedOrNot..."):
-            xon_result = self.xon.check_password(password)
-            combined.xon_count = xon_result.xon_count
+        if self.xon.name in results:
+            combined.xon_count = results[self.xon.name].xon_count
+            combined.mark_missing(results[self.xon.name].missing_providers)
 
         combined.is_compromised = combined.hibp_count > 0 or combined.xon_count > 0
         return combined
@@ -1,9 +1,12 @@
 """Orquestador de verificacion de telefono."""
 
+from typing import Callable
+
 from rich.console import Console
 
 from models import CheckReport
 from config import BREACHDIRECTORY_API_KEY
+from engine import Deadline, run_providers, status
 from .base_phone import BreachDirectoryAPI
 
 console = Console()
@@ -12,7 +15,13 @@ console = Console()
 class PhoneChecker:
     """Verifica un numero de telefono en APIs disponibles."""
 
-    def check(self, phone: str) -> CheckReport:
+    def check(
+        self,
+        phone: str,
+        deadline: Deadline | None = None,
+        replay: dict[str, dict] | None = None,
+        on_result: Callable[[str, dict], None] | None = None,
+    ) -> CheckReport:
         """Ejecuta verificacion de telefono."""
         report = CheckReport(query=phone, query_type="phone")
 
@@ -24,11 +33,16 @@ class PhoneChecker:
             )
             return report
 
-        with console.status("[bold blue]Consultando BreachDirectory..."):
+        with status(console, "[bold blue]Consultando BreachDirectory..."):
             bd = BreachDirectoryAPI()
-            bd_result = bd.check(phone)
-            if bd_result.get("error"):
-                report.errors.append(bd_result["error"])
-            report.breaches.extend(bd_result.get("breaches", []))
+            results, missing = run_providers(
+                {bd.name: lambda: bd.check(phone)}, deadline, replay, on_result
+            )
+        report.mark_missing(missing)
+
+        bd_result = results.get(bd.name, {})
+        if bd_result.get("error"):
+            report.errors.append(bd_result["error"])
+        report.add_breaches(bd_result.get("breaches", []))
 
         return report
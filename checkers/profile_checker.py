@@ -1,14 +1,25 @@
 """Buscador de perfiles duplicados/falsos en multiples plataformas."""
 
+import threading
+from contextlib import nullcontext
+from functools import partial
+from typing import Callable
+
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
 
-from config import REQUEST_TIMEOUT, USER_AGENT
+from config import PROFILE_TIMEOUT, PROFILE_CONCURRENCY
+from apis.base import http_get
+from engine import CONCURRENCY, Deadline, DeadlineExceeded, run_with_deadline, status
+from engine.concurrency import CONGESTED, OK
+from storage.profile_cache import ProfileCache, get_profile_cache
+from .normalize import normalize_username
+from .soft404 import BASELINES, fingerprint, is_soft_404
 
 console = Console()
 
@@ -62,8 +73,23 @@ HEADERS = {
 }
 
 
-def _check_platform(platform_name: str, url: str, method: str) -> dict:
-    """Verifica si un username existe en una plataforma."""
+def _probe(platform_name: str, url: str) -> requests.Response:
+    return http_get(
+        platform_name,
+        url,
+        headers=HEADERS,
+        default_timeout=PROFILE_TIMEOUT,
+        allow_redirects=True,
+    )
+
+
+def _check_platform(platform_name: str, url_template: str, username: str, method: str) -> dict:
+    """Verifica si un username existe en una plataforma.
+
+    Un 200 solo cuenta como perfil si la respuesta no coincide con la huella
+    de un usuario inexistente en esa plataforma (ver checkers.soft404).
+    """
+    url = url_template.format(username)
     result = {
         "platform": platform_name,
         "url": url,
@@ -71,12 +97,7 @@ def _check_platform(platform_name: str, url: str, method: str) -> dict:
         "error": None,
     }
     try:
-        resp = requests.get(
-            url,
-            headers=HEADERS,
-            timeout=REQUEST_TIMEOUT,
-            allow_redirects=True,
-        )
+        resp = _probe(platform_name, url)
 
         if method == "status":
             result["found"] = resp.status_code == 200
@@ -86,6 +107,14 @@ def _check_platform(platform_name: str, url: str, method: str) -> dict:
         elif method == "redirect":
             result["found"] = not resp.is_redirect and resp.status_code == 200
 
+        if result["found"]:
+            baseline = BASELINES.get(
+                platform_name, url_template, lambda fake: _probe(platform_name, url_template.format(fake))
+            )
+            result["found"] = not is_soft_404(fingerprint(resp, username, url_template), baseline)
+
+    except DeadlineExceeded:
+        raise  # sin tiempo: la plataforma se reporta como pendiente
     except requests.exceptions.Timeout:
         result["error"] = "timeout"
     except requests.exceptions.ConnectionError:
@@ -96,40 +125,158 @@ def _check_platform(platform_name: str, url: str, method: str) -> dict:
     return result
 
 
+# Errores de _check_platform que indican saturacion (bajan la concurrencia)
+_CONGESTION_ERRORS = ("timeout", "conexion fallida")
+
+
+def _sweep_probe(platform_name: str, url_template: str, username: str, method: str) -> dict:
+    """_check_platform dentro del limite adaptativo del barrido completo."""
+    with CONCURRENCY.slot("profiles") as slot:
+        result = _check_platform(platform_name, url_template, username, method)
+        slot.outcome = CONGESTED if result["error"] in _CONGESTION_ERRORS else OK
+        return result
+
+
+class ProfileLiveView:
+    """Tabla en vivo de una busqueda de perfiles.
+
+    Cada plataforma se cuenta en cuanto responde y los perfiles encontrados
+    aparecen en la tabla al momento, sin esperar a la plataforma mas lenta.
+    Al cerrarse desaparece (transitoria) para dejar paso al resumen final
+    ordenado de print_results.
+    """
+
+    def __init__(self, username: str, total: int = len(PLATFORMS)):
+        self.username = username
+        self.total = total
+        self.checked = 0
+        self.errors = 0
+        self.found: list[dict] = []
+        self._lock = threading.Lock()
+        self._live = Live(self._render(), console=console, transient=True, refresh_per_second=8)
+
+    def add(self, result: dict) -> None:
+        """Anade el resultado de una plataforma (seguro entre hilos)."""
+        with self._lock:
+            self.checked += 1
+            if result["error"]:
+                self.errors += 1
+            elif result["found"]:
+                self.found.append(result)
+            self._live.update(self._render())
+
+    def _render(self) -> Group:
+        header = (
+            f"[bold blue]Buscando '{self.username}':[/bold blue] {self.checked}/{self.total} plataformas, "
+            f"[bright_red]{len(self.found)} perfiles[/bright_red]"
+            + (f", [yellow]{self.errors} errores[/yellow]" if self.errors else "")
+        )
+        if not self.found:
+            return Group(header)
+        table = Table(box=box.SIMPLE, show_header=False)
+        table.add_column("Plataforma", style="bold", max_width=15)
+        table.add_column("URL del Perfil", max_width=60)
+        for profile in self.found:
+            table.add_row(profile["platform"], profile["url"])
+        return Group(header, table)
+
+    def start(self) -> None:
+        self._live.start()
+
+    def stop(self) -> None:
+        self._live.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
 class ProfileChecker:
     """Busca un username en multiples plataformas para detectar perfiles."""
 
-    def check(self, username: str, max_workers: int = 10) -> dict:
+    def __init__(self, cache: ProfileCache | None = None, use_cache: bool = True):
+        self.cache = (cache or get_profile_cache()) if use_cache else None
+
+    def check(
+        self,
+        username: str,
+        max_workers: int | None = None,
+        deadline: Deadline | None = None,
+        refresh: bool = False,
+        on_result: Callable[[dict], None] | None = None,
+    ) -> dict:
         """Busca el username en todas las plataformas.
 
         Args:
             username: Nombre de usuario a buscar.
-            max_workers: Hilos concurrentes para las consultas.
+            max_workers: Hilos concurrentes para las consultas. Por defecto
+                la concurrencia es adaptativa (AIMD, ver engine.concurrency):
+                sube mientras las plataformas responden bien y baja ante
+                timeouts o errores de conexion.
+            deadline: Presupuesto de tiempo; las plataformas sin respuesta
+                se reportan como errores.
+            refresh: Ignora el cache y vuelve a consultar todas las
+                plataformas (los resultados nuevos si se guardan).
+            on_result: Se invoca con el resultado de cada plataforma en
+                cuanto responde (los del cache primero), para mostrarlos
+                de forma progresiva (ver ProfileLiveView). Sin on_result se
+                muestra un spinner hasta el final.
 
         Returns:
             Dict con perfiles encontrados, no encontrados, y errores.
         """
-        results = {"found": [], "not_found": [], "errors": [], "username": username}
-
-        tasks = []
-        for name, url_template, method in PLATFORMS:
-            url = url_template.format(username)
-            tasks.append((name, url, method))
-
-        with console.status(f"[bold blue]Buscando '{username}' en {len(tasks)} plataformas..."):
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {
-                    executor.submit(_check_platform, name, url, method): name
-                    for name, url, method in tasks
-                }
-                for future in as_completed(futures):
-                    result = future.result()
-                    if result["error"]:
-                        results["errors"].append(result)
-                    elif result["found"]:
-                        results["found"].append(result)
-                    else:
-                        results["not_found"].append(result)
+        results = {
+            "found": [], "not_found": [], "errors": [], "username": username,
+            "partial": False, "cached": 0,
+        }
+
+        key = normalize_username(username)
+        cached = self.cache.get_many(key) if self.cache and not refresh else {}
+        results["cached"] = len(cached)
+
+        tasks = [(name, template, method) for name, template, method in PLATFORMS if name not in cached]
+        if on_result:
+            for result in cached.values():
+                on_result(result)
+
+        progress = (
+            nullcontext() if on_result
+            else status(console, f"[bold blue]Buscando '{username}' en {len(tasks)} plataformas...")
+        )
+        with progress:
+            if max_workers is None:
+                CONCURRENCY.configure("profiles", *PROFILE_CONCURRENCY)
+            probe = _check_platform if max_workers else _sweep_probe
+            done, missing = run_with_deadline(
+                {
+                    name: partial(probe, name, template, username, method)
+                    for name, template, method in tasks
+                },
+                deadline,
+                max_workers=max_workers or min(len(tasks), PROFILE_CONCURRENCY[2]) or None,
+                on_result=(lambda _, result: on_result(result)) if on_result else None,
+            )
+        if self.cache:
+            self.cache.put_many(key, list(done.values()))
+
+        for result in [*cached.values(), *done.values()]:
+            if result["error"]:
+                results["errors"].append(result)
+            elif result["found"]:
+                results["found"].append(result)
+            else:
+                results["not_found"].append(result)
+
+        urls = {name: template.format(username) for name, template, _ in tasks}
+        for name in missing:
+            results["errors"].append({
+                "platform": name, "url": urls[name], "found": False,
+                "error": "sin respuesta antes del deadline",
+            })
+        results["partial"] = bool(missing)
 
         # Ordenar por nombre de plataforma
         results["found"].sort(key=lambda x: x["platform"])
@@ -144,6 +291,8 @@ class ProfileChecker:
         errors = results["errors"]
 
         # Panel de resumen
+        cached = results.get("cached", 0)
+        cache_note = f"[dim]{cached} plataformas desde cache[/dim]\n" if cached else ""
         total = len(PLATFORMS)
         found_count = len(found)
         error_count = len(errors)
@@ -162,7 +311,8 @@ class ProfileChecker:
             f"[bold]Username:[/bold] {username}\n"
             f"[bold]Plataformas verificadas:[/bold] {total}\n"
             f"[bold]Perfiles encontrados:[/bold] [{risk_color}]{found_count}[/{risk_color}]\n"
-            f"[bold]Errores de conexion:[/bold] {error_count}\n\n"
+            f"[bold]Errores de conexion:[/bold] {error_count}\n"
+            f"{cache_note}\n"
             f"[{risk_color}]{risk_text}[/{risk_color}]",
             title="[bold]Busqueda de Perfiles[/bold]",
             border_style=risk_color,
@@ -0,0 +1,118 @@
+"""Worker que consume identidades de una cola distribuida (ver storage.queue)."""
+
+import os
+import socket
+import threading
+import time
+from typing import Callable
+
+from config import QUEUE_MAX_ATTEMPTS, QUEUE_RETRY_SECONDS
+from models import CheckReport
+from reporting.json_report import report_to_dict
+from engine import ProviderBudget
+from storage.queue import Job, WorkQueue
+from .batch_checker import BatchChecker, Identity
+
+
+def default_worker_id() -> str:
+    """Identificador del worker: host y PID."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class QueueWorker:
+    """Reclama trabajos de la cola, los verifica y devuelve los reportes.
+
+    La cuota por proveedor se reparte a traves del ProviderBudget del
+    BatchChecker; apuntando QUOTA_LEDGER_DB a un archivo compartido todos los
+    workers gastan del mismo presupuesto global.
+
+    Solo se completan los trabajos con reporte completo. Los parciales
+    (pospuestos por cuota o con proveedores sin respuesta) vuelven a la cola
+    con una hora minima de reintento (ver retry_at).
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        batch: str = "default",
+        worker_id: str | None = None,
+        workers: int = 4,
+        deadline_seconds: float = 0,
+        lease_seconds: float = 300,
+        fast: bool = False,
+        retry_seconds: float = QUEUE_RETRY_SECONDS,
+        max_attempts: int = QUEUE_MAX_ATTEMPTS,
+    ):
+        self.queue = queue
+        self.batch = batch
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.retry_seconds = retry_seconds
+        self.max_attempts = max_attempts
+        self.checker = BatchChecker(workers=workers, deadline_seconds=deadline_seconds, fast=fast)
+        self.completed = 0
+        self.postponed = 0  # trabajos devueltos a la cola para reintentarlos
+
+    def retry_at(self, job: Job, report: CheckReport) -> float | None:
+        """Hora (epoch) a partir de la que reintentar job, o None para completarlo.
+
+        Si los proveedores que faltan no tienen cuota se espera al siguiente
+        periodo de facturacion (sin limite de intentos). Si simplemente no
+        respondieron se reintenta tras retry_seconds, hasta max_attempts.
+        """
+        if not report.partial:
+            return None
+        now = time.time()
+        ready = (self.checker.budget or ProviderBudget()).next_available(report.missing_providers)
+        if ready > now:
+            return ready
+        if job.attempts >= self.max_attempts:
+            return None
+        return now + self.retry_seconds
+
+    def run_once(self, on_report: Callable[[CheckReport], None] | None = None) -> int:
+        """Procesa un lote de trabajos; retorna cuantos se reclamaron."""
+        jobs = self.queue.claim(self.worker_id, self.checker.workers * 2, self.lease_seconds, self.batch)
+        if not jobs:
+            return 0
+        try:
+            reports = self.checker.check([Identity(j.query_type, j.identity, j.priority) for j in jobs])
+        except BaseException:
+            for job in jobs:
+                self.queue.release(job.id, self.worker_id)
+            raise
+        for job, report in zip(jobs, reports):
+            not_before = self.retry_at(job, report)
+            if not_before is not None:
+                self.queue.release(job.id, self.worker_id, not_before)
+                self.postponed += 1
+            elif self.queue.complete(job.id, self.worker_id, report_to_dict(report)):
+                self.completed += 1
+            if on_report:
+                on_report(report)
+        return len(jobs)
+
+    def run(
+        self,
+        stop: threading.Event | None = None,
+        follow: bool = False,
+        poll_seconds: float = 5,
+        on_report: Callable[[CheckReport], None] | None = None,
+    ) -> int:
+        """Consume la cola hasta vaciarla (o hasta stop si follow=True).
+
+        Sin follow, el worker termina cuando no quedan trabajos pendientes ni
+        reclamados por otros; si otro worker tiene trabajos en curso se espera
+        por si su lease vence y hay que reintentarlos.
+
+        Returns:
+            Trabajos completados por este worker.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if self.run_once(on_report):
+                continue
+            if not follow and self.queue.counts(self.batch)["leased"] == 0:
+                break
+            stop.wait(poll_seconds)
+        return self.completed
@@ -0,0 +1,135 @@
+"""Modo rapido: solo interesa saber si la identidad esta expuesta.
+
+Los proveedores se consultan en orden de utilidad esperada (tasa de aciertos
+observada frente a latencia y coste de cuota) y la verificacion se detiene
+en cuanto hay una respuesta decisiva: un infostealer (riesgo critico) o
+FAST_BREACH_THRESHOLD brechas. Los proveedores que quedan no se consultan.
+"""
+
+import threading
+from typing import Callable
+
+from rich.console import Console
+
+from models import CheckReport
+from apis import XposedOrNotAPI, LeakCheckAPI, HudsonRockAPI
+from apis.latency import LATENCY
+from config import (
+    PROVIDER_BUDGETS, FAST_BREACH_THRESHOLD, FAST_DEFAULT_LATENCY, FAST_QUOTA_PENALTY,
+)
+from engine import Deadline, run_until_decisive, status
+from .phone_checker import PhoneChecker
+
+console = Console()
+
+
+class ProviderStats:
+    """Tasa de aciertos por proveedor (consultas con brechas o infostealers)."""
+
+    def __init__(self):
+        self._hits: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._hits.setdefault(provider, [0, 0])
+            counts[0] += hit
+            counts[1] += 1
+
+    def hit_rate(self, provider: str) -> float:
+        """Tasa con suavizado de Laplace (0.5 sin datos)."""
+        with self._lock:
+            hits, total = self._hits.get(provider, (0, 0))
+        return (hits + 1) / (total + 2)
+
+
+STATS = ProviderStats()
+
+
+def provider_score(provider: str) -> float:
+    """Aciertos esperados por segundo de espera, penalizando la cuota."""
+    latency = LATENCY.percentile(provider, 50) or FAST_DEFAULT_LATENCY
+    cost = 1 + FAST_QUOTA_PENALTY if provider in PROVIDER_BUDGETS else 1
+    return STATS.hit_rate(provider) / (latency * cost)
+
+
+def _stagger(provider: str) -> float:
+    # Si el proveedor en curso tarda mas que su mediana se lanza el siguiente
+    return LATENCY.percentile(provider, 50) or FAST_DEFAULT_LATENCY
+
+
+def _is_exposed(results: dict[str, dict]) -> bool:
+    report = CheckReport(query="", query_type="")
+    for result in results.values():
+        if result.get("infostealers"):
+            return True
+        report.add_breaches(result.get("breaches", ()))
+    return report.total_breaches >= FAST_BREACH_THRESHOLD
+
+
+class ScreeningChecker:
+    """Verificacion con corte temprano para email y username."""
+
+    def __init__(self):
+        self.xon = XposedOrNotAPI()
+        self.leakcheck = LeakCheckAPI()
+        self.hudson = HudsonRockAPI()
+        self.phone = PhoneChecker()
+
+    def _calls(self, query_type: str, identity: str) -> list[tuple[str, Callable[[], dict]]]:
+        if query_type == "email":
+            return [
+                (self.xon.name, lambda: self.xon.check(identity)),
+                (self.leakcheck.name, lambda: self.leakcheck.check(identity, query_type="email")),
+                (self.hudson.name, lambda: self.hudson.check(identity, query_type="email")),
+            ]
+        return [
+            (self.hudson.name, lambda: self.hudson.check(identity, query_type="username")),
+            (self.leakcheck.name, lambda: self.leakcheck.check(identity, query_type="username")),
+        ]
+
+    def check(
+        self,
+        query_type: str,
+        identity: str,
+        deadline: Deadline | None = None,
+        replay: dict[str, dict] | None = None,
+        on_result: Callable[[str, dict], None] | None = None,
+    ) -> CheckReport:
+        """Verifica identity hasta tener una respuesta decisiva.
+
+        Los telefonos tienen un unico proveedor y se verifican como siempre.
+        """
+        if query_type == "phone":
+            return self.phone.check(identity, deadline=deadline, replay=replay, on_result=on_result)
+
+        replay = replay or {}
+        calls = [c for c in self._calls(query_type, identity) if c[0] not in replay]
+        calls.sort(key=lambda c: provider_score(c[0]), reverse=True)
+
+        if _is_exposed(replay):
+            results, missing, skipped = {}, [], [name for name, _ in calls]
+        else:
+            with status(console, f"[bold blue]Verificacion rapida de {identity}..."):
+                results, missing, skipped = run_until_decisive(
+                    calls,
+                    lambda partial: _is_exposed({**replay, **partial}),
+                    _stagger,
+                    deadline,
+                )
+
+        for name, result in results.items():
+            if not result.get("error"):
+                STATS.record(name, bool(result.get("breaches") or result.get("infostealers")))
+                if on_result:
+                    on_result(name, result)
+
+        report = CheckReport(query=identity, query_type=query_type)
+        report.mark_missing(missing)
+        report.skipped_providers = skipped
+        for result in {**replay, **results}.values():
+            if result.get("error"):
+                report.errors.append(result["error"])
+            report.add_breaches(result.get("breaches", []))
+            report.add_infostealers(result.get("infostealers", []))
+        return report
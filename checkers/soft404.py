@@ -0,0 +1,139 @@
+"""Calibracion de "soft 404" para la busqueda de perfiles.
+
+Instagram, TikTok o LinkedIn responden 200 para usuarios inexistentes (o
+muestran un muro de login), asi que el codigo de estado no basta. La
+primera vez que se necesita, cada plataforma se sondea con un username que
+seguro no existe y se guarda la huella de esa respuesta. Despues, una sonda
+real con 200 cuya huella coincide con la de referencia se clasifica como
+"no encontrado". La calibracion se paga una vez por ejecucion y se amortiza
+en todos los usernames del barrido.
+"""
+
+import hashlib
+import re
+import secrets
+import threading
+from typing import Callable, NamedTuple
+from urllib.parse import unquote, urlsplit, urlunsplit
+
+import requests
+
+BODY_PREFIX = 4096  # bytes del cuerpo que entran en la huella
+# Diferencia de tamano que aun se considera la misma pagina (tokens o fechas
+# que cambian entre peticiones); por encima hace falta el mismo prefijo
+LENGTH_TOLERANCE = 0.005
+
+
+class Fingerprint(NamedTuple):
+    """Huella compacta de una respuesta, sin el username sondeado."""
+    status: int
+    final_url: str
+    length: int
+    body_hash: str
+
+
+def _token(username: str) -> str:
+    # Apariciones completas: "com" no debe enmascarar el "com" de "instagram.com"
+    return rf"(?<![\w.-]){re.escape(username)}(?![\w.-])"
+
+
+def _mask_url(url: str, template: str, username: str) -> str:
+    """url con el username enmascarado solo donde lo pone template.
+
+    El host y los segmentos de ruta se comparan por posicion con template;
+    en la query (p. ej. ?next=/usuario/) se enmascaran solo apariciones
+    completas del username.
+    """
+    parts = urlsplit(url)
+    tmpl = urlsplit(template)
+    netloc = parts.netloc
+    if "{}" in tmpl.netloc and netloc.lower() == tmpl.netloc.format(username).lower():
+        netloc = tmpl.netloc
+    segments = parts.path.split("/")
+    for i, segment in enumerate(tmpl.path.split("/")):
+        if "{}" in segment and i < len(segments) and segments[i].lower() == segment.format(username).lower():
+            segments[i] = segment
+    query = re.sub(_token(username), "{}", unquote(parts.query), flags=re.IGNORECASE)
+    return urlunsplit((parts.scheme, netloc, "/".join(segments), query, ""))
+
+
+def fingerprint(resp: requests.Response, username: str, template: str) -> Fingerprint:
+    """Huella de resp con las apariciones de username enmascaradas.
+
+    Asi la respuesta de referencia (username aleatorio) y la de una sonda
+    real son comparables aunque ambas repitan el nombre en la URL o el HTML.
+    template es la URL de la plataforma con "{}" en el lugar del username.
+    """
+    # El tamano tambien se mide enmascarado: usernames de distinta longitud no lo cambian
+    content = re.sub(_token(username).encode(), b"{}", resp.content or b"", flags=re.IGNORECASE)
+    return Fingerprint(
+        status=resp.status_code,
+        final_url=_mask_url(resp.url or "", template, username),
+        length=len(content),
+        body_hash=hashlib.sha1(content[:BODY_PREFIX]).hexdigest(),
+    )
+
+
+def is_soft_404(probe: Fingerprint, baseline: Fingerprint | None) -> bool:
+    """True si la sonda parece la misma pagina que la del usuario inexistente.
+
+    Hace falta el mismo estado y la misma URL final (p. ej. la redireccion al
+    login), y ademas el mismo prefijo de cuerpo o un tamano practicamente
+    identico (LENGTH_TOLERANCE). Un tamano solo parecido no basta: un perfil
+    real puede pesar casi lo mismo que la pagina de "no existe".
+    """
+    if baseline is None:
+        return False
+    if probe.status != baseline.status or probe.final_url != baseline.final_url:
+        return False
+    if probe.body_hash == baseline.body_hash:
+        return True
+    return abs(probe.length - baseline.length) <= baseline.length * LENGTH_TOLERANCE
+
+
+def nonexistent_username() -> str:
+    """Username aleatorio que no deberia existir en ninguna plataforma."""
+    return "zq" + secrets.token_hex(7)
+
+
+class Baselines:
+    """Huellas de referencia por plataforma, calculadas una vez por proceso.
+
+    Si varias sondas necesitan la misma plataforma a la vez, solo una hace
+    la calibracion y las demas esperan su resultado. Un fallo de calibracion
+    tambien se recuerda (como None): la plataforma vuelve a clasificarse
+    solo por su metodo de deteccion.
+    """
+
+    def __init__(self):
+        self._baselines: dict[str, Fingerprint | None] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, platform: str, template: str, probe: Callable[[str], requests.Response]
+    ) -> Fingerprint | None:
+        """Huella de referencia de platform; probe(username) hace la peticion."""
+        with self._lock:
+            if platform in self._baselines:
+                return self._baselines[platform]
+            lock = self._locks.setdefault(platform, threading.Lock())
+        with lock:
+            with self._lock:
+                if platform in self._baselines:
+                    return self._baselines[platform]
+            username = nonexistent_username()
+            try:
+                baseline = fingerprint(probe(username), username, template)
+            except requests.exceptions.RequestException:
+                baseline = None
+            with self._lock:
+                self._baselines[platform] = baseline
+            return baseline
+
+    def clear(self) -> None:
+        with self._lock:
+            self._baselines.clear()
+
+
+BASELINES = Baselines()
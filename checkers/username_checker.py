@@ -1,9 +1,12 @@
 """Orquestador de verificacion de username."""
 
+from typing import Callable
+
 from rich.console import Console
 
 from models import CheckReport
 from apis import LeakCheckAPI, HudsonRockAPI
+from engine import Deadline, run_providers, status
 
 console = Console()
 
@@ -15,22 +18,33 @@ class UsernameChecker:
         self.leakcheck = LeakCheckAPI()
         self.hudson = HudsonRockAPI()
 
-    def check(self, username: str) -> CheckReport:
+    def check(
+        self,
+        username: str,
+        deadline: Deadline | None = None,
+        replay: dict[str, dict] | None = None,
+        on_result: Callable[[str, dict], None] | None = None,
+    ) -> CheckReport:
         """Ejecuta verificacion completa de username."""
         report = CheckReport(query=username, query_type="username")
 
+        with status(console, "[bold blue]Consultando Hudson Rock y LeakCheck..."):
+            results, missing = run_providers({
+                self.hudson.name: lambda: self.hudson.check(username, query_type="username"),
+                self.leakcheck.name: lambda: self.leakcheck.check(username, query_type="username"),
+            }, deadline, replay, on_result)
+        report.mark_missing(missing)
+
         # 1. Hudson Rock (primario para username)
-        with console.status("[bold blue]Consultando Hudson Rock..."):
-            hr_result = self.hudson.check(username, query_type="username")
-            if hr_result.get("error"):
-                report.errors.append(hr_result["error"])
-            report.infostealers.extend(hr_result.get("infostealers", []))
+        hr_result = results.get(self.hudson.name, {})
+        if hr_result.get("error"):
+            report.errors.append(hr_result["error"])
+        report.add_infostealers(hr_result.get("infostealers", []))
 
         # 2. LeakCheck
-        with console.status("[bold blue]Consultando LeakCheck..."):
-            lc_result = self.leakcheck.check(username, query_type="username")
-            if lc_result.get("error"):
-                report.errors.append(lc_result["error"])
-            report.breaches.extend(lc_result.get("breaches", []))
+        lc_result = results.get(self.leakcheck.name, {})
+        if lc_result.get("error"):
+            report.errors.append(lc_result["error"])
+        report.add_breaches(lc_result.get("breaches", []))
 
         return report
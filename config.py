@@ -5,6 +5,11 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Estado compartido por todas las ejecuciones del usuario (cuota, turnos de
+# velocidad, lotes reanudables, cache de perfiles). Es una ruta fija: no depende del
+# directorio desde el que se lance.
+STATE_DIR = os.path.expanduser(os.getenv("EXPOSEDCHECK_HOME", "~/.exposedcheck"))
+
 # --- API Endpoints ---
 
 XPOSEDORNOT_BREACH_URL = "https://api.xposedornot.com/v1/breach-analytics"
@@ -17,15 +22,172 @@ LEAKCHECK_PUBLIC_URL = "https://leakcheck.io/api/public"
 HUDSONROCK_EMAIL_URL = "https://cavalier.hudsonrock.com/api/json/v2/osint-tools/search-by-email"
 HUDSONROCK_USERNAME_URL = "https://cavalier.hudsonrock.com/api/json/v2/osint-tools/search-by-username"
 
+BREACHDIRECTORY_URL = "https://breachdirectory.p.rapidapi.com/"
+
 # --- API Keys opcionales ---
 
 BREACHDIRECTORY_API_KEY = os.getenv("BREACHDIRECTORY_API_KEY", "")
 
+# --- Normalizacion de identidades ---
+
+# Codigo de pais (sin "+") para telefonos escritos sin prefijo, p. ej. "34"
+DEFAULT_COUNTRY_CODE = os.getenv("DEFAULT_COUNTRY_CODE", "").lstrip("+")
+
+# --- Catalogo de brechas ---
+
+# JSON opcional {id_canonico: [alias, ...]} que amplia el catalogo integrado
+BREACH_CATALOG_FILE = os.getenv("BREACH_CATALOG_FILE", "")
+
+# Brechas distintas que se comparten entre reportes (LRU; ver models.intern_breach)
+BREACH_POOL_SIZE = 50_000
+# Nombres de brecha ya resueltos a su ID canonico (LRU; ver catalog.BreachCatalog)
+CATALOG_CACHE_SIZE = 50_000
+
+# --- Almacen de resultados ---
+
+# Base SQLite donde guardar cada escaneo (vacio = no guardar)
+RESULTS_DB = os.getenv("RESULTS_DB", "")
+
 # --- Configuracion HTTP ---
 
 REQUEST_TIMEOUT = 15  # segundos
 USER_AGENT = "DataBreachChecker/1.0 (Security Audit Tool)"
 
+# Timeouts separados (connect, read) en segundos
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = REQUEST_TIMEOUT
+
+# Timeouts por proveedor: nombre -> (connect, read)
+PROVIDER_TIMEOUTS = {
+    "XposedOrNot": (5, 15),
+    "HIBP Pwned Passwords": (3, 8),
+    "LeakCheck": (5, 10),
+    "Hudson Rock": (5, 15),
+    "BreachDirectory": (5, 15),
+}
+# Timeout para cada sonda de PLATFORMS (busqueda de perfiles)
+PROFILE_TIMEOUT = (4, 10)
+
+# Cache persistente de perfiles: (plataforma, username) -> resultado.
+# TTL distinto por resultado: las respuestas estables se reutilizan y los
+# errores se reintentan pronto. PROFILE_CACHE_DB vacio desactiva el cache.
+PROFILE_CACHE_DB = os.path.expanduser(os.getenv("PROFILE_CACHE_DB", os.path.join(STATE_DIR, "profiles.db")))
+PROFILE_CACHE_TTL = {
+    "found": int(os.getenv("PROFILE_CACHE_TTL_FOUND", str(24 * 3600))),
+    "not_found": int(os.getenv("PROFILE_CACHE_TTL_NOT_FOUND", str(12 * 3600))),
+    "error": int(os.getenv("PROFILE_CACHE_TTL_ERROR", "300")),
+}
+
+# Concurrencia adaptativa (AIMD): peticiones en vuelo por proveedor/plataforma.
+# Sube +1 por ventana de respuestas sanas y se reduce a la mitad ante
+# timeouts, 429 o errores de conexion (como mucho un recorte por AIMD_COOLDOWN s)
+AIMD_INITIAL_LIMIT = int(os.getenv("AIMD_INITIAL_LIMIT", "8"))
+AIMD_MIN_LIMIT = 1
+AIMD_MAX_LIMIT = int(os.getenv("AIMD_MAX_LIMIT", "64"))
+AIMD_BACKOFF = 0.5
+AIMD_COOLDOWN = 1.0
+AIMD_SLOW_FACTOR = 3.0  # una respuesta mas lenta que 3x la mediana no sube el limite
+# Barrido de perfiles completo: (inicial, minimo, maximo) plataformas en vuelo
+PROFILE_CONCURRENCY = (10, 2, int(os.getenv("PROFILE_MAX_CONCURRENCY", "32")))
+
+# Transporte HTTP: "auto" (HTTP/2 si httpx[http2] esta instalado), "http2" o "requests"
+HTTP_TRANSPORT = os.getenv("HTTP_TRANSPORT", "auto").lower()
+
+# Precalentamiento (--warmup y server.py): resolver DNS de todos los hosts en
+# paralelo y, opcionalmente, dejar una conexion abierta por host en el pool
+DNS_CACHE_TTL = int(os.getenv("DNS_CACHE_TTL", "300"))  # segundos; 0 = sin cache
+WARMUP_CONNECTIONS = os.getenv("WARMUP_CONNECTIONS", "1") == "1"
+WARMUP_TIMEOUT = 3.0
+
+# Respuestas JSON mayores que esto (bytes) se decodifican de forma incremental
+JSON_STREAM_THRESHOLD = 1_000_000
+
+# Timeouts adaptativos: el read timeout se deriva del percentil observado
+ADAPTIVE_TIMEOUTS = os.getenv("ADAPTIVE_TIMEOUTS", "0") == "1"
+ADAPTIVE_PERCENTILE = 99
+ADAPTIVE_MULTIPLIER = 2.0
+ADAPTIVE_MIN_TIMEOUT = 2.0
+LATENCY_MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+
+# Presupuesto total por verificacion (segundos, 0 = sin limite)
+CHECK_DEADLINE = float(os.getenv("CHECK_DEADLINE", "0"))
+
+# Peticiones "hedged": segundo intento si el primero supera el p95
+HEDGE_REQUESTS = os.getenv("HEDGE_REQUESTS", "0") == "1"
+HEDGE_PERCENTILE = 95
+# Hilos para los intentos hedged; con hedging activo tambien corre ahi el primero
+HEDGE_POOL_SIZE = int(os.getenv("HEDGE_POOL_SIZE", "64"))
+
+# Reintentos de GET ante fallos transitorios (conexion, timeout, 5xx, 429 con Retry-After)
+RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))  # intentos totales por peticion
+RETRY_BASE_DELAY = 0.5  # segundos; se duplica en cada intento (con jitter)
+RETRY_MAX_DELAY = 8.0
+RETRY_BUDGET_RATIO = 0.1  # reintentos ganados por peticion (10 %)
+RETRY_BUDGET_BURST = 10  # reintentos acumulables como maximo
+
+# Modo rapido (--fast): parar en cuanto la identidad este claramente expuesta
+FAST_BREACH_THRESHOLD = int(os.getenv("FAST_BREACH_THRESHOLD", "1"))  # brechas que bastan
+FAST_DEFAULT_LATENCY = 1.0  # segundos supuestos mientras no hay muestras
+FAST_QUOTA_PENALTY = 1.0  # coste extra de los proveedores con cuota
+
+# --- Presupuesto por proveedor ---
+
+# proveedor -> (llamadas, periodo de facturacion: "day" o "month").
+# Solo BreachDirectory factura por llamada (RapidAPI, 10/mes en el plan
+# gratuito). LeakCheck y Hudson Rock no tienen cuota de facturacion: su 429
+# es un limite de velocidad (ver PROVIDER_RATE_LIMITS y apis.retry).
+PROVIDER_BUDGETS = {
+    "BreachDirectory": (int(os.getenv("BREACHDIRECTORY_MONTHLY_LIMIT", "10")), "month"),
+}
+
+# Registro persistente de llamadas gastadas por proveedor y periodo
+QUOTA_LEDGER_DB = os.path.expanduser(os.getenv("QUOTA_LEDGER_DB", os.path.join(STATE_DIR, "quota.db")))
+
+# Limite de velocidad: proveedor -> (llamadas, segundos). Se comparte entre
+# todos los procesos del host que usen el mismo RATE_LIMIT_DB.
+PROVIDER_RATE_LIMITS = {
+    "LeakCheck": (int(os.getenv("LEAKCHECK_RATE", "1")), 1.0),
+    "Hudson Rock": (int(os.getenv("HUDSONROCK_RATE", "5")), 1.0),
+    "BreachDirectory": (1, 1.0),
+}
+RATE_LIMIT_DB = os.path.expanduser(os.getenv("RATE_LIMIT_DB", os.path.join(STATE_DIR, "ratelimit.db")))
+
+# --- Modo monitor ---
+
+MONITOR_INTERVAL_HOURS = 24
+MONITOR_JITTER = 0.1  # fraccion del intervalo
+
+# --- Lotes reanudables (--job) ---
+
+# Directorio con un journal de checkpoints por ID de trabajo
+JOBS_DIR = os.path.expanduser(os.getenv("JOBS_DIR", os.path.join(STATE_DIR, "jobs")))
+JOURNAL_FSYNC_EVERY = 64  # entradas
+JOURNAL_FSYNC_SECONDS = 1.0
+
+# --- Salida en vivo ---
+
+# Filas recientes visibles en la tabla en vivo de los lotes
+LIVE_MAX_ROWS = 15
+
+# --- Cola distribuida (coordinador / workers) ---
+
+# "sqlite:///ruta/cola.db" o una ruta; compartida por todos los workers
+QUEUE_URL = os.getenv("QUEUE_URL", "")
+QUEUE_LEASE_SECONDS = 300  # tras este tiempo sin resultado, otro worker reintenta
+# Trabajos con resultado parcial (algun proveedor sin respuesta): se devuelven
+# a la cola y se reintentan tras QUEUE_RETRY_SECONDS, hasta QUEUE_MAX_ATTEMPTS
+# reclamos; despues se guarda el resultado parcial. Si faltan proveedores sin
+# cuota, el trabajo espera al siguiente periodo de facturacion.
+QUEUE_RETRY_SECONDS = 600
+QUEUE_MAX_ATTEMPTS = 5
+
+# --- Servicio HTTP local (server.py) ---
+
+SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8765"))
+SERVER_TOKEN = os.getenv("SERVER_TOKEN", "")  # si se define, se exige "Authorization: Bearer <token>"
+
 # --- Niveles de riesgo ---
 
 RISK_LEVELS = {
@@ -0,0 +1,17 @@
+"""Infraestructura de ejecucion: deadlines, planificacion y concurrencia."""
+
+from .deadline import (
+    Deadline, DeadlineExceeded, current_deadline, deadline_scope, run_with_deadline,
+    run_providers, run_until_decisive,
+)
+from .scheduler import TaskGraph, run_background, status
+from .concurrency import CONCURRENCY, AdaptiveLimit, ConcurrencyController
+from .budget import ProviderBudget
+
+__all__ = [
+    "Deadline", "DeadlineExceeded", "current_deadline", "deadline_scope",
+    "run_with_deadline", "run_providers", "run_until_decisive",
+    "TaskGraph", "run_background", "status",
+    "CONCURRENCY", "AdaptiveLimit", "ConcurrencyController",
+    "ProviderBudget",
+]
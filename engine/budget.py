@@ -0,0 +1,62 @@
+"""Presupuesto de llamadas por proveedor (sobre el registro persistente de cuota).
+
+Reune las decisiones de cuota que comparten el lote, el monitor y la cola de
+trabajo: que proveedores de una identidad tienen limite, si queda cuota para
+consultarla y cuando vuelve a haberla. El gasto se guarda en el QuotaLedger
+(storage.quota), compartido entre ejecuciones y procesos; cada proveedor
+reserva su llamada al consultarse (ver storage.quota.quota_error).
+"""
+
+from storage.quota import QuotaLedger, get_ledger
+
+
+class ProviderBudget:
+    """Cuota restante por proveedor y periodo de facturacion.
+
+    Los proveedores sin limite en PROVIDER_BUDGETS siempre tienen presupuesto.
+    """
+
+    def __init__(self, ledger: QuotaLedger | None = None):
+        self.ledger = ledger or get_ledger()
+
+    @property
+    def limits(self) -> dict[str, tuple[int, str]]:
+        return self.ledger.limits
+
+    def remaining(self, provider: str) -> int | None:
+        """Llamadas disponibles en el periodo actual (None = sin limite)."""
+        return self.ledger.remaining(provider)
+
+    def snapshot(self) -> dict[str, int]:
+        """Llamadas disponibles de cada proveedor con limite, para planificar."""
+        return {provider: self.ledger.remaining(provider) for provider in self.limits}
+
+    def blocked(self, providers, remaining: dict[str, int] | None = None) -> list[str]:
+        """Proveedores agotados que impiden consultar una identidad.
+
+        Una identidad solo se pospone si todos sus proveedores tienen limite
+        y estan agotados; si alguno responde sin cuota, se consulta.
+
+        Args:
+            providers: Proveedores que aun hay que consultar.
+            remaining: Cuota ya repartida (ver snapshot); por defecto la actual.
+
+        Returns:
+            Los proveedores agotados, o [] si la identidad puede consultarse.
+        """
+        providers = list(providers)
+        if remaining is None:
+            remaining = self.snapshot()
+        limited = [p for p in providers if p in remaining]
+        if limited and len(limited) == len(providers) and all(remaining[p] <= 0 for p in limited):
+            return limited
+        return []
+
+    def next_available(self, providers) -> float:
+        """Instante (epoch) en que todos los proveedores vuelven a tener cuota."""
+        return self.ledger.next_available(providers)
+
+    def last_checked(self, providers, identity: str) -> float | None:
+        """Ultima consulta de identity en su primer proveedor con limite."""
+        limited = [p for p in providers if p in self.limits]
+        return self.ledger.last_checked(limited[0], identity) if limited else None
@@ -0,0 +1,131 @@
+"""Control adaptativo de concurrencia (AIMD) por clave.
+
+Cada clave (proveedor, plataforma o el barrido de perfiles completo) tiene
+un limite de peticiones en vuelo. Mientras las respuestas llegan bien y a
+tiempo el limite sube de forma aditiva (+1 por cada ventana completa de
+exitos); ante timeouts, 429 o errores de conexion se reduce de forma
+multiplicativa. Asi se aprovecha una red buena sin insistir cuando un sitio
+empieza a limitarnos.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from config import AIMD_INITIAL_LIMIT, AIMD_MIN_LIMIT, AIMD_MAX_LIMIT, AIMD_BACKOFF, AIMD_COOLDOWN
+from .deadline import DeadlineExceeded, current_deadline
+
+# Resultado de una peticion para el controlador
+OK = "ok"  # respuesta sana: puede subir el limite
+CONGESTED = "congested"  # timeout, 429 o conexion: baja el limite
+NEUTRAL = "neutral"  # ni una cosa ni otra (p. ej. respuesta lenta o 404)
+
+
+class AdaptiveLimit:
+    """Limite de peticiones en vuelo con aumento aditivo y reduccion multiplicativa."""
+
+    def __init__(
+        self,
+        initial: float = AIMD_INITIAL_LIMIT,
+        minimum: float = AIMD_MIN_LIMIT,
+        maximum: float = AIMD_MAX_LIMIT,
+        backoff: float = AIMD_BACKOFF,
+        cooldown: float = AIMD_COOLDOWN,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self._limit = float(min(maximum, max(minimum, initial)))
+        self._inflight = 0
+        self._cut_at = float("-inf")
+        self.decreases = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Espera un hueco; False si no lo hubo antes de timeout."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._inflight < int(self._limit), timeout):
+                return False
+            self._inflight += 1
+            return True
+
+    def release(self, outcome: str = NEUTRAL) -> None:
+        with self._cond:
+            self._inflight -= 1
+            if outcome == OK:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            elif outcome == CONGESTED:
+                # Una rafaga de fallos de la misma ventana solo recorta una vez
+                now = time.monotonic()
+                if now - self._cut_at >= self.cooldown:
+                    self._limit = max(self.minimum, self._limit * self.backoff)
+                    self._cut_at = now
+                    self.decreases += 1
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {"limit": int(self._limit), "inflight": self._inflight, "decreases": self.decreases}
+
+
+class Slot:
+    """Hueco reservado; quien lo usa fija outcome antes de soltarlo."""
+
+    __slots__ = ("outcome",)
+
+    def __init__(self):
+        self.outcome = NEUTRAL
+
+
+class ConcurrencyController:
+    """Limites adaptativos por clave, creados al primer uso."""
+
+    def __init__(self):
+        self._limits: dict[str, AdaptiveLimit] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, key: str, initial: float, minimum: float, maximum: float) -> AdaptiveLimit:
+        """Fija los limites de una clave (si aun no se uso)."""
+        with self._lock:
+            if key not in self._limits:
+                self._limits[key] = AdaptiveLimit(initial, minimum, maximum)
+            return self._limits[key]
+
+    def get(self, key: str) -> AdaptiveLimit:
+        with self._lock:
+            limit = self._limits.get(key)
+            if limit is None:
+                limit = self._limits[key] = AdaptiveLimit()
+            return limit
+
+    @contextmanager
+    def slot(self, key: str):
+        """Reserva un hueco de key durante el bloque.
+
+        Si hay un deadline activo y no queda hueco antes de que venza se
+        lanza DeadlineExceeded. Una excepcion sin outcome fijado cuenta como
+        NEUTRAL.
+        """
+        limit = self.get(key)
+        deadline = current_deadline()
+        if not limit.acquire(deadline.remaining() if deadline is not None else None):
+            raise DeadlineExceeded(f"{key}: sin hueco de concurrencia antes del deadline")
+        slot = Slot()
+        try:
+            yield slot
+        finally:
+            limit.release(slot.outcome)
+
+    def metrics(self) -> dict[str, dict]:
+        """Limite actual, peticiones en vuelo y recortes por clave."""
+        with self._lock:
+            limits = dict(self._limits)
+        return {key: limit.snapshot() for key, limit in sorted(limits.items())}
+
+
+CONCURRENCY = ConcurrencyController()
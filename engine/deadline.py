@@ -0,0 +1,214 @@
+"""Presupuesto de tiempo (deadline) para una verificacion completa."""
+
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable
+
+_current: contextvars.ContextVar["Deadline | None"] = contextvars.ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """El presupuesto de tiempo de la verificacion se agoto."""
+
+
+class Deadline:
+    """Instante limite para terminar una verificacion."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Segundos restantes (0 si ya expiro)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def cap(self, timeout: tuple[float, float]) -> tuple[float, float]:
+        """Recorta un timeout (connect, read) al tiempo restante."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"deadline de {self.seconds:g}s agotado")
+        return min(timeout[0], remaining), min(timeout[1], remaining)
+
+
+def current_deadline() -> Deadline | None:
+    """Deadline activo en el contexto actual, si existe."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None):
+    """Activa un deadline para todas las peticiones HTTP del bloque."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def run_with_deadline(
+    calls: dict[str, Callable[[], object]],
+    deadline: Deadline | None = None,
+    max_workers: int | None = None,
+    on_result: Callable[[str, object], None] | None = None,
+) -> tuple[dict[str, object], list[str]]:
+    """Ejecuta las llamadas en paralelo y espera como maximo hasta el deadline.
+
+    Cada llamada corre con el deadline activo, de modo que sus peticiones HTTP
+    recortan su timeout al tiempo restante. Las llamadas que no terminan a
+    tiempo se cancelan y se reportan como pendientes. on_result(nombre,
+    resultado), si se indica, se invoca desde el hilo de cada llamada en
+    cuanto termina bien, para mostrar resultados sin esperar a las demas.
+
+    Returns:
+        (resultados por nombre, nombres que no respondieron a tiempo)
+    """
+    if deadline is None:
+        deadline = current_deadline()
+
+    workers = max_workers or max(1, len(calls))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="provider")
+    futures = {}
+    for name, fn in calls.items():
+        ctx = contextvars.copy_context()
+        ctx.run(_current.set, deadline)
+        futures[name] = executor.submit(ctx.run, _timed, fn, deadline)
+        if on_result is not None:
+            futures[name].add_done_callback(partial(_notify, name, on_result))
+
+    wait(futures.values(), timeout=deadline.remaining() if deadline else None)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    results = {}
+    missing = []
+    for name, future in futures.items():
+        if not future.done() or future.cancelled():
+            missing.append(name)
+            continue
+        error = future.exception()
+        if isinstance(error, DeadlineExceeded):
+            missing.append(name)
+        elif error is not None:
+            raise error
+        else:
+            value, late = future.result()
+            if late:
+                # Termino por el timeout recortado al deadline: no respondio
+                missing.append(name)
+            else:
+                results[name] = value
+    return results, missing
+
+
+def _notify(name: str, on_result: Callable[[str, object], None], future) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    value, late = future.result()
+    if not late:
+        on_result(name, value)
+
+
+def run_providers(
+    calls: dict[str, Callable[[], dict]],
+    deadline: Deadline | None = None,
+    replay: dict[str, dict] | None = None,
+    on_result: Callable[[str, dict], None] | None = None,
+) -> tuple[dict[str, dict], list[str]]:
+    """run_with_deadline para proveedores, reutilizando resultados ya conocidos.
+
+    Args:
+        replay: Resultados previos por proveedor (p. ej. de un journal de
+            checkpoints); esos proveedores no se vuelven a consultar.
+        on_result: Se invoca con cada resultado nuevo sin error.
+    """
+    replay = replay or {}
+    results, missing = run_with_deadline(
+        {name: fn for name, fn in calls.items() if name not in replay}, deadline
+    )
+    if on_result:
+        for name, result in results.items():
+            if not result.get("error"):
+                on_result(name, result)
+    return {**replay, **results}, missing
+
+
+def run_until_decisive(
+    calls: list[tuple[str, Callable[[], object]]],
+    is_decisive: Callable[[dict[str, object]], bool],
+    stagger: Callable[[str], float],
+    deadline: Deadline | None = None,
+) -> tuple[dict[str, object], list[str], list[str]]:
+    """Lanza las llamadas en orden y se detiene con la primera respuesta decisiva.
+
+    La siguiente llamada se lanza cuando la anterior termina sin respuesta
+    decisiva o cuando pasan stagger(nombre_anterior) segundos, lo que ocurra
+    antes. En cuanto is_decisive(resultados) es cierto no se lanza ninguna
+    otra y las que siguen en curso se abandonan.
+
+    Returns:
+        (resultados, nombres sin respuesta a tiempo, nombres omitidos)
+    """
+    if deadline is None:
+        deadline = current_deadline()
+
+    queue = list(calls)
+    executor = ThreadPoolExecutor(max_workers=max(1, len(calls)), thread_name_prefix="provider")
+    pending = {}
+    results = {}
+    missing = []
+    decisive = False
+
+    def launch() -> str:
+        name, fn = queue.pop(0)
+        ctx = contextvars.copy_context()
+        ctx.run(_current.set, deadline)
+        pending[executor.submit(ctx.run, _timed, fn, deadline)] = name
+        return name
+
+    last = launch() if queue else None
+    while pending:
+        timeout = stagger(last) if queue else None
+        if deadline is not None:
+            timeout = deadline.remaining() if timeout is None else min(timeout, deadline.remaining())
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = pending.pop(future)
+            error = future.exception()
+            if isinstance(error, DeadlineExceeded):
+                missing.append(name)
+            elif error is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise error
+            else:
+                value, late = future.result()
+                if late:
+                    missing.append(name)
+                else:
+                    results[name] = value
+        if is_decisive(results):
+            decisive = True
+            break
+        if deadline is not None and deadline.expired:
+            break
+        if queue:
+            last = launch()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    skipped = [name for name, _ in queue]
+    if decisive:
+        skipped += list(pending.values())
+    else:
+        missing += list(pending.values())
+    return results, missing, skipped
+
+
+def _timed(fn: Callable[[], object], deadline: Deadline | None) -> tuple[object, bool]:
+    """Ejecuta fn() e indica si termino con el deadline ya agotado."""
+    value = fn()
+    return value, deadline is not None and deadline.expired
@@ -0,0 +1,93 @@
+"""Planificador de verificaciones como grafo de dependencias (DAG)."""
+
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Callable
+
+# True dentro de una tarea del planificador: los spinners se omiten porque
+# varias ramas corren a la vez y solo el hilo principal imprime resultados.
+_background: contextvars.ContextVar[bool] = contextvars.ContextVar("background", default=False)
+
+
+def submit_background(executor, fn: Callable, *args):
+    """Envia fn al executor marcandola como tarea en segundo plano."""
+    ctx = contextvars.copy_context()
+    ctx.run(_background.set, True)
+    return executor.submit(ctx.run, fn, *args)
+
+
+def run_background(fn: Callable, *args):
+    """Ejecuta fn en el hilo actual como tarea en segundo plano (sin spinners)."""
+    ctx = contextvars.copy_context()
+    ctx.run(_background.set, True)
+    return ctx.run(fn, *args)
+
+
+def status(console, message: str):
+    """console.status() salvo dentro de una tarea en segundo plano."""
+    if _background.get():
+        return nullcontext()
+    return console.status(message)
+
+
+class TaskGraph:
+    """Grafo de tareas; cada rama independiente corre en paralelo.
+
+    Cada tarea recibe como argumentos los resultados de sus dependencias,
+    en el orden declarado. Las dependencias deben registrarse antes, por lo
+    que el grafo no puede tener ciclos.
+    """
+
+    def __init__(self):
+        self._tasks: dict[str, tuple[Callable, tuple[str, ...]]] = {}
+
+    def add(self, name: str, fn: Callable, deps: tuple[str, ...] | list[str] = ()) -> None:
+        """Registra una tarea."""
+        if name in self._tasks:
+            raise ValueError(f"Tarea duplicada: {name}")
+        for dep in deps:
+            if dep not in self._tasks:
+                raise ValueError(f"Dependencia desconocida para {name}: {dep}")
+        self._tasks[name] = (fn, tuple(deps))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def run(
+        self,
+        on_complete: Callable[[str, object], None] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, object]:
+        """Ejecuta el grafo y retorna los resultados por nombre.
+
+        on_complete(nombre, resultado) se invoca en el hilo que llama a run()
+        a medida que cada tarea termina, para combinar e imprimir resultados
+        de forma incremental.
+        """
+        results: dict[str, object] = {}
+        if not self._tasks:
+            return results
+
+        pending = dict(self._tasks)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(self._tasks), thread_name_prefix="dag") as executor:
+            def launch_ready() -> None:
+                for name, (fn, deps) in list(pending.items()):
+                    if all(dep in results for dep in deps):
+                        del pending[name]
+                        args = [results[dep] for dep in deps]
+                        running[submit_background(executor, fn, *args)] = name
+
+            launch_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    if on_complete:
+                        on_complete(name, results[name])
+                launch_ready()
+
+        return results
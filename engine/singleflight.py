@@ -0,0 +1,99 @@
+"""Coalescencia de consultas duplicadas en vuelo (single-flight)."""
+
+import functools
+import inspect
+import threading
+
+from .deadline import DeadlineExceeded, current_deadline
+
+
+class _Call:
+    """Consulta en vuelo compartida por todos los que piden la misma clave."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Agrupa llamadas concurrentes con la misma clave en una sola ejecucion.
+
+    El primer llamador (lider) ejecuta la funcion; el resto espera y recibe
+    el mismo resultado ya parseado. Al terminar, la clave se libera: no es
+    una cache, solo evita peticiones duplicadas simultaneas.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[object, _Call] = {}
+        self.shared = 0  # llamadas que reutilizaron una consulta en vuelo
+
+    def do(self, key, fn):
+        """Ejecuta fn() o espera a la ejecucion en vuelo con la misma clave.
+
+        Si el lider agota su deadline, ese error no se comparte: cada
+        seguidor tiene su propio presupuesto y vuelve a intentarlo (como
+        lider si ya no hay otra ejecucion en vuelo).
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+
+            if leader:
+                try:
+                    call.result = fn()
+                except BaseException as e:
+                    call.error = e
+                finally:
+                    with self._lock:
+                        del self._calls[key]
+                    call.done.set()
+            else:
+                deadline = current_deadline()
+                if not call.done.wait(deadline.remaining() if deadline else None):
+                    raise DeadlineExceeded("deadline agotado esperando consulta en vuelo")
+                if isinstance(call.error, DeadlineExceeded):
+                    continue
+                with self._lock:
+                    self.shared += 1
+
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+
+INFLIGHT = SingleFlight()
+
+
+# Tipos de consulta que no distinguen mayusculas (un username si puede)
+_CASE_INSENSITIVE = ("email", "domain")
+
+
+def normalize_key(query: str, kind: str | None = None) -> str:
+    """Normaliza una consulta para agrupar variantes triviales."""
+    query = query.strip()
+    return query.lower() if kind in _CASE_INSENSITIVE else query
+
+
+def coalesced(method):
+    """Decorador para check() de proveedores: agrupa por (proveedor, consulta).
+
+    El tipo de consulta sale del argumento query_type si el metodo lo tiene;
+    si no, una consulta con "@" se trata como email. El resultado se
+    comparte entre los llamadores y no debe mutarse.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, query: str, *args, **kwargs):
+        bound = signature.bind(self, query, *args, **kwargs)
+        bound.apply_defaults()
+        options = list(bound.arguments.items())[2:]  # sin self ni la consulta
+        kind = bound.arguments.get("query_type", "email" if "@" in query else None)
+        key = (self.name, method.__name__, normalize_key(query, kind), tuple(options))
+        return INFLIGHT.do(key, lambda: method(self, query, *args, **kwargs))
+    return wrapper
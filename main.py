@@ -2,8 +2,11 @@
 
 import argparse
 import getpass
+import json
 import os
 import sys
+import time
+from dataclasses import asdict
 
 # Forzar UTF-8 en Windows para caracteres especiales de Rich
 if sys.platform == "win32":
@@ -18,9 +21,22 @@ from rich import box
 
 from checkers import (
     EmailChecker, UsernameChecker, PhoneChecker,
-    PasswordChecker, ImageChecker, ProfileChecker,
+    PasswordChecker, ImageChecker, ProfileChecker, BatchChecker,
+    WatchlistMonitor, QueueWorker,
 )
-from reporting import ConsoleReporter, RemediationGuide
+from checkers.batch_checker import default_processes, read_identities
+from reporting import ConsoleReporter, LiveBatchView, RemediationGuide, report_from_dict
+from apis.latency import LATENCY
+from apis.retry import RETRY
+from apis.warmup import provider_urls, warm_up, warm_up_background
+from checkers.profile_checker import PLATFORMS, ProfileLiveView
+from config import (
+    CHECK_DEADLINE, RESULTS_DB, MONITOR_INTERVAL_HOURS, QUEUE_URL, QUEUE_LEASE_SECONDS, WARMUP_CONNECTIONS,
+)
+from engine import CONCURRENCY, Deadline, TaskGraph
+from engine.singleflight import INFLIGHT
+from storage import ResultStore, IncrementalTracker, CheckpointJournal, open_queue
+from models import CheckReport
 
 console = Console(force_terminal=True)
 
@@ -64,6 +80,16 @@ Ejemplos:
   python main.py -e correo@ejemplo.com -u mi_usuario -t +34612345678
   python main.py --reverse-image ./mis_fotos/
   python main.py --search-profiles mi_usuario
+  python main.py --search-profiles mi_usuario --refresh-profiles  # sin cache
+  python main.py --search-profiles mi_usuario --warmup            # DNS y conexiones en caliente
+  python main.py --batch identidades.txt --workers 8
+  python main.py --batch identidades.txt --processes 0  # un proceso por nucleo
+  python main.py --batch identidades.txt --job auditoria-q3  # reanudable
+  python main.py --batch identidades.txt --fast              # solo cribado: expuesta o no
+  python main.py --monitor watchlist.txt --db resultados.db --interval 24
+  python main.py --queue cola.db --enqueue identidades.txt     # coordinador
+  python main.py --queue cola.db --queue-worker                # en cada maquina
+  python main.py --queue cola.db --collect --db resultados.db
         """,
     )
     parser.add_argument(
@@ -93,13 +119,130 @@ Ejemplos:
         metavar="USERNAME",
         help="Buscar un username en 25+ plataformas para detectar perfiles duplicados",
     )
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Resolver DNS y abrir conexiones a proveedores y plataformas antes de consultar",
+    )
+    parser.add_argument(
+        "--refresh-profiles",
+        action="store_true",
+        help="Ignorar el cache de perfiles y volver a consultar todas las plataformas",
+    )
     parser.add_argument(
         "--no-open",
         action="store_true",
         help="No abrir automaticamente URLs en el navegador (solo mostrar)",
     )
+    parser.add_argument(
+        "--adaptive-timeouts",
+        action="store_true",
+        help="Derivar el read timeout de cada proveedor de su latencia observada (p99)",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Lanzar un segundo intento cuando una peticion supera el p95 de su proveedor",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SEGUNDOS",
+        default=CHECK_DEADLINE,
+        help="Tiempo maximo para toda la verificacion; lo que no responda se reporta como parcial",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="ARCHIVO",
+        help="Verificar un archivo con una identidad por linea (email, username o telefono)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Identidades verificadas en paralelo en modo lote (default: 4)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Repartir el lote entre N procesos, cada uno con --workers hilos (0 = uno por nucleo)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Modo rapido en lotes y --queue-worker: parar en cuanto la identidad este expuesta (infostealer o brechas)",
+    )
+    parser.add_argument(
+        "--job",
+        metavar="ID",
+        help="ID del lote: guarda un journal de checkpoints y, si ya existe, reanuda sin repetir consultas",
+    )
+    parser.add_argument(
+        "--db",
+        metavar="RUTA",
+        default=RESULTS_DB,
+        help="Guardar los resultados en una base SQLite (consultable con query.py)",
+    )
+    parser.add_argument(
+        "--monitor",
+        metavar="ARCHIVO",
+        help="Monitoreo continuo de una watchlist; avisa solo cuando cambian los resultados",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=MONITOR_INTERVAL_HOURS,
+        metavar="HORAS",
+        help=f"Intervalo entre revisiones de cada identidad en modo monitor (default: {MONITOR_INTERVAL_HOURS})",
+    )
+    parser.add_argument(
+        "--alerts",
+        metavar="ARCHIVO",
+        help="Anadir cada alerta del modo monitor como una linea JSON a este archivo",
+    )
+    parser.add_argument(
+        "--queue",
+        metavar="URL",
+        default=QUEUE_URL,
+        help="Cola distribuida compartida por varios workers (sqlite:///ruta o ruta)",
+    )
+    parser.add_argument(
+        "--enqueue",
+        metavar="ARCHIVO",
+        help="Encolar las identidades de un archivo en --queue",
+    )
+    parser.add_argument(
+        "--queue-worker",
+        action="store_true",
+        help="Consumir --queue hasta vaciarla (usa --workers y --deadline)",
+    )
+    parser.add_argument(
+        "--collect",
+        action="store_true",
+        help="Mostrar (y guardar con --db) los resultados terminados de --queue",
+    )
+    parser.add_argument(
+        "--queue-batch",
+        metavar="NOMBRE",
+        default="default",
+        help="Nombre del lote dentro de la cola (default: default)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Mostrar solo brechas nuevas o resueltas desde el ultimo escaneo (requiere --db)",
+    )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.job and not args.batch:
+        parser.error("--job requiere --batch")
+    if args.incremental and not args.db:
+        parser.error("--incremental requiere --db (o RESULTS_DB en .env)")
+    if (args.enqueue or args.queue_worker or args.collect) and not args.queue:
+        parser.error("--enqueue, --queue-worker y --collect requieren --queue (o QUEUE_URL en .env)")
+    return args
 
 
 # ---------------------------------------------------------------------------
@@ -109,6 +252,8 @@ Ejemplos:
 def interactive_mode() -> None:
     """Modo interactivo guiado paso a paso."""
     console.print(BANNER)
+    # Mientras se elige una opcion se resuelven los DNS en segundo plano
+    warm_up_background(_warmup_urls(profiles=True), connect=False)
 
     reporter = ConsoleReporter()
     remediation = RemediationGuide()
@@ -159,7 +304,7 @@ def _interactive_email(reporter: ConsoleReporter, remediation: RemediationGuide)
 
     console.rule(f"[bold]Verificando email: {email}[/bold]")
     checker = EmailChecker()
-    report = checker.check(email)
+    report = checker.check(email, deadline=_new_deadline(CHECK_DEADLINE))
     reporter.print_report(report)
 
     console.print()
@@ -175,7 +320,7 @@ def _interactive_username(reporter: ConsoleReporter, remediation: RemediationGui
 
     console.rule(f"[bold]Verificando username: {username}[/bold]")
     checker = UsernameChecker()
-    report = checker.check(username)
+    report = checker.check(username, deadline=_new_deadline(CHECK_DEADLINE))
     reporter.print_report(report)
 
     console.print()
@@ -192,7 +337,7 @@ def _interactive_phone(reporter: ConsoleReporter, remediation: RemediationGuide)
 
     console.rule(f"[bold]Verificando telefono: {phone}[/bold]")
     checker = PhoneChecker()
-    report = checker.check(phone)
+    report = checker.check(phone, deadline=_new_deadline(CHECK_DEADLINE))
     reporter.print_report(report)
 
     console.print()
@@ -215,7 +360,7 @@ def _interactive_password() -> None:
         return
 
     pw_checker = PasswordChecker()
-    result = pw_checker.check(password)
+    result = pw_checker.check(password, deadline=_new_deadline(CHECK_DEADLINE))
 
     console.print()
     if result.is_compromised:
@@ -225,7 +370,17 @@ def _interactive_password() -> None:
         if result.xon_count > 0:
             lines.append("  XposedOrNot: encontrado en brechas")
         lines.append("\n[bold]Debes cambiar este password inmediatamente en todos los sitios donde lo uses.[/bold]")
+        if result.partial:
+            lines.append(f"[yellow]Sin respuesta de: {', '.join(result.missing_providers)}[/yellow]")
         console.print(Panel("\n".join(lines), title="Resultado", border_style="red"))
+    elif result.partial:
+        console.print(Panel(
+            "[bold yellow]Resultado no concluyente: no se pudo consultar todas las fuentes.[/bold yellow]\n"
+            f"Sin respuesta de: {', '.join(result.missing_providers)}\n"
+            "Vuelve a verificarlo mas tarde.",
+            title="Resultado",
+            border_style="yellow",
+        ))
     else:
         console.print(Panel(
             "[bold green]Este password NO aparece en brechas conocidas.[/bold green]\n"
@@ -265,7 +420,8 @@ def _interactive_profiles() -> None:
 
     console.rule(f"[bold]Buscando perfiles: {username}[/bold]")
     checker = ProfileChecker()
-    results = checker.check(username)
+    with ProfileLiveView(username) as view:
+        results = checker.check(username, deadline=_new_deadline(CHECK_DEADLINE), on_result=view.add)
     checker.print_results(results)
 
 
@@ -285,133 +441,417 @@ def _interactive_full(reporter: ConsoleReporter, remediation: RemediationGuide)
         console.print("[red]Debes introducir al menos un email o username.[/red]")
         return
 
-    all_reports = []
+    # El password se pide antes de arrancar el deadline
+    password = ""
+    if email and check_pw:
+        password = getpass.getpass("\nIntroduce el password a verificar (no se mostrara): ")
 
-    if email:
-        console.rule(f"[bold]Verificando email: {email}[/bold]")
-        checker = EmailChecker()
-        report = checker.check(email)
-
-        if check_pw:
-            password = getpass.getpass("\nIntroduce el password a verificar (no se mostrara): ")
-            if password:
-                pw_checker = PasswordChecker()
-                report.password_result = pw_checker.check(password)
-
-        reporter.print_report(report)
-        all_reports.append(report)
-
-    if username:
-        console.rule(f"[bold]Verificando username: {username}[/bold]")
-        checker = UsernameChecker()
-        report = checker.check(username)
-        reporter.print_report(report)
-        all_reports.append(report)
-
-    combined = _merge_reports(all_reports)
-    if combined:
-        console.print()
-        console.rule("[bold]Guia de Remediacion y Eliminacion de Datos[/bold]")
-        remediation.print_guide(combined)
+    _run_full_verification(
+        reporter, remediation,
+        deadline=_new_deadline(CHECK_DEADLINE),
+        db_path=RESULTS_DB,
+        email=email, password=password, username=username,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Modo CLI con argumentos
 # ---------------------------------------------------------------------------
 
+def _warmup_urls(profiles: bool) -> list[str]:
+    return provider_urls() + ([template for _, template, _ in PLATFORMS] if profiles else [])
+
+
+def _warm_up(profiles: bool, connect: bool = WARMUP_CONNECTIONS) -> None:
+    """Precalienta los hosts antes de la primera consulta (--warmup)."""
+    with console.status("[bold blue]Precalentando DNS y conexiones..."):
+        results = warm_up(_warmup_urls(profiles), connect=connect)
+    failed = [host for host, error in results.items() if error]
+    console.print(f"[dim]{len(results) - len(failed)}/{len(results)} hosts precalentados[/dim]")
+
+
 def cli_mode(args: argparse.Namespace) -> None:
     """Modo CLI tradicional con argumentos."""
     console.print(BANNER)
 
     reporter = ConsoleReporter()
     remediation = RemediationGuide()
-    all_reports = []
 
-    # --- Verificacion de Email ---
-    if args.email:
-        console.rule(f"[bold]Verificando email: {args.email}[/bold]")
-        checker = EmailChecker()
-        report = checker.check(args.email)
-
-        if args.check_password:
-            password = getpass.getpass("\nIntroduce el password a verificar (no se mostrara): ")
-            if password:
-                pw_checker = PasswordChecker()
-                report.password_result = pw_checker.check(password)
-
-        reporter.print_report(report)
-        all_reports.append(report)
-
-    # --- Verificacion de Username ---
-    if args.username:
-        console.rule(f"[bold]Verificando username: {args.username}[/bold]")
-        checker = UsernameChecker()
-        report = checker.check(args.username)
-        reporter.print_report(report)
-        all_reports.append(report)
-
-    # --- Verificacion de Telefono ---
-    if args.phone:
-        console.rule(f"[bold]Verificando telefono: {args.phone}[/bold]")
-        checker = PhoneChecker()
-        report = checker.check(args.phone)
-        reporter.print_report(report)
-        all_reports.append(report)
-
-    # --- Busqueda inversa de imagenes ---
-    if args.reverse_image:
-        console.rule("[bold]Busqueda Inversa de Imagenes[/bold]")
-        checker = ImageChecker()
-        auto_open = not args.no_open
-        results = checker.check(args.reverse_image, auto_open=auto_open)
-        checker.print_results(results)
-
-    # --- Busqueda de perfiles duplicados ---
-    if args.search_profiles:
-        console.rule(f"[bold]Buscando perfiles: {args.search_profiles}[/bold]")
-        checker = ProfileChecker()
-        results = checker.check(args.search_profiles)
-        checker.print_results(results)
+    # El password se pide antes de arrancar el deadline
+    password = ""
+    if args.email and args.check_password:
+        password = getpass.getpass("\nIntroduce el password a verificar (no se mostrara): ")
+
+    if args.warmup:
+        _warm_up(profiles=bool(args.search_profiles))
+
+    _run_full_verification(
+        reporter, remediation,
+        deadline=_new_deadline(args.deadline),
+        db_path=args.db,
+        incremental=args.incremental,
+        email=args.email, password=password, username=args.username, phone=args.phone,
+        image_path=args.reverse_image, auto_open=not args.no_open,
+        profiles_username=args.search_profiles,
+        refresh_profiles=args.refresh_profiles,
+    )
+
+    console.print()
+
+
+def batch_mode(args: argparse.Namespace) -> None:
+    """Verifica todas las identidades de un archivo y muestra un resumen."""
+    console.print(BANNER)
+
+    try:
+        items = read_identities(args.batch)
+    except OSError as e:
+        console.print(f"[red]No se pudo leer {args.batch}: {e}[/red]")
+        return
+    if not items:
+        console.print(f"[red]No hay identidades en {args.batch}.[/red]")
+        return
+
+    journal = None
+    if args.job:
+        try:
+            journal = CheckpointJournal(args.job)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            return
+        if journal.replayed:
+            console.print(
+                f"[bold]Reanudando '{args.job}':[/bold] {journal.replayed} consultas ya completadas "
+                "se reutilizan del journal."
+            )
+
+    processes = args.processes or default_processes()
+    if args.warmup:
+        # Las conexiones abiertas no deben heredarse entre procesos: con
+        # --processes solo se precalienta el DNS
+        _warm_up(profiles=False, connect=WARMUP_CONNECTIONS and processes == 1)
+    checker = BatchChecker(
+        workers=args.workers,
+        deadline_seconds=args.deadline,
+        processes=processes,
+        journal=journal,
+        fast=args.fast,
+    )
+    store = ResultStore(args.db) if args.db else None
+    scan_id = store.start_scan("batch") if store else None
+    tracker = IncrementalTracker(store) if store and args.incremental else None
+    reporter = ConsoleReporter()
+    deltas = []
+
+    with LiveBatchView(len(items)) as view:
+        def on_report(report: CheckReport) -> None:
+            view.add(report)
+            if store:
+                store.save_report(scan_id, report)
+            if tracker:
+                delta = tracker.compare(report)
+                if delta.changed:
+                    deltas.append(delta)
+
+        try:
+            reports = checker.check(items, on_report=on_report)
+        finally:
+            if journal:
+                journal.close()
+
+    if store:
+        store.finish_scan(scan_id)
+        store.close()
+
+    if tracker:
+        for delta in deltas:
+            reporter.print_delta(delta)
+        console.print(
+            f"\n[bold]{len(deltas)} identidades con cambios, "
+            f"{len(reports) - len(deltas)} sin cambios desde el ultimo escaneo.[/bold]"
+        )
+    else:
+        reporter.print_batch_summary(reports)
+    if checker.collapsed:
+        console.print(f"[dim]Filas equivalentes resueltas con una sola consulta: {checker.collapsed}[/dim]")
+    if INFLIGHT.shared:
+        console.print(f"[dim]Consultas duplicadas compartidas en vuelo: {INFLIGHT.shared}[/dim]")
+    retries = RETRY.stats()
+    if retries:
+        detail = ", ".join(f"{key}: {sum(kinds.values())}" for key, kinds in retries.items())
+        console.print(f"[dim]Reintentos por fallos transitorios: {detail}[/dim]")
+    limits = CONCURRENCY.metrics()
+    if limits:
+        detail = ", ".join(
+            f"{key}: {m['limit']}" + (f" ({m['decreases']} recortes)" if m["decreases"] else "")
+            for key, m in limits.items()
+        )
+        console.print(f"[dim]Concurrencia adaptativa (peticiones en vuelo): {detail}[/dim]")
+    console.print()
+
+
+def monitor_mode(args: argparse.Namespace) -> None:
+    """Monitoreo continuo de una watchlist hasta Ctrl+C."""
+    console.print(BANNER)
+
+    try:
+        items = read_identities(args.monitor)
+    except OSError as e:
+        console.print(f"[red]No se pudo leer {args.monitor}: {e}[/red]")
+        return
+    if not items:
+        console.print(f"[red]No hay identidades en {args.monitor}.[/red]")
+        return
+
+    reporter = ConsoleReporter()
+
+    def on_alert(delta) -> None:
+        console.rule(f"[bold red]Cambios detectados {time.strftime('%Y-%m-%d %H:%M')}[/bold red]")
+        reporter.print_delta(delta)
+        if args.alerts:
+            with open(args.alerts, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"time": time.time(), **asdict(delta)}, ensure_ascii=False) + "\n")
+
+    store = ResultStore(args.db or ":memory:")
+    monitor = WatchlistMonitor(
+        items, store,
+        interval_hours=args.interval,
+        workers=args.workers,
+        deadline_seconds=args.deadline,
+        on_alert=on_alert,
+    )
+    console.print(
+        f"[bold]Monitoreando {len(items)} identidades cada {args.interval:g} h.[/bold] "
+        "[dim]Ctrl+C para salir.[/dim]"
+    )
+    try:
+        monitor.run()
+    finally:
+        store.close()
+        console.print(
+            f"[dim]{monitor.checks} verificaciones, {monitor.deferred} pospuestas por presupuesto.[/dim]"
+        )
+
+
+def queue_mode(args: argparse.Namespace) -> None:
+    """Coordinador y workers de la cola distribuida."""
+    console.print(BANNER)
+    try:
+        queue = open_queue(args.queue)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        return
+
+    try:
+        if args.enqueue:
+            try:
+                items = read_identities(args.enqueue)
+            except OSError as e:
+                console.print(f"[red]No se pudo leer {args.enqueue}: {e}[/red]")
+                return
+            added = queue.enqueue(items, batch=args.queue_batch)
+            console.print(
+                f"[bold]{added} identidades encoladas[/bold] "
+                f"[dim]({len(items) - added} ya estaban en el lote '{args.queue_batch}')[/dim]"
+            )
+
+        if args.queue_worker:
+            worker = QueueWorker(
+                queue,
+                batch=args.queue_batch,
+                workers=args.workers,
+                deadline_seconds=args.deadline,
+                lease_seconds=QUEUE_LEASE_SECONDS,
+                fast=args.fast,
+            )
+            with console.status(f"[bold blue]Worker {worker.worker_id} consumiendo la cola...") as spinner:
+                def on_report(report: CheckReport) -> None:
+                    spinner.update(
+                        f"[bold blue]Worker {worker.worker_id}: {worker.completed} completadas"
+                    )
+                worker.run(on_report=on_report)
+            console.print(f"[bold]{worker.completed} identidades verificadas por {worker.worker_id}.[/bold]")
+            if worker.postponed:
+                console.print(
+                    f"[yellow]{worker.postponed} devueltas a la cola para reintentarlas "
+                    "(cuota agotada o proveedores sin respuesta).[/yellow]"
+                )
+
+        if args.collect:
+            reports = [report_from_dict(r) for r in queue.results(args.queue_batch)]
+            if args.db:
+                store = ResultStore(args.db)
+                scan_id = store.start_scan("queue")
+                for report in reports:
+                    store.save_report(scan_id, report)
+                store.finish_scan(scan_id)
+                store.close()
+            ConsoleReporter().print_batch_summary(reports)
+
+        counts = queue.counts(args.queue_batch)
+        console.print(
+            f"[dim]Cola '{args.queue_batch}': {counts['pending']} pendientes, "
+            f"{counts['deferred']} pospuestas, {counts['leased']} en curso, "
+            f"{counts['done']} terminadas.[/dim]\n"
+        )
+    finally:
+        queue.close()
+
+
+def _run_full_verification(
+    reporter: ConsoleReporter,
+    remediation: RemediationGuide,
+    deadline: Deadline | None = None,
+    email: str | None = None,
+    password: str = "",
+    username: str | None = None,
+    phone: str | None = None,
+    image_path: str | None = None,
+    auto_open: bool = True,
+    profiles_username: str | None = None,
+    refresh_profiles: bool = False,
+    db_path: str = "",
+    incremental: bool = False,
+) -> None:
+    """Ejecuta todas las verificaciones pedidas como un grafo de dependencias.
+
+    Las ramas independientes (email, password, username, telefono, imagenes y
+    perfiles) corren en paralelo; cada resultado se imprime y se combina en el
+    reporte de remediacion en cuanto su rama termina. Si hay db_path, cada
+    resultado se guarda tambien en la base SQLite; con incremental solo se
+    muestran los cambios y se omite la remediacion de identidades sin cambios.
+    """
+    graph = TaskGraph()
+    # Tareas cuyo resultado se imprime al terminar: nombre -> (titulo, impresora)
+    renderers = {}
+
+    if email:
+        graph.add("email", lambda: EmailChecker().check(email, deadline=deadline))
+        email_task = "email"
+        if password:
+            graph.add("password", lambda: PasswordChecker().check(password, deadline=deadline))
+            graph.add("email+password", _attach_password, deps=["email", "password"])
+            email_task = "email+password"
+        renderers[email_task] = (f"Verificando email: {email}", reporter.print_report)
+
+    if username:
+        graph.add("username", lambda: UsernameChecker().check(username, deadline=deadline))
+        renderers["username"] = (f"Verificando username: {username}", reporter.print_report)
+
+    if phone:
+        graph.add("phone", lambda: PhoneChecker().check(phone, deadline=deadline))
+        renderers["phone"] = (f"Verificando telefono: {phone}", reporter.print_report)
+
+    if image_path:
+        image_checker = ImageChecker()
+        graph.add("image", lambda: image_checker.check(image_path, auto_open=auto_open))
+        renderers["image"] = ("Busqueda Inversa de Imagenes", image_checker.print_results)
+
+    # Los perfiles se muestran en vivo mientras responden las plataformas
+    profiles_view = None
+    if profiles_username:
+        profile_checker = ProfileChecker()
+        profiles_view = ProfileLiveView(profiles_username)
+        graph.add("profiles", lambda: profile_checker.check(
+            profiles_username, deadline=deadline, refresh=refresh_profiles, on_result=profiles_view.add,
+        ))
+        renderers["profiles"] = (f"Buscando perfiles: {profiles_username}", profile_checker.print_results)
+
+    if not len(graph):
+        return
+
+    all_reports = []
+    combined = CheckReport(query="(multiples consultas)", query_type="email")
+    store = ResultStore(db_path) if db_path else None
+    scan_id = store.start_scan("full") if store else None
+    tracker = IncrementalTracker(store) if store and incremental else None
+
+    def on_complete(name: str, result) -> None:
+        if name == "profiles":
+            profiles_view.stop()
+        if name not in renderers:
+            return
+        title, printer = renderers[name]
+        delta = tracker.compare(result) if tracker and isinstance(result, CheckReport) else None
+        if delta and not delta.changed:
+            console.print(f"[dim]{result.query}: sin cambios desde el ultimo escaneo[/dim]")
+        else:
+            console.rule(f"[bold]{title}[/bold]")
+            if delta and not delta.first_scan:
+                reporter.print_delta(delta)
+            else:
+                printer(result)
+            if isinstance(result, CheckReport):
+                all_reports.append(result)
+                _merge_into(combined, result)
+        if store:
+            if isinstance(result, CheckReport):
+                store.save_report(scan_id, result)
+            elif name == "profiles":
+                store.save_profiles(scan_id, result)
+            elif name == "image":
+                store.save_images(scan_id, result)
+
+    console.print(f"[dim]Ejecutando {len(renderers)} verificaciones en paralelo...[/dim]")
+    if profiles_view:
+        profiles_view.start()
+    try:
+        graph.run(on_complete=on_complete)
+    finally:
+        if profiles_view:
+            profiles_view.stop()
+    if store:
+        store.finish_scan(scan_id)
+        store.close()
 
     # --- Guia de Remediacion ---
-    combined = _merge_reports(all_reports)
-    if combined:
+    if all_reports:
         console.print()
         console.rule("[bold]Guia de Remediacion y Eliminacion de Datos[/bold]")
-        remediation.print_guide(combined)
+        remediation.print_guide(all_reports[0] if len(all_reports) == 1 else combined)
 
-    console.print()
 
+def _attach_password(report: CheckReport, password_result) -> CheckReport:
+    """Une el resultado del password al reporte de email."""
+    report.password_result = password_result
+    return report
 
-def _merge_reports(reports: list):
-    """Combina multiples reportes en uno para la guia de remediacion."""
-    if not reports:
-        return None
 
-    if len(reports) == 1:
-        return reports[0]
+def _new_deadline(seconds: float) -> Deadline | None:
+    """Crea el deadline de la verificacion (None si no hay limite)."""
+    return Deadline(seconds) if seconds and seconds > 0 else None
 
-    from models import CheckReport
-    combined = CheckReport(query="(multiples consultas)", query_type="email")
-    for r in reports:
-        combined.breaches.extend(r.breaches)
-        combined.infostealers.extend(r.infostealers)
-        combined.errors.extend(r.errors)
-        if r.password_result and not combined.password_result:
-            combined.password_result = r.password_result
-    return combined
+
+def _merge_into(combined: CheckReport, report: CheckReport) -> None:
+    """Agrega un reporte al reporte combinado."""
+    combined.add_breaches(report.breaches)
+    combined.add_infostealers(report.infostealers)
+    combined.errors.extend(report.errors)
+    combined.mark_missing(report.missing_providers)
+    if report.password_result and not combined.password_result:
+        combined.password_result = report.password_result
 
 
 if __name__ == "__main__":
     try:
         args = parse_args()
+        LATENCY.configure(
+            adaptive=args.adaptive_timeouts or None,
+            hedge=args.hedge or None,
+        )
 
         # Si no se paso ningun argumento, modo interactivo
         has_any = (
             args.email or args.username or args.phone
             or args.reverse_image or args.search_profiles or args.check_password
         )
-        if has_any:
+        if args.enqueue or args.queue_worker or args.collect:
+            queue_mode(args)
+        elif args.monitor:
+            monitor_mode(args)
+        elif args.batch:
+            batch_mode(args)
+        elif has_any:
             cli_mode(args)
         else:
             interactive_mode()
@@ -1,23 +1,80 @@
-"""Modelos de datos del proyecto."""
+"""Modelos de datos del proyecto.
 
+Los modelos usan __slots__ y los textos repetidos (nombres de brecha, tipos
+de datos, fuentes, fechas) se internan. Un BreachDetail es inmutable y se
+comparte entre todos los reportes que lo contienen (ver intern_breach).
+"""
+
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 
+from catalog import CATALOG
+from config import BREACH_POOL_SIZE
+
+
+def _intern(value):
+    """sys.intern para textos; otros tipos se dejan igual."""
+    return sys.intern(value) if isinstance(value, str) else value
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BreachDetail:
-    """Detalle de una brecha de seguridad."""
+    """Detalle de una brecha de seguridad (inmutable y compartido)."""
     source_api: str
     breach_name: str
     date: str = "Desconocida"
-    exposed_data: list[str] = field(default_factory=list)
+    exposed_data: tuple[str, ...] = ()
     risk_level: str = "medio"
     description: str = ""
     industry: str = ""
     logo_url: str = ""
 
+    def __post_init__(self):
+        set_ = object.__setattr__
+        set_(self, "source_api", _intern(self.source_api))
+        set_(self, "breach_name", _intern(self.breach_name))
+        set_(self, "date", _intern(self.date))
+        set_(self, "exposed_data", tuple(_intern(d) for d in self.exposed_data or ()))
+        set_(self, "risk_level", _intern(self.risk_level))
+        set_(self, "industry", _intern(self.industry))
+
+    @property
+    def canonical_id(self) -> str:
+        """ID canonico en el catalogo ("" si la brecha no tiene nombre)."""
+        return CATALOG.resolve(self.breach_name)
+
+
+# Pool de brechas: la misma brecha de la misma fuente es un unico objeto.
+# Acotado (LRU) para que el servidor y el monitor no crezcan sin limite.
+_BREACH_POOL: OrderedDict[BreachDetail, BreachDetail] = OrderedDict()
+_BREACH_POOL_LOCK = threading.Lock()
+
+
+def intern_breach(breach: BreachDetail) -> BreachDetail:
+    """Retorna la instancia compartida equivalente a breach.
+
+    Las brechas menos usadas salen del pool al superar BREACH_POOL_SIZE; los
+    reportes que ya las contienen no cambian, solo dejan de compartirse.
+    """
+    try:
+        hash(breach)
+    except TypeError:  # campo no hashable en una respuesta inesperada
+        return breach
+    with _BREACH_POOL_LOCK:
+        shared = _BREACH_POOL.get(breach)
+        if shared is not None:
+            _BREACH_POOL.move_to_end(breach)
+            return shared
+        _BREACH_POOL[breach] = breach
+        if len(_BREACH_POOL) > BREACH_POOL_SIZE:
+            _BREACH_POOL.popitem(last=False)
+        return breach
 
-@dataclass
+
+@dataclass(slots=True)
 class InfostealerDetail:
     """Detalle de una infeccion por infostealer (Hudson Rock)."""
     computer_name: str = ""
@@ -26,16 +83,31 @@ class InfostealerDetail:
     date_compromised: str = "Desconocida"
     antiviruses: str = ""
 
+    def __post_init__(self):
+        self.operating_system = _intern(self.operating_system)
+        self.date_compromised = _intern(self.date_compromised)
+        self.antiviruses = _intern(self.antiviruses)
+
 
-@dataclass
+@dataclass(slots=True)
 class PasswordResult:
     """Resultado de verificacion de password."""
     hibp_count: int = 0
     xon_count: int = 0
     is_compromised: bool = False
+    partial: bool = False  # alguna fuente no respondio (deadline o error)
+    missing_providers: list[str] = field(default_factory=list)
+    attempts: int = 0  # intentos HTTP (ver apis.retry.track_attempts)
+
+    def mark_missing(self, providers: list[str]) -> None:
+        """Marca el resultado como parcial por fuentes sin respuesta valida."""
+        for name in providers:
+            if name not in self.missing_providers:
+                self.missing_providers.append(name)
+        self.partial = self.partial or bool(providers)
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckReport:
     """Reporte completo de verificacion."""
     query: str
@@ -44,6 +116,49 @@ class CheckReport:
     infostealers: list[InfostealerDetail] = field(default_factory=list)
     password_result: Optional[PasswordResult] = None
     errors: list[str] = field(default_factory=list)
+    partial: bool = False  # el deadline expiro antes de que todos respondieran
+    missing_providers: list[str] = field(default_factory=list)
+    skipped_providers: list[str] = field(default_factory=list)  # modo rapido: ya habia respuesta decisiva
+
+    def __post_init__(self):
+        self.query_type = _intern(self.query_type)
+
+    def add_breaches(self, breaches) -> int:
+        """Agrega brechas omitiendo las ya presentes por ID canonico.
+
+        Returns:
+            Numero de brechas agregadas.
+        """
+        seen = {b.canonical_id for b in self.breaches}
+        added = 0
+        for breach in breaches:
+            canonical_id = breach.canonical_id
+            if canonical_id and canonical_id in seen:
+                continue
+            seen.add(canonical_id)
+            self.breaches.append(breach)
+            added += 1
+        return added
+
+    def add_infostealers(self, infostealers) -> int:
+        """Agrega infecciones omitiendo duplicadas (mismo equipo, fecha y ruta)."""
+        seen = {_infostealer_key(i) for i in self.infostealers}
+        added = 0
+        for info in infostealers:
+            key = _infostealer_key(info)
+            if key in seen:
+                continue
+            seen.add(key)
+            self.infostealers.append(info)
+            added += 1
+        return added
+
+    def mark_missing(self, providers: list[str]) -> None:
+        """Marca el reporte como parcial por proveedores sin respuesta."""
+        for name in providers:
+            if name not in self.missing_providers:
+                self.missing_providers.append(name)
+        self.partial = self.partial or bool(providers)
 
     @property
     def total_breaches(self) -> int:
@@ -62,3 +177,7 @@ class CheckReport:
         if self.total_breaches >= 1:
             return "medio"
         return "limpio"
+
+
+def _infostealer_key(info: InfostealerDetail) -> tuple:
+    return (info.computer_name, info.date_compromised, info.malware_path)
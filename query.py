@@ -0,0 +1,95 @@
+"""Consultas sobre escaneos guardados en la base SQLite de resultados."""
+
+import argparse
+import sys
+
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+from config import RESULTS_DB
+from storage import ResultStore, get_ledger
+
+console = Console()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Consulta los resultados guardados con main.py --db.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python query.py --db resultados.db scans
+  python query.py --db resultados.db breach adobe.com
+  python query.py --db resultados.db new
+  python query.py --db resultados.db identity correo@ejemplo.com
+  python query.py --db resultados.db errors --provider LeakCheck
+  python query.py quota
+        """,
+    )
+    parser.add_argument("--db", default=RESULTS_DB, help="Ruta a la base SQLite (default: RESULTS_DB)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("scans", help="Ultimos escaneos")
+
+    p = sub.add_parser("breach", help="Cuentas que aparecen en una brecha")
+    p.add_argument("name", help="Nombre o dominio de la brecha")
+
+    p = sub.add_parser("new", help="Exposiciones nuevas respecto a escaneos anteriores")
+    p.add_argument("--scan", type=int, help="ID del escaneo (default: el ultimo)")
+
+    p = sub.add_parser("identity", help="Historial de una identidad")
+    p.add_argument("identity")
+
+    sub.add_parser("quota", help="Cuota restante por proveedor en el periodo actual")
+
+    p = sub.add_parser("errors", help="Errores de proveedores")
+    p.add_argument("--provider", help="Filtrar por proveedor")
+
+    return parser.parse_args()
+
+
+def print_rows(title: str, rows: list[dict]) -> None:
+    """Imprime filas de una consulta como tabla."""
+    if not rows:
+        console.print(f"[yellow]{title}: sin resultados[/yellow]")
+        return
+    table = Table(title=f"{title} ({len(rows)})", box=box.ROUNDED, title_style="bold")
+    for column in rows[0]:
+        table.add_column(column)
+    for row in rows:
+        table.add_row(*("" if v is None else str(v) for v in row.values()))
+    console.print(table)
+
+
+def main() -> None:
+    args = parse_args()
+    if args.command == "quota":
+        ledger = get_ledger()
+        print_rows("Cuota por proveedor", [
+            {"proveedor": p, "limite": calls, "periodo": kind, "restante": ledger.remaining(p)}
+            for p, (calls, kind) in ledger.limits.items()
+        ])
+        return
+    if not args.db:
+        console.print("[red]Indica la base con --db o la variable RESULTS_DB.[/red]")
+        sys.exit(1)
+
+    store = ResultStore(args.db)
+    try:
+        if args.command == "scans":
+            print_rows("Escaneos", store.scans())
+        elif args.command == "breach":
+            print_rows(f"Cuentas en '{args.name}'", store.accounts_in_breach(args.name))
+        elif args.command == "new":
+            print_rows("Exposiciones nuevas", store.new_exposures(args.scan))
+        elif args.command == "identity":
+            print_rows(f"Historial de {args.identity}", store.identity_history(args.identity))
+        elif args.command == "errors":
+            print_rows("Errores de proveedores", store.provider_errors(args.provider))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 """Modulos de reporte y remediacion."""
 
-from .console_report import ConsoleReporter
+from .console_report import ConsoleReporter, LiveBatchView
 from .remediation import RemediationGuide
+from .json_report import report_to_dict, report_from_dict, password_to_dict
 
-__all__ = ["ConsoleReporter", "RemediationGuide"]
+__all__ = [
+    "ConsoleReporter", "LiveBatchView", "RemediationGuide", "report_to_dict", "report_from_dict", "password_to_dict",
+]
@@ -1,17 +1,98 @@
 """Reporte visual en consola usando Rich."""
 
-from rich.console import Console
+import threading
+from collections import deque
+
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
 
 from models import CheckReport
-from config import RISK_LEVELS
+from config import RISK_LEVELS, LIVE_MAX_ROWS
 
 console = Console()
 
 
+def _batch_table(title: str | None = None) -> Table:
+    table = Table(title=title, box=box.ROUNDED, title_style="bold")
+    table.add_column("Identidad", style="bold", max_width=40)
+    table.add_column("Tipo", max_width=10)
+    table.add_column("Brechas", justify="right")
+    table.add_column("Infostealers", justify="right")
+    table.add_column("Riesgo", justify="center", max_width=10)
+    table.add_column("Notas", max_width=30)
+    return table
+
+
+def _batch_row(report: CheckReport) -> tuple:
+    risk = report.overall_risk
+    risk_cfg = RISK_LEVELS[risk]
+    notes = []
+    if report.partial:
+        notes.append("parcial")
+    if report.skipped_providers:
+        notes.append("rapido")
+    if report.errors:
+        notes.append(f"{len(report.errors)} errores")
+    return (
+        report.query,
+        report.query_type,
+        str(report.total_breaches),
+        str(len(report.infostealers)),
+        Text(f"{risk_cfg['icon']} {risk.upper()}", style=risk_cfg["color"]),
+        ", ".join(notes),
+    )
+
+
+class LiveBatchView:
+    """Progreso en vivo de un lote: cada reporte aparece en cuanto esta listo.
+
+    Muestra el avance, cuantas identidades estan expuestas y las ultimas
+    max_rows filas terminadas (en orden de llegada). Es transitoria: al
+    cerrarse deja paso al resumen final del lote.
+    """
+
+    def __init__(self, total: int, max_rows: int = LIVE_MAX_ROWS):
+        self.total = total
+        self.max_rows = max_rows
+        self.done = 0
+        self.exposed = 0
+        self._rows: deque = deque(maxlen=max_rows)
+        self._lock = threading.Lock()
+        self._live = Live(self._render(), console=console, transient=True, refresh_per_second=4)
+
+    def add(self, report: CheckReport) -> None:
+        """Anade un reporte terminado (seguro entre hilos)."""
+        with self._lock:
+            self.done += 1
+            if report.total_breaches or report.has_infostealers:
+                self.exposed += 1
+            self._rows.append(_batch_row(report))
+            self._live.update(self._render())
+
+    def _render(self) -> Group:
+        header = (
+            f"[bold blue]Verificando identidades... {self.done}/{self.total}[/bold blue]"
+            f"  [bright_red]{self.exposed} expuestas[/bright_red]"
+        )
+        if not self._rows:
+            return Group(header)
+        table = _batch_table()
+        for row in self._rows:
+            table.add_row(*row)
+        return Group(header, table)
+
+    def __enter__(self):
+        self._live.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._live.stop()
+
+
 class ConsoleReporter:
     """Genera reportes visuales en la terminal."""
 
@@ -37,6 +118,35 @@ class ConsoleReporter:
             self._print_errors(report)
             console.print()
 
+    def print_batch_summary(self, reports: list[CheckReport]) -> None:
+        """Tabla resumen de una verificacion por lotes."""
+        table = _batch_table(f"Resumen del lote ({len(reports)} identidades)")
+        for report in reports:
+            table.add_row(*_batch_row(report))
+        console.print(table)
+
+    def print_delta(self, delta) -> None:
+        """Cambios de una identidad respecto al escaneo anterior (modo incremental)."""
+        lines = [f"[bold]{delta.identity}[/bold] [dim]({delta.query_type})[/dim]"]
+        if delta.new_breaches:
+            lines.append(f"  [red]+ {len(delta.new_breaches)} brechas nuevas:[/red] {', '.join(delta.new_breaches)}")
+        if delta.resolved_breaches:
+            lines.append(
+                f"  [green]- {len(delta.resolved_breaches)} brechas ya no aparecen:[/green] "
+                f"{', '.join(delta.resolved_breaches)}"
+            )
+        if delta.new_infostealers:
+            lines.append(
+                f"  [bold red]+ {len(delta.new_infostealers)} infostealers nuevos:[/bold red] "
+                f"{', '.join(delta.new_infostealers)}"
+            )
+        if delta.resolved_infostealers:
+            lines.append(
+                f"  [green]- {len(delta.resolved_infostealers)} infostealers ya no aparecen:[/green] "
+                f"{', '.join(delta.resolved_infostealers)}"
+            )
+        console.print("\n".join(lines))
+
     def _print_header(self, report: CheckReport) -> None:
         """Panel de resumen con nivel de riesgo."""
         risk = report.overall_risk
@@ -59,6 +169,15 @@ class ConsoleReporter:
                 summary_lines.append("[bold red]Password: COMPROMETIDO[/bold red]")
             else:
                 summary_lines.append("[bold green]Password: No encontrado en brechas[/bold green]")
+        if report.partial:
+            summary_lines.append(
+                f"[bold yellow]Resultado parcial, sin respuesta de:[/bold yellow] "
+                f"{', '.join(report.missing_providers)}"
+            )
+        if report.skipped_providers:
+            summary_lines.append(
+                f"[dim]Modo rapido, no se consulto:[/dim] {', '.join(report.skipped_providers)}"
+            )
 
         summary_text = "\n".join(summary_lines)
 
@@ -149,6 +268,15 @@ class ConsoleReporter:
                 lines.append("  XposedOrNot: encontrado en brechas")
             lines.append("\n[bold]Debes cambiar este password inmediatamente.[/bold]")
             panel_style = "red"
+            if pw.partial:
+                lines.append(f"[yellow]Sin respuesta de: {', '.join(pw.missing_providers)}[/yellow]")
+        elif pw.partial:
+            lines = [
+                "[bold yellow]Resultado no concluyente.[/bold yellow]",
+                f"Sin respuesta de: {', '.join(pw.missing_providers)}",
+                "Vuelve a verificarlo mas tarde.",
+            ]
+            panel_style = "yellow"
         else:
             lines = ["[bold green]Este password NO aparece en brechas conocidas.[/bold green]"]
             lines.append("Sin embargo, esto no garantiza que sea seguro.")
@@ -0,0 +1,88 @@
+"""Serializacion de resultados a JSON (API local y alertas)."""
+
+from models import BreachDetail, CheckReport, InfostealerDetail, PasswordResult, intern_breach
+
+
+def password_to_dict(result: PasswordResult) -> dict:
+    """PasswordResult como dict serializable."""
+    return {
+        "hibp_count": result.hibp_count,
+        "xon_count": result.xon_count,
+        "is_compromised": result.is_compromised,
+        "partial": result.partial,
+        "missing_providers": list(result.missing_providers),
+        "attempts": result.attempts,
+    }
+
+
+def breach_to_dict(breach: BreachDetail) -> dict:
+    """BreachDetail como dict serializable (incluye el ID canonico)."""
+    return {
+        "canonical_id": breach.canonical_id,
+        "breach_name": breach.breach_name,
+        "source_api": breach.source_api,
+        "date": breach.date,
+        "exposed_data": list(breach.exposed_data),
+        "risk_level": breach.risk_level,
+        "description": breach.description,
+        "industry": breach.industry,
+        "logo_url": breach.logo_url,
+    }
+
+
+def breach_from_dict(data: dict) -> BreachDetail:
+    """BreachDetail compartido a partir de breach_to_dict."""
+    return intern_breach(BreachDetail(
+        source_api=data["source_api"],
+        breach_name=data["breach_name"],
+        date=data["date"],
+        exposed_data=tuple(data["exposed_data"]),
+        risk_level=data["risk_level"],
+        description=data["description"],
+        industry=data["industry"],
+        logo_url=data["logo_url"],
+    ))
+
+
+def infostealer_to_dict(info: InfostealerDetail) -> dict:
+    """InfostealerDetail como dict serializable."""
+    return {
+        "computer_name": info.computer_name,
+        "operating_system": info.operating_system,
+        "malware_path": info.malware_path,
+        "date_compromised": info.date_compromised,
+        "antiviruses": info.antiviruses,
+    }
+
+
+def report_to_dict(report: CheckReport) -> dict:
+    """CheckReport como dict serializable, con el riesgo ya calculado."""
+    return {
+        "query": report.query,
+        "query_type": report.query_type,
+        "overall_risk": report.overall_risk,
+        "total_breaches": report.total_breaches,
+        "breaches": [breach_to_dict(b) for b in report.breaches],
+        "infostealers": [infostealer_to_dict(i) for i in report.infostealers],
+        "password_result": password_to_dict(report.password_result) if report.password_result else None,
+        "errors": list(report.errors),
+        "partial": report.partial,
+        "missing_providers": list(report.missing_providers),
+        "skipped_providers": list(report.skipped_providers),
+    }
+
+
+def report_from_dict(data: dict) -> CheckReport:
+    """Reconstruye un CheckReport a partir de report_to_dict (cola distribuida)."""
+    password = data.get("password_result")
+    return CheckReport(
+        query=data["query"],
+        query_type=data["query_type"],
+        breaches=[breach_from_dict(b) for b in data.get("breaches", ())],
+        infostealers=[InfostealerDetail(**i) for i in data.get("infostealers", ())],
+        password_result=PasswordResult(**password) if password else None,
+        errors=list(data.get("errors", ())),
+        partial=data.get("partial", False),
+        missing_providers=list(data.get("missing_providers", ())),
+        skipped_providers=list(data.get("skipped_providers", ())),
+    )
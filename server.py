@@ -0,0 +1,207 @@
+"""Servicio HTTP/JSON local que expone los verificadores con recursos compartidos.
+
+Todas las peticiones comparten el mismo proceso: la sesion HTTP con sus
+conexiones abiertas, la coalescencia de consultas en vuelo, el registro de
+cuota y las plataformas cargadas. Asi un portal interno puede consultar sin
+pagar el arranque del CLI ni nuevos handshakes TLS en cada busqueda.
+
+Endpoints:
+    GET  /health
+    GET  /metrics          limites de concurrencia, reintentos y latencias
+    GET  /check/email?q=correo@ejemplo.com[&deadline=2][&fast=1]
+    GET  /check/username?q=mi_usuario[&deadline=2][&fast=1]
+    GET  /check/phone?q=+34612345678[&deadline=2]
+    GET  /check/profiles?q=mi_usuario[&deadline=5]
+    POST /check/password   {"password": "...", "deadline": 2}
+
+Con fast=1 la verificacion se detiene en cuanto la identidad resulta expuesta
+(ver checkers.screening).
+"""
+
+import argparse
+import hmac
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from rich.console import Console
+
+from checkers import (
+    EmailChecker, UsernameChecker, PhoneChecker, PasswordChecker, ProfileChecker, ScreeningChecker,
+)
+from apis.latency import LATENCY
+from apis.retry import RETRY
+from apis.warmup import provider_urls, warm_up_background
+from checkers.profile_checker import PLATFORMS
+from config import SERVER_HOST, SERVER_PORT, SERVER_TOKEN
+from engine import CONCURRENCY, Deadline, DeadlineExceeded, run_background
+from reporting import report_to_dict, password_to_dict
+
+console = Console()
+
+MAX_BODY = 64 * 1024
+
+
+class CheckService:
+    """Verificadores de larga vida compartidos por todas las peticiones."""
+
+    def __init__(self):
+        self.email = EmailChecker()
+        self.username = UsernameChecker()
+        self.phone = PhoneChecker()
+        self.password = PasswordChecker()
+        self.profiles = ProfileChecker()
+        self.screening = ScreeningChecker()
+
+    def check(self, kind: str, query: str, deadline: Deadline | None, fast: bool = False) -> dict:
+        if fast and kind in ("email", "username"):
+            return report_to_dict(run_background(lambda: self.screening.check(kind, query, deadline=deadline)))
+        if kind == "email":
+            return report_to_dict(run_background(self.email.check, query, deadline))
+        if kind == "username":
+            return report_to_dict(run_background(self.username.check, query, deadline))
+        if kind == "phone":
+            return report_to_dict(run_background(self.phone.check, query, deadline))
+        if kind == "profiles":
+            return run_background(lambda: self.profiles.check(query, deadline=deadline))
+        if kind == "password":
+            return password_to_dict(run_background(self.password.check, query, deadline))
+        raise KeyError(kind)
+
+
+def _deadline(value) -> Deadline | None:
+    try:
+        seconds = float(value) if value not in (None, "") else 0
+    except (TypeError, ValueError):
+        raise ValueError("deadline debe ser un numero de segundos")
+    return Deadline(seconds) if seconds > 0 else None
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Traduce peticiones HTTP a llamadas al CheckService."""
+
+    service: CheckService
+    token: str = ""
+    server_version = "ExposedCheck"
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self) -> bool:
+        if not self.token:
+            return True
+        expected = f"Bearer {self.token}"
+        return hmac.compare_digest(self.headers.get("Authorization", ""), expected)
+
+    def _check(self, kind: str, query: str, deadline: Deadline | None, fast: bool = False) -> None:
+        """Ejecuta la verificacion y responde siempre con JSON (504/500 si falla)."""
+        try:
+            payload = self.service.check(kind, query, deadline, fast)
+        except DeadlineExceeded as e:
+            self._send(504, {"error": str(e)})
+            return
+        except Exception as e:
+            # El mensaje podria incluir la identidad consultada: solo el tipo
+            console.print(f"[red]Error en /check/{kind}: {type(e).__name__}[/red]")
+            self._send(500, {"error": f"error interno ({type(e).__name__})"})
+            return
+        self._send(200, payload)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/health":
+            self._send(200, {"status": "ok"})
+            return
+        if not self._authorized():
+            self._send(401, {"error": "no autorizado"})
+            return
+        if url.path == "/metrics":
+            self._send(200, {
+                "concurrency": CONCURRENCY.metrics(),
+                "retries": RETRY.stats(),
+                "latency": LATENCY.stats(),
+            })
+            return
+
+        kind = url.path.removeprefix("/check/")
+        if not url.path.startswith("/check/") or kind not in ("email", "username", "phone", "profiles"):
+            self._send(404, {"error": f"ruta desconocida: {url.path}"})
+            return
+
+        params = parse_qs(url.query)
+        query = params.get("q", [""])[0].strip()
+        if not query:
+            self._send(400, {"error": "falta el parametro q"})
+            return
+        try:
+            deadline = _deadline(params.get("deadline", [None])[0])
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+            return
+        fast = params.get("fast", ["0"])[0] in ("1", "true")
+        self._check(kind, query, deadline, fast)
+
+    def do_POST(self) -> None:
+        if not self._authorized():
+            self._send(401, {"error": "no autorizado"})
+            return
+        if urlparse(self.path).path != "/check/password":
+            self._send(404, {"error": f"ruta desconocida: {self.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0 or length > MAX_BODY:
+            self._send(400, {"error": "cuerpo JSON requerido"})
+            return
+        try:
+            data = json.loads(self.rfile.read(length))
+            password = data["password"]
+            deadline = _deadline(data.get("deadline"))
+        except (ValueError, KeyError, TypeError):
+            self._send(400, {"error": 'se esperaba {"password": "..."}'})
+            return
+        if not isinstance(password, str) or not password:
+            self._send(400, {"error": "password vacio"})
+            return
+        self._check("password", password, deadline)
+
+    def log_message(self, format: str, *args) -> None:
+        # Solo metodo y ruta sin query string: nunca registrar identidades
+        console.print(f"[dim]{self.address_string()} {self.command} {urlparse(self.path).path}[/dim]")
+
+
+def make_server(host: str = SERVER_HOST, port: int = SERVER_PORT, token: str = SERVER_TOKEN) -> ThreadingHTTPServer:
+    """Crea el servidor con un CheckService compartido."""
+    handler = type("BoundHandler", (Handler,), {"service": CheckService(), "token": token})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON local de ExposedCheck.")
+    parser.add_argument("--host", default=SERVER_HOST, help=f"Interfaz (default: {SERVER_HOST})")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help=f"Puerto (default: {SERVER_PORT})")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port)
+    # DNS y conexiones en caliente antes de las primeras consultas
+    warm_up_background(provider_urls() + [template for _, template, _ in PLATFORMS])
+    console.print(f"[bold]ExposedCheck API escuchando en http://{args.host}:{args.port}[/bold]")
+    if not SERVER_TOKEN:
+        console.print("[yellow]SERVER_TOKEN no definido: cualquier proceso local puede consultar.[/yellow]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Servicio detenido.[/yellow]")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""Persistencia local de resultados."""
+
+from .store import ResultStore
+from .incremental import IncrementalTracker, ReportDelta
+from .quota import QuotaLedger, get_ledger, quota_error
+from .journal import CheckpointJournal
+from .ratelimit import RateLimiter, get_limiter
+from .profile_cache import ProfileCache, get_profile_cache
+from .queue import WorkQueue, SQLiteQueue, open_queue, register_broker
+
+__all__ = [
+    "ResultStore", "IncrementalTracker", "ReportDelta", "QuotaLedger", "get_ledger", "quota_error",
+    "CheckpointJournal", "RateLimiter", "get_limiter", "ProfileCache", "get_profile_cache",
+    "WorkQueue", "SQLiteQueue", "open_queue", "register_broker",
+]
@@ -0,0 +1,101 @@
+"""Re-escaneo incremental: solo los cambios desde la ejecucion anterior."""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+
+from models import CheckReport
+from .store import ResultStore, _error_provider
+
+# Proveedores consultados por tipo de identidad
+PROVIDERS_BY_TYPE = {
+    "email": ("XposedOrNot", "LeakCheck", "Hudson Rock"),
+    "username": ("Hudson Rock", "LeakCheck"),
+    "phone": ("BreachDirectory",),
+}
+INFOSTEALER_PROVIDER = "Hudson Rock"
+
+
+@dataclass(slots=True)
+class ReportDelta:
+    """Diferencias de un reporte respecto al ultimo escaneo guardado."""
+    identity: str
+    query_type: str
+    first_scan: bool = False
+    new_breaches: list[str] = field(default_factory=list)
+    resolved_breaches: list[str] = field(default_factory=list)
+    new_infostealers: list[str] = field(default_factory=list)
+    resolved_infostealers: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(
+            self.new_breaches or self.resolved_breaches
+            or self.new_infostealers or self.resolved_infostealers
+        )
+
+
+def report_items(report: CheckReport) -> dict[str, dict[str, str]]:
+    """Items del reporte por proveedor: clave estable -> etiqueta legible."""
+    items: dict[str, dict[str, str]] = {p: {} for p in PROVIDERS_BY_TYPE.get(report.query_type, ())}
+    for breach in report.breaches:
+        key = breach.canonical_id or f"?{breach.breach_name}|{breach.date}"
+        items.setdefault(breach.source_api, {})[key] = breach.breach_name
+    for info in report.infostealers:
+        key = f"{info.computer_name}|{info.date_compromised}|{info.malware_path}"
+        label = f"{info.computer_name or 'N/A'} ({info.date_compromised})"
+        items.setdefault(INFOSTEALER_PROVIDER, {})[key] = label
+    return items
+
+
+def fingerprint(items: dict[str, str]) -> str:
+    """Huella compacta de un conjunto de items."""
+    return hashlib.sha1("\n".join(sorted(items)).encode()).hexdigest()
+
+
+class IncrementalTracker:
+    """Compara cada reporte con la huella guardada por (identidad, proveedor)."""
+
+    def __init__(self, store: ResultStore):
+        self.store = store
+
+    def compare(self, report: CheckReport) -> ReportDelta:
+        """Calcula el delta y actualiza las huellas de los proveedores que respondieron.
+
+        Los proveedores con error, sin respuesta u omitidos en modo rapido
+        conservan su huella anterior, para no reportar como resueltas brechas
+        que simplemente no se consultaron.
+        """
+        delta = ReportDelta(identity=report.query, query_type=report.query_type)
+        failed = (
+            set(report.missing_providers) | set(report.skipped_providers)
+            | {_error_provider(e) for e in report.errors}
+        )
+        previous = self.store.fingerprints(report.query, report.query_type)
+        delta.first_scan = not previous
+
+        answered = {p: cur for p, cur in report_items(report).items() if p not in failed}
+        old_items = {p: json.loads(items) for p, (_, items) in previous.items()}
+        # Un item que solo cambia de proveedor (p. ej. por deduplicacion) no es nuevo
+        known = {key for items in old_items.values() for key in items}
+        found = {key for items in answered.values() for key in items}
+
+        updates = {}
+        for provider, current in answered.items():
+            fp = fingerprint(current)
+            if fp == previous.get(provider, ("", ""))[0]:
+                continue
+            old = old_items.get(provider, {})
+            new_labels = [label for key, label in current.items() if key not in known]
+            gone_labels = [label for key, label in old.items() if key not in found]
+            if provider == INFOSTEALER_PROVIDER:
+                delta.new_infostealers.extend(new_labels)
+                delta.resolved_infostealers.extend(gone_labels)
+            else:
+                delta.new_breaches.extend(new_labels)
+                delta.resolved_breaches.extend(gone_labels)
+            updates[provider] = (fp, json.dumps(current))
+
+        if updates:
+            self.store.save_fingerprints(report.query, report.query_type, updates)
+        return delta
@@ -0,0 +1,116 @@
+"""Journal de checkpoints para reanudar lotes interrumpidos.
+
+Cada unidad terminada (identidad, proveedor) se anade como una linea JSON
+con su resultado ya parseado. Al relanzar un lote con el mismo ID se releen
+los journals y solo se consultan las unidades que faltan o fallaron, sin
+volver a gastar cuota en las demas.
+
+Cada proceso escribe su propio archivo (journal-<pid>.jsonl) dentro del
+directorio del trabajo, asi que no hacen falta bloqueos entre procesos. Las
+escrituras se sincronizan a disco por tandas (JOURNAL_FSYNC_EVERY entradas o
+JOURNAL_FSYNC_SECONDS); tras un corte se pierde como mucho la ultima tanda,
+que simplemente se vuelve a consultar.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+from config import JOBS_DIR, JOURNAL_FSYNC_EVERY, JOURNAL_FSYNC_SECONDS
+from reporting.json_report import breach_from_dict, breach_to_dict, infostealer_to_dict
+from models import InfostealerDetail
+
+
+def _unit_to_dict(query_type: str, identity: str, provider: str, result: dict) -> dict:
+    return {
+        "type": query_type,
+        "identity": identity,
+        "provider": provider,
+        "breaches": [breach_to_dict(b) for b in result.get("breaches", ())],
+        "infostealers": [infostealer_to_dict(i) for i in result.get("infostealers", ())],
+    }
+
+
+def _result_from_dict(data: dict) -> dict:
+    return {
+        "breaches": [breach_from_dict(b) for b in data["breaches"]],
+        "infostealers": [InfostealerDetail(**i) for i in data["infostealers"]],
+        "error": None,
+    }
+
+
+class CheckpointJournal:
+    """Unidades (identidad, proveedor) terminadas de un trabajo por lotes."""
+
+    def __init__(self, job_id: str, directory: str = JOBS_DIR):
+        if not re.fullmatch(r"[\w.-]+", job_id):
+            raise ValueError(f"ID de trabajo invalido: {job_id!r} (usa letras, numeros, '.', '_' o '-')")
+        self.job_id = job_id
+        self.path = os.path.join(directory, job_id)
+        os.makedirs(self.path, exist_ok=True)
+        self._units: dict[tuple[str, str], dict[str, dict]] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._pending = 0
+        self._synced_at = time.monotonic()
+        self.replayed = self._replay()
+
+    def _replay(self) -> int:
+        """Carga todas las unidades registradas; ignora lineas incompletas."""
+        count = 0
+        for name in sorted(os.listdir(self.path)):
+            if not name.endswith(".jsonl"):
+                continue
+            with open(os.path.join(self.path, name), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        data = json.loads(line)
+                        result = _result_from_dict(data)
+                    except (ValueError, KeyError, TypeError):
+                        continue  # ultima linea cortada por el corte
+                    key = (data["type"], data["identity"])
+                    self._units.setdefault(key, {})[data["provider"]] = result
+                    count += 1
+        return count
+
+    def completed(self, query_type: str, identity: str) -> dict[str, dict]:
+        """Resultados ya registrados para la identidad, por proveedor."""
+        with self._lock:
+            return dict(self._units.get((query_type, identity), {}))
+
+    def record(self, query_type: str, identity: str, provider: str, result: dict) -> None:
+        """Anade una unidad terminada; sincroniza a disco por tandas."""
+        line = json.dumps(_unit_to_dict(query_type, identity, provider, result), ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                name = f"journal-{os.getpid()}.jsonl"
+                self._file = open(os.path.join(self.path, name), "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._units.setdefault((query_type, identity), {})[provider] = result
+            self._pending += 1
+            if (
+                self._pending >= JOURNAL_FSYNC_EVERY
+                or time.monotonic() - self._synced_at >= JOURNAL_FSYNC_SECONDS
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        if self._file is not None and self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._synced_at = time.monotonic()
+
+    def sync(self) -> None:
+        """Fuerza la escritura a disco de las entradas pendientes."""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
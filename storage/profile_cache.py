@@ -0,0 +1,120 @@
+"""Cache persistente de la busqueda de perfiles.
+
+La existencia de una cuenta en GitHub o Reddit rara vez cambia en un dia,
+asi que cada sonda se guarda por (plataforma, username) con un TTL segun el
+resultado: largo para "encontrado" y "no encontrado", corto para errores.
+Barridos repetidos sobre los mismos usernames solo vuelven a consultar las
+entradas caducadas.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from config import PROFILE_CACHE_DB, PROFILE_CACHE_TTL
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profile_cache (
+    platform TEXT NOT NULL,
+    username TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    url TEXT NOT NULL,
+    error TEXT,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (platform, username)
+);
+"""
+
+
+def outcome_of(result: dict) -> str:
+    """"found", "not_found" o "error" segun el resultado de una sonda."""
+    if result["error"]:
+        return "error"
+    return "found" if result["found"] else "not_found"
+
+
+class ProfileCache:
+    """Resultados de sondas de perfiles con caducidad por tipo de resultado.
+
+    El username se usa tal cual como clave: quien llama debe normalizarlo.
+    """
+
+    def __init__(self, path: str = PROFILE_CACHE_DB, ttls: dict[str, int] | None = None):
+        self.path = path
+        self.ttls = dict(PROFILE_CACHE_TTL if ttls is None else ttls)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_many(self, username: str) -> dict[str, dict]:
+        """Resultados vigentes del username, por plataforma."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT platform, outcome, url, error FROM profile_cache "
+                "WHERE username = ? AND expires_at > ?",
+                (username, time.time()),
+            ).fetchall()
+        return {
+            platform: {
+                "platform": platform,
+                "url": url,
+                "found": outcome == "found",
+                "error": error,
+                "cached": True,
+            }
+            for platform, outcome, url, error in rows
+        }
+
+    def put_many(self, username: str, results: list[dict]) -> None:
+        """Guarda los resultados de sondas recien hechas."""
+        now = time.time()
+        rows = []
+        for r in results:
+            outcome = outcome_of(r)
+            ttl = self.ttls.get(outcome, 0)
+            if ttl > 0:
+                rows.append((r["platform"], username, outcome, r["url"], r["error"], now + ttl))
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO profile_cache VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def purge(self) -> int:
+        """Borra las entradas caducadas; retorna cuantas."""
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "DELETE FROM profile_cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+
+_cache: ProfileCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> ProfileCache | None:
+    """Cache compartido del proceso, o None si PROFILE_CACHE_DB esta vacio."""
+    global _cache
+    if not PROFILE_CACHE_DB:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ProfileCache()
+        return _cache
+
+
+def _reset_after_fork() -> None:
+    # Una conexion SQLite no debe cruzar un fork: cada hijo abre la suya
+    global _cache
+    _cache = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
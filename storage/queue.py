@@ -0,0 +1,198 @@
+"""Cola de trabajo durable para repartir un lote entre varias maquinas.
+
+El coordinador encola identidades; los workers (en uno o varios hosts, cada
+uno con su propia IP de salida) reclaman trabajos con un lease, los verifican
+y devuelven el reporte. Un trabajo cuyo lease expira vuelve a estar
+disponible, y solo el primer resultado de cada trabajo se guarda, asi que
+repetir una entrega no duplica nada. Un worker puede devolver un trabajo
+incompleto con not_before para que nadie lo reclame antes de esa hora.
+
+El broker es intercambiable: open_queue() elige la implementacion por el
+esquema de la URL ("sqlite:///ruta/cola.db" o una ruta simple). SQLiteQueue
+sirve como broker local o sobre un volumen compartido; otros brokers se
+registran con register_broker().
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    query_type TEXT NOT NULL,
+    identity TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL,
+    result TEXT,
+    finished_at REAL,
+    UNIQUE (batch, query_type, identity)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs(batch, status, priority DESC, id);
+"""
+
+
+class Job(NamedTuple):
+    """Trabajo reclamado por un worker."""
+    id: int
+    query_type: str
+    identity: str
+    priority: int
+    attempts: int = 1  # reclamos, incluido este
+
+
+class WorkQueue(ABC):
+    """Interfaz de un broker de trabajos."""
+
+    @abstractmethod
+    def enqueue(self, items, batch: str = "default") -> int:
+        """Encola (query_type, identidad, prioridad); retorna cuantos son nuevos."""
+
+    @abstractmethod
+    def claim(self, worker: str, limit: int, lease_seconds: float, batch: str = "default") -> list[Job]:
+        """Reclama hasta limit trabajos pendientes o con lease vencido."""
+
+    @abstractmethod
+    def complete(self, job_id: int, worker: str, result: dict) -> bool:
+        """Guarda el resultado; False si el trabajo ya estaba terminado."""
+
+    @abstractmethod
+    def release(self, job_id: int, worker: str, not_before: float | None = None) -> None:
+        """Devuelve un trabajo a la cola sin resultado.
+
+        Con not_before (epoch) el trabajo no se vuelve a reclamar antes de esa hora.
+        """
+
+    @abstractmethod
+    def results(self, batch: str = "default") -> list[dict]:
+        """Resultados terminados en orden de encolado."""
+
+    @abstractmethod
+    def counts(self, batch: str = "default") -> dict[str, int]:
+        """Trabajos por estado (pending, deferred, leased, done)."""
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteQueue(WorkQueue):
+    """Broker sobre un archivo SQLite; los reclamos usan BEGIN IMMEDIATE."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "not_before" not in columns:
+            # Colas creadas por versiones anteriores (otro worker puede migrarla a la vez)
+            try:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN not_before REAL")
+            except sqlite3.OperationalError:
+                pass
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def enqueue(self, items, batch: str = "default") -> int:
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs (batch, query_type, identity, priority) VALUES (?, ?, ?, ?)",
+                [(batch, query_type, identity, priority) for query_type, identity, priority in items],
+            )
+            self._conn.execute("COMMIT")
+            return self._conn.total_changes - before
+
+    def claim(self, worker: str, limit: int, lease_seconds: float, batch: str = "default") -> list[Job]:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT id, query_type, identity, priority, attempts + 1 FROM jobs "
+                    "WHERE batch = ? AND ("
+                    "  (status = 'pending' AND (not_before IS NULL OR not_before <= ?))"
+                    "  OR (status = 'leased' AND lease_until < ?)"
+                    ") ORDER BY priority DESC, id LIMIT ?",
+                    (batch, now, now, limit),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE jobs SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1 "
+                    "WHERE id = ?",
+                    [(worker, now + lease_seconds, row[0]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [Job(*row) for row in rows]
+
+    def complete(self, job_id: int, worker: str, result: dict) -> bool:
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = 'done', worker = ?, result = ?, finished_at = ?, lease_until = NULL "
+                "WHERE id = ? AND status != 'done'",
+                (worker, json.dumps(result, ensure_ascii=False), time.time(), job_id),
+            )
+            return cur.rowcount == 1
+
+    def release(self, job_id: int, worker: str, not_before: float | None = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'pending', lease_until = NULL, not_before = ? "
+                "WHERE id = ? AND status = 'leased' AND worker = ?",
+                (not_before, job_id, worker),
+            )
+
+    def results(self, batch: str = "default") -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT result FROM jobs WHERE batch = ? AND status = 'done' ORDER BY id", (batch,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def counts(self, batch: str = "default") -> dict[str, int]:
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT CASE "
+                "  WHEN status = 'leased' AND lease_until < ? THEN 'pending' "
+                "  WHEN status = 'pending' AND not_before > ? THEN 'deferred' "
+                "  ELSE status END, "
+                "COUNT(*) FROM jobs WHERE batch = ? GROUP BY 1",
+                (now, now, batch),
+            ).fetchall()
+        counts = {"pending": 0, "deferred": 0, "leased": 0, "done": 0}
+        counts.update(dict(rows))
+        return counts
+
+
+BROKERS: dict[str, type[WorkQueue]] = {"sqlite": SQLiteQueue}
+
+
+def register_broker(scheme: str, cls: type[WorkQueue]) -> None:
+    """Registra un broker para URLs "scheme://..." (su constructor recibe el resto)."""
+    BROKERS[scheme] = cls
+
+
+def open_queue(url: str) -> WorkQueue:
+    """Abre la cola indicada por url; sin esquema se asume un archivo SQLite."""
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return SQLiteQueue(url)
+    if scheme not in BROKERS:
+        raise ValueError(f"Broker desconocido: {scheme} (disponibles: {', '.join(BROKERS)})")
+    if scheme == "sqlite":
+        rest = rest[1:] if rest.startswith("/") else rest
+    return BROKERS[scheme](rest)
@@ -0,0 +1,202 @@
+"""Registro persistente de cuota por proveedor y periodo de facturacion.
+
+El registro vive en una ruta fija por usuario (STATE_DIR), asi que todas las
+ejecuciones comparten la cuota sin importar el directorio de trabajo. Para
+priorizar lotes se guarda cuando se consulto cada identidad, pero nunca la
+identidad en claro: solo un HMAC con una clave aleatoria propia del registro.
+"""
+
+import hashlib
+import hmac
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from config import PROVIDER_BUDGETS, QUOTA_LEDGER_DB
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota (
+    provider TEXT NOT NULL,
+    period TEXT NOT NULL,
+    spent INTEGER NOT NULL,
+    PRIMARY KEY (provider, period)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS identity_checks (
+    provider TEXT NOT NULL,
+    identity_hash TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (provider, identity_hash)
+);
+-- Versiones anteriores guardaban las identidades en claro
+DROP TABLE IF EXISTS last_checked;
+"""
+
+
+def _period(kind: str, now: float) -> str:
+    """Etiqueta del periodo de facturacion que contiene now (UTC)."""
+    dt = datetime.fromtimestamp(now, timezone.utc)
+    return dt.strftime("%Y-%m") if kind == "month" else dt.strftime("%Y-%m-%d")
+
+
+def _next_period_start(kind: str, now: float) -> float:
+    """Inicio (epoch) del siguiente periodo de facturacion."""
+    dt = datetime.fromtimestamp(now, timezone.utc)
+    if kind == "month":
+        year, month = (dt.year + 1, 1) if dt.month == 12 else (dt.year, dt.month + 1)
+        return datetime(year, month, 1, tzinfo=timezone.utc).timestamp()
+    return datetime(dt.year, dt.month, dt.day, tzinfo=timezone.utc).timestamp() + 86400
+
+
+class QuotaLedger:
+    """Llamadas gastadas por proveedor y periodo, compartidas entre ejecuciones.
+
+    Los proveedores sin limite en PROVIDER_BUDGETS no se contabilizan. Las
+    reservas usan transacciones IMMEDIATE, asi que varios procesos pueden
+    compartir el mismo archivo sin pasarse del limite.
+    """
+
+    def __init__(self, path: str = QUOTA_LEDGER_DB, limits: dict[str, tuple[int, str]] | None = None):
+        self.path = path
+        self.limits = dict(PROVIDER_BUDGETS if limits is None else limits)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.executescript(SCHEMA)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO meta VALUES ('identity_key', ?)", (secrets.token_bytes(32),)
+        )
+        self._key = self._conn.execute("SELECT value FROM meta WHERE name = 'identity_key'").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _digest(self, identity: str) -> str:
+        """HMAC de identity: permite reconocerla sin guardarla en claro."""
+        return hmac.new(self._key, identity.encode(), hashlib.sha256).hexdigest()
+
+    def _spent(self, provider: str, period: str) -> int:
+        row = self._conn.execute(
+            "SELECT spent FROM quota WHERE provider = ? AND period = ?", (provider, period)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self, provider: str) -> int | None:
+        """Llamadas disponibles en el periodo actual (None = sin limite)."""
+        if provider not in self.limits:
+            return None
+        calls, kind = self.limits[provider]
+        with self._lock:
+            return max(0, calls - self._spent(provider, _period(kind, time.time())))
+
+    def reserve(self, provider: str, identity: str = "") -> bool:
+        """Gasta una llamada si queda cuota. Registra (como HMAC) cuando se consulto identity."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if provider in self.limits:
+                    calls, kind = self.limits[provider]
+                    period = _period(kind, now)
+                    if self._spent(provider, period) >= calls:
+                        self._conn.execute("ROLLBACK")
+                        return False
+                    self._conn.execute(
+                        "INSERT INTO quota VALUES (?, ?, 1) "
+                        "ON CONFLICT(provider, period) DO UPDATE SET spent = spent + 1",
+                        (provider, period),
+                    )
+                if identity:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO identity_checks VALUES (?, ?, ?)",
+                        (provider, self._digest(identity), now),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return True
+
+    def refund(self, provider: str) -> None:
+        """Devuelve una llamada reservada que no llego a enviarse."""
+        if provider not in self.limits:
+            return
+        with self._lock:
+            self._conn.execute(
+                "UPDATE quota SET spent = MAX(spent - 1, 0) WHERE provider = ? AND period = ?",
+                (provider, _period(self.limits[provider][1], time.time())),
+            )
+
+    def exhaust(self, provider: str) -> None:
+        """Marca la cuota del periodo como agotada (el proveedor respondio 429)."""
+        if provider not in self.limits:
+            return
+        calls, kind = self.limits[provider]
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO quota VALUES (?, ?, ?) "
+                "ON CONFLICT(provider, period) DO UPDATE SET spent = MAX(spent, excluded.spent)",
+                (provider, _period(kind, time.time()), calls),
+            )
+
+    def next_available(self, providers) -> float:
+        """Instante (epoch) en que todos los proveedores vuelven a tener cuota."""
+        now = time.time()
+        ready = now
+        for provider in providers:
+            if self.remaining(provider) == 0:
+                ready = max(ready, _next_period_start(self.limits[provider][1], now))
+        return ready
+
+    def last_checked(self, provider: str, identity: str) -> float | None:
+        """Ultima vez (epoch) que se consulto identity en provider."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT checked_at FROM identity_checks WHERE provider = ? AND identity_hash = ?",
+                (provider, self._digest(identity)),
+            ).fetchone()
+        return row[0] if row else None
+
+
+_ledger: QuotaLedger | None = None
+_ledger_lock = threading.Lock()
+
+
+def get_ledger() -> QuotaLedger:
+    """Ledger compartido del proceso (se abre al primer uso)."""
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = QuotaLedger()
+        return _ledger
+
+
+def _reset_after_fork() -> None:
+    # Una conexion SQLite no debe cruzar un fork: cada hijo abre la suya
+    global _ledger
+    _ledger = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def quota_error(provider: str, identity: str = "") -> str | None:
+    """Reserva una llamada; retorna el mensaje de error si no queda cuota.
+
+    Si la consulta se cancela antes de enviar la peticion (deadline agotado
+    esperando turno, fallo de conexion), el llamador la devuelve con
+    QuotaLedger.refund.
+    """
+    ledger = get_ledger()
+    if ledger.reserve(provider, identity):
+        return None
+    calls, kind = ledger.limits[provider]
+    period = "mes" if kind == "month" else "dia"
+    return f"{provider}: Cuota agotada ({calls}/{period}), consulta omitida"
@@ -0,0 +1,110 @@
+"""Limite de velocidad por proveedor compartido entre procesos.
+
+Los turnos de cada proveedor se reservan en SQLite. Todos los procesos
+que abren el mismo archivo (copias del CLI, procesos de --processes, workers
+de la cola en el mismo host) reservan de la misma agenda, asi que juntos
+pueden llegar al limite pero no superarlo.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from config import PROVIDER_RATE_LIMITS, RATE_LIMIT_DB
+from engine.deadline import DeadlineExceeded, current_deadline
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_slots (
+    provider TEXT PRIMARY KEY,
+    next_at REAL NOT NULL
+);
+"""
+
+
+class RateLimiter:
+    """Reparte turnos espaciados por proveedor en un archivo SQLite.
+
+    Un limite (llamadas, segundos) se traduce en un turno cada
+    segundos / llamadas: cada acquire() reserva el siguiente turno libre y
+    espera hasta el. Asi ninguna ventana de esos segundos contiene mas de
+    las llamadas permitidas, sin importar cuantos procesos compartan el
+    archivo. Los proveedores sin entrada en limits no se limitan. Se usa
+    time.time() (reloj de pared) porque el estado se comparte entre procesos.
+    """
+
+    def __init__(self, path: str = RATE_LIMIT_DB, limits: dict[str, tuple[int, float]] | None = None):
+        self.path = path
+        self.limits = dict(PROVIDER_RATE_LIMITS if limits is None else limits)
+        self.waited = 0.0  # segundos esperados por este proceso
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _reserve(self, provider: str, max_wait: float | None) -> float | None:
+        """Reserva el siguiente turno; retorna la espera o None si supera max_wait."""
+        calls, per = self.limits[provider]
+        interval = per / calls
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT next_at FROM rate_slots WHERE provider = ?", (provider,)
+                ).fetchone()
+                slot = max(now, row[0]) if row else now
+                if max_wait is not None and slot - now >= max_wait:
+                    self._conn.execute("ROLLBACK")
+                    return None
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_slots VALUES (?, ?)", (provider, slot + interval)
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return slot - now
+
+    def acquire(self, provider: str) -> None:
+        """Espera hasta el turno de la siguiente llamada a provider.
+
+        Si hay un deadline activo y el turno no cabe en el tiempo restante
+        se lanza DeadlineExceeded sin reservarlo.
+        """
+        if provider not in self.limits:
+            return
+        deadline = current_deadline()
+        wait = self._reserve(provider, deadline.remaining() if deadline is not None else None)
+        if wait is None:
+            raise DeadlineExceeded(f"{provider}: limite de velocidad, sin tiempo para esperar")
+        if wait > 0:
+            self.waited += wait
+            time.sleep(wait)
+
+
+_limiter: RateLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    """Limitador compartido del proceso (se abre al primer uso)."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
+
+
+def _reset_after_fork() -> None:
+    # Una conexion SQLite no debe cruzar un fork: cada hijo abre la suya
+    global _limiter
+    _limiter = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,299 @@
+"""Almacen SQLite de resultados con consultas indexadas sobre escaneos previos."""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+from catalog import CATALOG
+from models import CheckReport
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    mode TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT
+);
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    identity TEXT NOT NULL,
+    query_type TEXT NOT NULL,
+    risk TEXT NOT NULL,
+    partial INTEGER NOT NULL DEFAULT 0,
+    missing_providers TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS breaches (
+    report_id INTEGER NOT NULL REFERENCES reports(id),
+    canonical_id TEXT NOT NULL,
+    breach_name TEXT NOT NULL,
+    source_api TEXT NOT NULL,
+    date TEXT,
+    risk_level TEXT,
+    exposed_data TEXT
+);
+CREATE TABLE IF NOT EXISTS infostealers (
+    report_id INTEGER NOT NULL REFERENCES reports(id),
+    computer_name TEXT,
+    operating_system TEXT,
+    malware_path TEXT,
+    date_compromised TEXT,
+    antiviruses TEXT
+);
+CREATE TABLE IF NOT EXISTS password_results (
+    report_id INTEGER NOT NULL REFERENCES reports(id),
+    hibp_count INTEGER NOT NULL,
+    xon_count INTEGER NOT NULL,
+    is_compromised INTEGER NOT NULL,
+    partial INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS errors (
+    report_id INTEGER NOT NULL REFERENCES reports(id),
+    provider TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profile_hits (
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    username TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    url TEXT NOT NULL,
+    found INTEGER NOT NULL,
+    error TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS image_results (
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    source TEXT NOT NULL,
+    type TEXT NOT NULL,
+    temp_url TEXT,
+    search_urls TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    identity TEXT NOT NULL,
+    query_type TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    items TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (identity, query_type, provider)
+);
+
+CREATE INDEX IF NOT EXISTS idx_reports_identity ON reports(identity, scan_id);
+CREATE INDEX IF NOT EXISTS idx_reports_scan ON reports(scan_id);
+CREATE INDEX IF NOT EXISTS idx_reports_created ON reports(created_at);
+CREATE INDEX IF NOT EXISTS idx_breaches_report ON breaches(report_id);
+CREATE INDEX IF NOT EXISTS idx_breaches_canonical ON breaches(canonical_id);
+CREATE INDEX IF NOT EXISTS idx_breaches_provider ON breaches(source_api);
+CREATE INDEX IF NOT EXISTS idx_breaches_date ON breaches(date);
+CREATE INDEX IF NOT EXISTS idx_infostealers_report ON infostealers(report_id);
+CREATE INDEX IF NOT EXISTS idx_errors_report ON errors(report_id);
+CREATE INDEX IF NOT EXISTS idx_errors_provider ON errors(provider);
+CREATE INDEX IF NOT EXISTS idx_profiles_username ON profile_hits(username, scan_id);
+CREATE INDEX IF NOT EXISTS idx_profiles_platform ON profile_hits(platform);
+CREATE INDEX IF NOT EXISTS idx_images_scan ON image_results(scan_id);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _error_provider(message: str) -> str:
+    """Proveedor de un error con formato "Proveedor: detalle"."""
+    provider, sep, _ = message.partition(":")
+    return provider.strip() if sep and len(provider) <= 40 else ""
+
+
+class ResultStore:
+    """Guarda reportes, perfiles e imagenes en SQLite y permite consultarlos."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # --- Escritura ---
+
+    def start_scan(self, mode: str) -> int:
+        """Registra un nuevo escaneo y retorna su ID."""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO scans (mode, started_at) VALUES (?, ?)", (mode, _now())
+            )
+            return cur.lastrowid
+
+    def finish_scan(self, scan_id: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE scans SET finished_at = ? WHERE id = ?", (_now(), scan_id))
+
+    def save_report(self, scan_id: int, report: CheckReport) -> int:
+        """Guarda un CheckReport completo. El password nunca se almacena."""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO reports (scan_id, identity, query_type, risk, partial, missing_providers, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    scan_id, report.query, report.query_type, report.overall_risk,
+                    int(report.partial), ",".join(report.missing_providers), _now(),
+                ),
+            )
+            report_id = cur.lastrowid
+            self._conn.executemany(
+                "INSERT INTO breaches VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        report_id, b.canonical_id, b.breach_name, b.source_api,
+                        str(b.date), b.risk_level, ",".join(map(str, b.exposed_data)),
+                    )
+                    for b in report.breaches
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO infostealers VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        report_id, i.computer_name, i.operating_system,
+                        i.malware_path, str(i.date_compromised), str(i.antiviruses),
+                    )
+                    for i in report.infostealers
+                ],
+            )
+            if report.password_result:
+                pw = report.password_result
+                self._conn.execute(
+                    "INSERT INTO password_results VALUES (?, ?, ?, ?, ?)",
+                    (report_id, pw.hibp_count, pw.xon_count, int(pw.is_compromised), int(pw.partial)),
+                )
+            self._conn.executemany(
+                "INSERT INTO errors VALUES (?, ?, ?)",
+                [(report_id, _error_provider(e), e) for e in report.errors],
+            )
+        return report_id
+
+    def save_profiles(self, scan_id: int, results: dict) -> None:
+        """Guarda el resultado de ProfileChecker.check."""
+        now = _now()
+        rows = [
+            (scan_id, results["username"], r["platform"], r["url"], int(r["found"]), r["error"], now)
+            for key in ("found", "not_found", "errors")
+            for r in results[key]
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT INTO profile_hits VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def save_images(self, scan_id: int, results: dict) -> None:
+        """Guarda el resultado de ImageChecker.check."""
+        now = _now()
+        rows = [
+            (
+                scan_id, img["source"], img["type"], img.get("temp_url"),
+                json.dumps(img.get("search_urls", {})), img.get("error"), now,
+            )
+            for img in results["images"]
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT INTO image_results VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def save_fingerprints(self, identity: str, query_type: str, rows: dict[str, tuple[str, str]]) -> None:
+        """Guarda la huella del ultimo resultado por proveedor.
+
+        Args:
+            rows: proveedor -> (huella, items serializados en JSON).
+        """
+        now = _now()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?)",
+                [(identity, query_type, provider, fp, items, now) for provider, (fp, items) in rows.items()],
+            )
+
+    # --- Consultas ---
+
+    def fingerprints(self, identity: str, query_type: str) -> dict[str, tuple[str, str]]:
+        """Ultima huella por proveedor: proveedor -> (huella, items JSON)."""
+        rows = self._query(
+            "SELECT provider, fingerprint, items FROM fingerprints WHERE identity = ? AND query_type = ?",
+            (identity, query_type),
+        )
+        return {r["provider"]: (r["fingerprint"], r["items"]) for r in rows}
+
+    def _query(self, sql: str, params: tuple = ()) -> list[dict]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def scans(self, limit: int = 20) -> list[dict]:
+        """Ultimos escaneos con su numero de reportes."""
+        return self._query(
+            "SELECT s.id, s.mode, s.started_at, s.finished_at, COUNT(r.id) AS reports "
+            "FROM scans s LEFT JOIN reports r ON r.scan_id = s.id "
+            "GROUP BY s.id ORDER BY s.id DESC LIMIT ?",
+            (limit,),
+        )
+
+    def last_scan_id(self) -> int | None:
+        rows = self._query("SELECT MAX(scan_id) AS id FROM reports")
+        return rows[0]["id"] if rows else None
+
+    def accounts_in_breach(self, breach: str) -> list[dict]:
+        """Identidades que aparecen en una brecha (nombre o dominio)."""
+        return self._query(
+            "SELECT r.identity, r.query_type, b.breach_name, b.source_api, "
+            "MIN(r.created_at) AS first_seen, MAX(r.created_at) AS last_seen "
+            "FROM breaches b JOIN reports r ON r.id = b.report_id "
+            "WHERE b.canonical_id = ? "
+            "GROUP BY r.identity, r.query_type ORDER BY r.identity",
+            (CATALOG.resolve(breach),),
+        )
+
+    def new_exposures(self, scan_id: int | None = None) -> list[dict]:
+        """Brechas de un escaneo que no aparecian en escaneos anteriores.
+
+        Por defecto compara el ultimo escaneo con todos los previos.
+        """
+        if scan_id is None:
+            scan_id = self.last_scan_id()
+        if scan_id is None:
+            return []
+        return self._query(
+            "SELECT DISTINCT r.identity, r.query_type, b.canonical_id, b.breach_name, b.source_api, b.date "
+            "FROM breaches b JOIN reports r ON r.id = b.report_id "
+            "WHERE r.scan_id = ? AND b.canonical_id != '' AND NOT EXISTS ("
+            "  SELECT 1 FROM reports r2 JOIN breaches b2 ON b2.report_id = r2.id "
+            "  WHERE r2.identity = r.identity AND r2.scan_id < r.scan_id "
+            "  AND b2.canonical_id = b.canonical_id"
+            ") ORDER BY r.identity, b.breach_name",
+            (scan_id,),
+        )
+
+    def identity_history(self, identity: str) -> list[dict]:
+        """Reportes guardados para una identidad, del mas reciente al mas antiguo."""
+        return self._query(
+            "SELECT r.id, r.scan_id, r.query_type, r.risk, r.partial, r.created_at, "
+            "(SELECT COUNT(*) FROM breaches b WHERE b.report_id = r.id) AS breaches, "
+            "(SELECT COUNT(*) FROM infostealers i WHERE i.report_id = r.id) AS infostealers "
+            "FROM reports r WHERE r.identity = ? ORDER BY r.scan_id DESC",
+            (identity,),
+        )
+
+    def provider_errors(self, provider: str | None = None, limit: int = 100) -> list[dict]:
+        """Errores de proveedores (todos o de uno concreto)."""
+        sql = (
+            "SELECT r.identity, r.scan_id, e.provider, e.message FROM errors e "
+            "JOIN reports r ON r.id = e.report_id"
+        )
+        params: tuple = ()
+        if provider:
+            sql += " WHERE e.provider = ?"
+            params = (provider,)
+        return self._query(sql + " ORDER BY r.scan_id DESC LIMIT ?", params + (limit,))
@@ -0,0 +1,11 @@
+"""Configuracion comun de los tests: sin red y con estado en un directorio temporal."""
+
+import os
+import sys
+import tempfile
+
+# Antes de importar config: el registro de cuota y el rate limiter no tocan ~/.exposedcheck
+os.environ.setdefault("EXPOSEDCHECK_HOME", tempfile.mkdtemp(prefix="exposedcheck-tests-"))
+os.environ.setdefault("HTTP_TRANSPORT", "requests")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,46 @@
+import pytest
+
+from catalog import BreachCatalog, KNOWN_BREACHES, normalize_name
+
+
+@pytest.fixture
+def catalog():
+    return BreachCatalog(KNOWN_BREACHES)
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Adobe", "adobe"),
+    ("www.Adobe.com", "adobe"),
+    ("Adobe Systems", "adobe"),
+    ("Collection #1", "collection1"),
+    ("Words With Friends", "zynga"),
+    ("x.com", "twitter"),
+    ("Foo Bar.co.uk", "foobar"),
+    ("Desconocida", ""),
+    ("unknown", ""),
+])
+def test_resolve(catalog, name, expected):
+    assert catalog.resolve(name) == expected
+    assert catalog.resolve(name) == expected  # desde la cache
+
+
+def test_normalize_name():
+    assert normalize_name(" WWW.Example.com.mx ") == "example"
+
+
+def test_added_aliases_invalidate_the_cache(catalog):
+    assert catalog.resolve("Acme Corp") == "acmecorp"
+    catalog.add_aliases("acme", ["Acme Corp"])
+    assert catalog.resolve("Acme Corp") == "acme"
+
+
+def test_resolved_cache_is_bounded():
+    catalog = BreachCatalog(KNOWN_BREACHES, cache_size=3)
+    for name in ["Adobe", "Foo", "Bar", "Baz"]:
+        catalog.resolve(name)
+    assert list(catalog._resolved) == ["Foo", "Bar", "Baz"]
+
+    catalog.resolve("Foo")  # usada: pasa al final
+    catalog.resolve("Qux")
+    assert list(catalog._resolved) == ["Baz", "Foo", "Qux"]
+    assert catalog.resolve("Adobe") == "adobe"  # se recalcula al salir del LRU
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+import apis.decoding as decoding
+from apis.decoding import _StreamScanner, json_items
+
+PATHS = (("ExposedBreaches", "breaches_details"), ("result",), ())
+
+DOCUMENTS = [
+    '{"ExposedBreaches": {"other": 12345.678, "breaches_details": [1]}}',
+    '{"ExposedBreaches": {"breaches_details": [12345.678, -0.5e-10, 7E+3, 0, -12]}}',
+    '{"skip": [1, {"a": "}]\\"["}, 2.5], "result": [{"name": "caf\\u00e9", "n": 1.25e3}, true, null]}',
+    '{"result": ["contraseña", "日本語", {"deep": [[1, 2], {"x": -3.0}]}], "tail": 99.9}',
+    '[{"name": "Adobe", "records": 152445165}, {"name": "LinkedIn", "records": 164611595}, 31337]',
+    '  {"count": 123456789, "result": [ 1 , 22 , 333 ]}  ',
+]
+
+
+def _expected(document: str) -> list:
+    return decoding._select(json.loads(document), PATHS)
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_scanner_matches_json_loads_at_every_chunk_size(document):
+    data = document.encode("utf-8")
+    expected = _expected(document)
+    for size in range(1, len(data) + 1):
+        items = list(_StreamScanner(_chunks(data, size), PATHS).items())
+        assert items == expected, f"chunk de {size} bytes"
+
+
+class FakeResponse:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def iter_content(self, size):
+        return iter(_chunks(self.data, 7))
+
+
+@pytest.mark.parametrize("threshold", [0, 1_000_000])
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_json_items_streamed_and_buffered(monkeypatch, document, threshold):
+    monkeypatch.setattr(decoding, "JSON_STREAM_THRESHOLD", threshold)
+    assert list(json_items(FakeResponse(document.encode("utf-8")), PATHS)) == _expected(document)
+
+
+def test_truncated_document_fails():
+    data = b'{"result": [1, 2, 3'
+    with pytest.raises(ValueError):
+        list(_StreamScanner(_chunks(data, 4), PATHS).items())
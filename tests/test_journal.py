@@ -0,0 +1,27 @@
+import importlib
+
+import config
+
+
+def test_jobs_dir_defaults_to_state_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("EXPOSEDCHECK_HOME", str(tmp_path))
+    monkeypatch.delenv("JOBS_DIR", raising=False)
+    try:
+        assert importlib.reload(config).JOBS_DIR == str(tmp_path / "jobs")
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+
+
+def test_journal_creates_nested_dirs_and_resumes(tmp_path):
+    from storage.journal import CheckpointJournal
+
+    directory = str(tmp_path / "state" / "jobs")
+    journal = CheckpointJournal("auditoria-q3", directory)
+    journal.record("email", "a@example.com", "LeakCheck", {"breaches": [], "infostealers": []})
+    journal.close()
+
+    resumed = CheckpointJournal("auditoria-q3", directory)
+    assert resumed.replayed == 1
+    assert "LeakCheck" in resumed.completed("email", "a@example.com")
+    resumed.close()
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from apis.latency import LATENCY, timed_call
+
+
+class FakeResponse:
+    def __init__(self, name: str):
+        self.name = name
+        self.closed = threading.Event()
+
+    def close(self):
+        self.closed.set()
+
+
+def _warm(key: str, seconds: float = 0.05) -> None:
+    for _ in range(50):
+        LATENCY.record(key, seconds)
+
+
+@pytest.fixture
+def hedging():
+    previous = LATENCY.hedge
+    LATENCY.configure(hedge=True)
+    yield
+    LATENCY.configure(hedge=previous)
+
+
+def _attempts(*behaviours):
+    """fn() que en cada llamada sucesiva aplica el comportamiento indicado."""
+    calls = []
+    lock = threading.Lock()
+
+    def fn():
+        with lock:
+            index = len(calls)
+            calls.append(index)
+        return behaviours[index]()
+    return fn, calls
+
+
+def test_slow_primary_is_overtaken_by_hedge(hedging):
+    _warm("slow-primary")
+    slow, fast = FakeResponse("slow"), FakeResponse("fast")
+
+    def primary():
+        time.sleep(1.0)
+        return slow
+
+    fn, calls = _attempts(primary, lambda: fast)
+    start = time.monotonic()
+    result = timed_call("slow-primary", fn)
+    elapsed = time.monotonic() - start
+
+    assert result is fast
+    assert elapsed < 0.5
+    assert len(calls) == 2
+    # La respuesta perdedora se cierra al terminar
+    assert slow.closed.wait(2)
+    assert not fast.closed.is_set()
+
+
+def test_fast_primary_does_not_hedge(hedging):
+    _warm("fast-primary")
+    fast = FakeResponse("fast")
+    fn, calls = _attempts(lambda: fast, lambda: FakeResponse("unused"))
+
+    assert timed_call("fast-primary", fn) is fast
+    time.sleep(0.1)
+    assert calls == [0]
+
+
+def test_failed_primary_uses_hedge(hedging):
+    _warm("failing-primary")
+    fast = FakeResponse("fast")
+
+    def primary():
+        time.sleep(0.2)
+        raise requests.exceptions.ReadTimeout("lento")
+
+    fn, _ = _attempts(primary, lambda: fast)
+    assert timed_call("failing-primary", fn) is fast
+
+
+def test_both_failures_raise_primary_error(hedging):
+    _warm("both-fail")
+
+    def primary():
+        time.sleep(0.2)
+        raise requests.exceptions.ReadTimeout("primero")
+
+    def second():
+        raise requests.exceptions.ConnectionError("segundo")
+
+    fn, _ = _attempts(primary, second)
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        timed_call("both-fail", fn)
+
+
+def test_attempts_carry_caller_context(hedging):
+    from engine.deadline import Deadline, current_deadline, deadline_scope
+
+    _warm("context")
+    seen = []
+
+    def fn():
+        seen.append(current_deadline())
+        return FakeResponse("ok")
+
+    with deadline_scope(Deadline(5)):
+        timed_call("context", fn)
+    assert seen and seen[0] is not None
+
+
+def test_without_hedging_runs_inline():
+    fn, calls = _attempts(lambda: threading.current_thread())
+    assert timed_call("inline", fn, hedge=False) is threading.current_thread()
+    assert calls == [0]
@@ -0,0 +1,45 @@
+import time
+
+from checkers.batch_checker import Identity
+from checkers.monitor import WatchlistMonitor
+from models import CheckReport
+from storage import ResultStore
+
+NEXT_MONTH = time.time() + 30 * 86400
+
+
+class FakeBudget:
+    """Sin cuota de BreachDirectory hasta el mes que viene."""
+
+    def blocked(self, providers, remaining=None):
+        return []
+
+    def next_available(self, providers):
+        return NEXT_MONTH if "BreachDirectory" in providers else time.time()
+
+
+class FakeChecker:
+    def check(self, items, on_report=None):
+        reports = []
+        for item in items:
+            report = CheckReport(query=item.value, query_type=item.query_type)
+            if item.query_type == "phone":  # pospuesto por el lote
+                report.mark_missing(["BreachDirectory"])
+            reports.append(report)
+        return reports
+
+
+def test_deferred_items_wait_for_quota_and_interval(tmp_path):
+    items = [Identity("phone", "+34612345678"), Identity("email", "a@example.com")]
+    monitor = WatchlistMonitor(
+        items, ResultStore(str(tmp_path / "results.db")), interval_hours=1, jitter=0, budget=FakeBudget()
+    )
+    monitor.checker = FakeChecker()
+
+    monitor.run_cycle()
+
+    due = {idx: at for at, idx in monitor._queue}
+    assert due[0] == NEXT_MONTH
+    assert abs(due[1] - (time.time() + 3600)) < 5
+    assert monitor.deferred == 1
+    assert monitor.checks == 2
@@ -0,0 +1,16 @@
+import pytest
+
+from checkers.normalize import lookup_value, normalize_identity
+
+
+@pytest.mark.parametrize("query_type, value, expected", [
+    ("email", " John.Doe+rrhh@GoogleMail.com ", "johndoe@gmail.com"),
+    ("username", " MiUsuario ", "MiUsuario"),
+])
+def test_normalize_identity(query_type, value, expected):
+    assert normalize_identity(query_type, value) == expected
+
+
+def test_lookup_value_lowercases_only_emails():
+    assert lookup_value("email", " Ana@Example.com ") == "ana@example.com"
+    assert lookup_value("username", " MiUsuario ") == "MiUsuario"
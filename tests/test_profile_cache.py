@@ -0,0 +1,32 @@
+import importlib
+
+import config
+from storage.profile_cache import ProfileCache
+
+TTLS = {"found": 3600, "not_found": 3600, "error": 0}
+
+
+def test_profile_cache_defaults_to_state_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("EXPOSEDCHECK_HOME", str(tmp_path))
+    monkeypatch.delenv("PROFILE_CACHE_DB", raising=False)
+    try:
+        assert importlib.reload(config).PROFILE_CACHE_DB == str(tmp_path / "profiles.db")
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+
+
+def test_cache_creates_its_directory_and_persists(tmp_path):
+    path = str(tmp_path / "state" / "profiles.db")
+    cache = ProfileCache(path, TTLS)
+    cache.put_many("mi_usuario", [
+        {"platform": "GitHub", "url": "https://github.com/mi_usuario", "found": True, "error": None},
+        {"platform": "Reddit", "url": "https://reddit.com/u/mi_usuario", "found": False, "error": "timeout"},
+    ])
+    cache.close()
+
+    reopened = ProfileCache(path, TTLS)
+    cached = reopened.get_many("mi_usuario")
+    reopened.close()
+    assert list(cached) == ["GitHub"]  # los errores (TTL 0) no se guardan
+    assert cached["GitHub"]["found"] and cached["GitHub"]["cached"]
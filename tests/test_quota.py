@@ -0,0 +1,121 @@
+import sqlite3
+
+import pytest
+import requests
+
+import checkers.base_phone as base_phone
+import storage.quota as quota
+from engine.deadline import DeadlineExceeded
+from storage.quota import QuotaLedger, _next_period_start
+
+LIMITS = {"Metered": (3, "month"), "Daily": (1, "day")}
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = QuotaLedger(str(tmp_path / "state" / "quota.db"), LIMITS)
+    yield ledger
+    ledger.close()
+
+
+def test_reserve_stops_at_the_limit(ledger):
+    assert [ledger.reserve("Metered") for _ in range(4)] == [True, True, True, False]
+    assert ledger.remaining("Metered") == 0
+
+
+def test_unlimited_providers_are_not_counted(ledger):
+    assert ledger.remaining("Free") is None
+    assert all(ledger.reserve("Free") for _ in range(10))
+
+
+def test_quota_is_shared_between_instances(ledger, tmp_path):
+    ledger.reserve("Metered")
+    other = QuotaLedger(ledger.path, LIMITS)
+    try:
+        assert other.remaining("Metered") == 2
+        other.reserve("Metered")
+        assert ledger.remaining("Metered") == 1
+    finally:
+        other.close()
+
+
+def test_exhaust_and_next_available(ledger, monkeypatch):
+    now = 1_700_000_000.0
+    monkeypatch.setattr(quota.time, "time", lambda: now)
+    ledger.exhaust("Metered")
+    assert ledger.remaining("Metered") == 0
+    assert ledger.remaining("Daily") == 1
+    assert ledger.next_available(["Daily"]) == now
+    assert ledger.next_available(["Metered", "Daily"]) == _next_period_start("month", now)
+    # Al cambiar de periodo vuelve a haber cuota
+    monkeypatch.setattr(quota.time, "time", lambda: _next_period_start("month", now))
+    assert ledger.remaining("Metered") == 3
+
+
+def test_identities_are_stored_as_hmac(ledger):
+    ledger.reserve("Metered", "+34612345678")
+    assert ledger.last_checked("Metered", "+34612345678") is not None
+    assert ledger.last_checked("Metered", "+34600000000") is None
+    with sqlite3.connect(ledger.path) as conn:
+        dump = "\n".join(conn.iterdump())
+    assert "34612345678" not in dump
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.mark.parametrize("headers, exhausted", [
+    ({"X-RateLimit-Requests-Remaining": "0"}, True),
+    ({"X-RateLimit-Requests-Remaining": "7"}, False),
+    ({}, False),
+])
+def test_breachdirectory_429_exhausts_only_without_plan_quota(tmp_path, monkeypatch, headers, exhausted):
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), {"BreachDirectory": (10, "month")})
+    monkeypatch.setattr(quota, "_ledger", ledger)
+    monkeypatch.setattr(base_phone, "http_get", lambda *args, **kwargs: FakeResponse(429, headers))
+
+    result = base_phone.BreachDirectoryAPI().check("+34612345678")
+
+    assert result["error"]
+    assert (ledger.remaining("BreachDirectory") == 0) is exhausted
+    ledger.close()
+
+
+def test_refund_returns_a_reserved_call(ledger):
+    ledger.reserve("Metered")
+    ledger.reserve("Metered")
+    ledger.refund("Metered")
+    assert ledger.remaining("Metered") == 2
+    ledger.refund("Metered")
+    ledger.refund("Metered")
+    assert ledger.remaining("Metered") == 3
+
+
+def _refused():
+    from urllib3.exceptions import MaxRetryError, NewConnectionError
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/", reason))
+
+
+@pytest.mark.parametrize("error, refunded", [
+    (DeadlineExceeded("deadline agotado esperando turno"), True),
+    (_refused(), True),
+    (requests.exceptions.ReadTimeout("read"), False),
+])
+def test_breachdirectory_refunds_calls_that_were_not_sent(tmp_path, monkeypatch, error, refunded):
+    ledger = QuotaLedger(str(tmp_path / "quota.db"), {"BreachDirectory": (10, "month")})
+    monkeypatch.setattr(quota, "_ledger", ledger)
+
+    def http_get(*args, **kwargs):
+        raise error
+    monkeypatch.setattr(base_phone, "http_get", http_get)
+
+    try:
+        base_phone.BreachDirectoryAPI().check("+34612345678")
+    except DeadlineExceeded:
+        pass
+    assert ledger.remaining("BreachDirectory") == (10 if refunded else 9)
+    ledger.close()
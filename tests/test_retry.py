@@ -0,0 +1,138 @@
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from apis.retry import CONNECT, SERVER, RetryBudget, RetryPolicy, track_attempts, unsent
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, headers: dict | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _refused() -> requests.exceptions.ConnectionError:
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/", reason))
+
+
+def _dropped() -> requests.exceptions.ConnectionError:
+    return requests.exceptions.ConnectionError(ProtocolError("Connection aborted."))
+
+
+def _sender(*outcomes):
+    """send() que produce cada resultado en orden (las excepciones se lanzan)."""
+    calls = []
+
+    def send():
+        outcome = outcomes[len(calls)]
+        calls.append(outcome)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    return send, calls
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("budget", RetryBudget(ratio=1, burst=10))
+    return RetryPolicy(base_delay=0, max_delay=1, **kwargs)
+
+
+def test_unsent_errors():
+    assert unsent(requests.exceptions.ConnectTimeout("connect"))
+    assert unsent(_refused())
+    assert not unsent(_dropped())
+    assert not unsent(requests.exceptions.ReadTimeout("read"))
+    assert not unsent(requests.exceptions.ChunkedEncodingError("chunked"))
+
+
+@pytest.mark.parametrize("error", [requests.exceptions.ConnectTimeout("connect"), _refused()])
+def test_metered_retries_failures_before_sending(error):
+    ok = FakeResponse()
+    send, calls = _sender(error, ok)
+    assert _policy().call("Metered", send, metered=True) is ok
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("outcome", [
+    _dropped(), requests.exceptions.ReadTimeout("read"), FakeResponse(503),
+])
+def test_metered_does_not_retry_after_sending(outcome):
+    send, calls = _sender(outcome, FakeResponse())
+    policy = _policy()
+    if isinstance(outcome, Exception):
+        with pytest.raises(type(outcome)):
+            policy.call("Metered", send, metered=True)
+    else:
+        assert policy.call("Metered", send, metered=True) is outcome
+    assert len(calls) == 1
+
+
+def test_unmetered_retries_transient_failures_and_closes_responses():
+    failed, ok = FakeResponse(503), FakeResponse()
+    send, calls = _sender(_dropped(), failed, ok)
+    policy = _policy()
+    assert policy.call("Free", send) is ok
+    assert len(calls) == 3
+    assert failed.closed
+    assert policy.stats() == {"Free": {CONNECT: 1, SERVER: 1}}
+
+
+def test_gives_up_after_max_attempts():
+    responses = [FakeResponse(500) for _ in range(3)]
+    send, calls = _sender(*responses)
+    assert _policy(max_attempts=3).call("Free", send) is responses[-1]
+    assert len(calls) == 3
+
+
+def test_429_needs_short_retry_after():
+    send, calls = _sender(FakeResponse(429), FakeResponse())
+    assert _policy().call("Free", send).status_code == 429
+    assert len(calls) == 1
+
+    send, calls = _sender(FakeResponse(429, {"Retry-After": "0"}), FakeResponse())
+    assert _policy().call("Free", send).status_code == 200
+    assert len(calls) == 2
+
+
+def test_budget_caps_retries():
+    policy = _policy(budget=RetryBudget(ratio=0, burst=1))
+    send, calls = _sender(FakeResponse(500), FakeResponse(500), FakeResponse())
+    assert policy.call("Free", send).status_code == 500
+    assert len(calls) == 2  # un solo reintento disponible
+
+
+def test_track_attempts_counts_requests_of_dict_results():
+    policy = _policy(max_attempts=2)
+    send, _ = _sender(FakeResponse(500), FakeResponse(500))
+
+    @track_attempts
+    def check():
+        resp = policy.call("Free", send)
+        return {"error": f"HTTP {resp.status_code}"}
+
+    result = check()
+    assert result["attempts"] == 2
+    assert result["error"] == "HTTP 500 (2 intentos)"
+
+
+def test_password_results_record_attempts(monkeypatch):
+    import apis.base as base
+    from apis import HIBPPasswordsAPI
+
+    body = FakeResponse()
+    body.text = "0000000000000000000000000000000000A:3\n"
+    send, calls = _sender(FakeResponse(503), body)
+    monkeypatch.setattr(base.TRANSPORT, "get", lambda *args, **kwargs: send())
+    monkeypatch.setattr(base.RETRY, "base_delay", 0)
+    monkeypatch.setattr(base.RETRY, "budget", RetryBudget(ratio=1, burst=10))
+
+    result = HIBPPasswordsAPI().check_password("password")
+
+    assert len(calls) == 2
+    assert result.attempts == 2
+    assert not result.partial
@@ -0,0 +1,57 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from engine import DeadlineExceeded
+from server import make_server
+
+
+class FakeService:
+    def check(self, kind, query, deadline, fast=False):
+        if query == "lento":
+            raise DeadlineExceeded("deadline de 2s agotado")
+        if query == "roto":
+            raise RuntimeError(f"fallo con {query}")
+        return {"query": query, "kind": kind}
+
+
+@pytest.fixture
+def base_url():
+    server = make_server("127.0.0.1", 0, token="")
+    server.RequestHandlerClass.service = FakeService()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _request(url: str, data: bytes | None = None) -> tuple[int, dict]:
+    try:
+        with urllib.request.urlopen(url, data=data, timeout=5) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_check_ok(base_url):
+    assert _request(f"{base_url}/check/email?q=a@example.com") == (200, {"query": "a@example.com", "kind": "email"})
+
+
+def test_deadline_returns_504(base_url):
+    status, payload = _request(f"{base_url}/check/email?q=lento")
+    assert status == 504
+    assert "deadline" in payload["error"]
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/check/username?q=roto", None),
+    ("/check/password", json.dumps({"password": "roto"}).encode()),
+])
+def test_unexpected_errors_return_json_500(base_url, path, body):
+    status, payload = _request(base_url + path, body)
+    assert status == 500
+    assert "roto" not in payload["error"]
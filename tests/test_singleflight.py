@@ -0,0 +1,130 @@
+import threading
+import time
+
+import pytest
+
+from engine.deadline import DeadlineExceeded
+from engine.singleflight import SingleFlight, coalesced, normalize_key
+
+
+def _run_concurrently(flight: SingleFlight, key, fn, count: int) -> list:
+    results = [None] * count
+    threads = []
+
+    def worker(index: int):
+        try:
+            results[index] = flight.do(key, fn)
+        except Exception as e:
+            results[index] = e
+
+    for index in range(count):
+        threads.append(threading.Thread(target=worker, args=(index,)))
+        threads[-1].start()
+        time.sleep(0.01)  # el primero es el lider
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"breaches": []}
+
+    results = _run_concurrently(flight, "k", fn, 5)
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.shared == 4
+
+
+def test_errors_are_shared():
+    flight = SingleFlight()
+
+    def fn():
+        time.sleep(0.2)
+        raise ValueError("HTTP 500")
+
+    results = _run_concurrently(flight, "k", fn, 3)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_leader_deadline_is_not_shared():
+    flight = SingleFlight()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.2)
+        if len(calls) == 1:
+            raise DeadlineExceeded("deadline del lider agotado")
+        return "ok"
+
+    results = _run_concurrently(flight, "k", fn, 3)
+    assert isinstance(results[0], DeadlineExceeded)
+    assert results[1:] == ["ok", "ok"]
+    assert len(calls) == 2  # un seguidor repite como lider, el otro comparte
+
+
+def test_sequential_calls_are_not_cached():
+    flight = SingleFlight()
+    counter = iter(range(10))
+    assert flight.do("k", lambda: next(counter)) == 0
+    assert flight.do("k", lambda: next(counter)) == 1
+
+
+@pytest.mark.parametrize("query, kind, expected", [
+    (" Ana@Example.COM ", "email", "ana@example.com"),
+    ("Example.COM", "domain", "example.com"),
+    (" MiUsuario ", "username", "MiUsuario"),
+    ("+34612345678", None, "+34612345678"),
+])
+def test_normalize_key(query, kind, expected):
+    assert normalize_key(query, kind) == expected
+
+
+class FakeProvider:
+    name = "Fake"
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    @coalesced
+    def check(self, query: str, query_type: str = "email") -> dict:
+        self.calls.append((query, query_type))
+        self.release.wait(5)
+        return {"query": query}
+
+
+def _in_flight_calls(provider: FakeProvider, *calls) -> list:
+    threads = [threading.Thread(target=provider.check, args=args, kwargs=kwargs) for args, kwargs in calls]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    provider.release.set()
+    for thread in threads:
+        thread.join(5)
+    return provider.calls
+
+
+def test_email_variants_are_coalesced():
+    calls = _in_flight_calls(
+        FakeProvider(),
+        (("ana@example.com",), {}),
+        (("ANA@example.com ",), {"query_type": "email"}),
+        (("ana@Example.com", "email"), {}),
+    )
+    assert len(calls) == 1
+
+
+def test_usernames_keep_their_case():
+    calls = _in_flight_calls(
+        FakeProvider(),
+        (("MiUsuario",), {"query_type": "username"}),
+        (("miusuario",), {"query_type": "username"}),
+    )
+    assert len(calls) == 2